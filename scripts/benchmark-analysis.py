@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark the GitCo analysis pipeline offline.
+
+Creates synthetic Git repositories and analyzes them with the deterministic
+"local" LLM provider, so the numbers reflect GitCo's own overhead (reading
+and condensing diffs, detection, prompt building, parsing and caching) plus
+a configurable artificial LLM latency, without any network access.
+
+Usage:
+    python scripts/benchmark-analysis.py --repos 8 --commits 40 --latency 0.5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gitco.libs.analyzer import ChangeAnalyzer
+from gitco.libs.config import Config, Repository
+from gitco.libs.git_ops import GitRepository
+
+# Lines mixed into synthetic changes so the detectors have work to do
+SIGNAL_LINES = [
+    "    # BREAKING CHANGE: removed the legacy keyword argument",
+    "    warnings.warn('load() is deprecated, use read()', DeprecationWarning)",
+    "    # Fix XSS vulnerability by escaping user input",
+    "    raise ValueError('unsupported option')",
+]
+
+
+def _git(path: Path, *args: str) -> None:
+    """Run a Git command quietly in a repository."""
+    subprocess.run(
+        ["git", *args],
+        cwd=path,
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "bench",
+            "GIT_AUTHOR_EMAIL": "bench@example.com",
+            "GIT_COMMITTER_NAME": "bench",
+            "GIT_COMMITTER_EMAIL": "bench@example.com",
+        },
+    )
+
+
+def _function_source(rng: random.Random, name: str) -> str:
+    """Generate the source of a small synthetic function."""
+    body = [f"    value = {rng.randint(0, 1000)}"]
+    for _ in range(rng.randint(3, 12)):
+        if rng.random() < 0.1:
+            body.append(rng.choice(SIGNAL_LINES))
+        else:
+            body.append(
+                f"    value = value * {rng.randint(2, 9)} + {rng.randint(0, 99)}"
+            )
+    body.append("    return value")
+    return f"def {name}(data):\n" + "\n".join(body) + "\n"
+
+
+def create_repository(path: Path, commits: int, files: int, seed: int) -> None:
+    """Create a synthetic repository whose commits are ahead of origin/main.
+
+    Args:
+        path: Directory to create the repository in.
+        commits: Number of commits after the base commit.
+        files: Number of source files touched by the commits.
+        seed: Random seed for reproducible content.
+    """
+    rng = random.Random(seed)
+    path.mkdir(parents=True)
+    _git(path, "init", "-q", "-b", "main")
+
+    sources = {f"pkg/module_{i}.py": [] for i in range(files)}
+    for file_name, functions in sources.items():
+        functions.extend(_function_source(rng, f"func_{j}") for j in range(5))
+        (path / file_name).parent.mkdir(parents=True, exist_ok=True)
+        (path / file_name).write_text("\n\n".join(functions))
+    _git(path, "add", "-A")
+    _git(path, "commit", "-q", "-m", "Initial commit")
+
+    # Pretend the base commit is upstream so the range below is analyzed
+    _git(path, "update-ref", "refs/remotes/origin/main", "HEAD")
+    _git(path, "symbolic-ref", "refs/remotes/origin/HEAD", "refs/remotes/origin/main")
+
+    prefixes = ["feat", "fix", "refactor", "docs", "chore"]
+    for number in range(commits):
+        file_name = rng.choice(list(sources))
+        functions = sources[file_name]
+        index = rng.randrange(len(functions))
+        functions[index] = _function_source(rng, f"func_{index}")
+        if rng.random() < 0.3:
+            functions.append(_function_source(rng, f"func_{len(functions)}"))
+        (path / file_name).write_text("\n\n".join(functions))
+        _git(path, "commit", "-q", "-am", f"{rng.choice(prefixes)}: change {number}")
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _report(label: str, latencies: list[float], elapsed: float) -> None:
+    """Print latency and throughput for one benchmark pass."""
+    print(
+        f"{label:<22} total {elapsed:7.3f}s  "
+        f"throughput {len(latencies) / elapsed:7.2f} repos/s  "
+        f"p50 {statistics.median(latencies) * 1000:8.1f} ms  "
+        f"p95 {_percentile(latencies, 0.95) * 1000:8.1f} ms"
+    )
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """Create the repositories and run the benchmark passes."""
+    with tempfile.TemporaryDirectory(prefix="gitco-bench-") as temp_dir:
+        root = Path(temp_dir)
+        targets = []
+        start = time.perf_counter()
+        for index in range(args.repos):
+            path = root / f"repo_{index}"
+            create_repository(path, args.commits, args.files, args.seed + index)
+            repository = Repository(
+                name=f"repo_{index}",
+                fork=f"bench/repo_{index}",
+                upstream=f"upstream/repo_{index}",
+                local_path=str(path),
+            )
+            targets.append((repository, GitRepository(str(path))))
+        print(
+            f"Created {args.repos} repositories with {args.commits} commits "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+        config = Config()
+        config.settings.llm_provider = "local"
+        config.settings.llm_local_latency = args.latency
+        config.settings.llm_cache_enabled = True
+
+        analyzer = ChangeAnalyzer(config)
+        analyzer.analysis_cache = None
+        _run_sequential(analyzer, targets, "sequential, no cache")
+        _run_concurrent(analyzer, targets, args.workers, "concurrent, no cache")
+
+        analyzer = ChangeAnalyzer(config)
+        if analyzer.analysis_cache is not None:
+            analyzer.analysis_cache.cache_dir = root / "cache"
+        _run_sequential(analyzer, targets, "sequential, cold cache")
+        _run_sequential(analyzer, targets, "sequential, warm cache")
+
+
+def _run_sequential(analyzer: ChangeAnalyzer, targets: list, label: str) -> None:
+    """Analyze repositories one at a time."""
+    latencies = []
+    start = time.perf_counter()
+    for repository, git_repo in targets:
+        request_start = time.perf_counter()
+        if analyzer.analyze_repository_changes(repository, git_repo) is None:
+            sys.exit(f"Analysis of {repository.name} failed")
+        latencies.append(time.perf_counter() - request_start)
+    _report(label, latencies, time.perf_counter() - start)
+
+
+def _run_concurrent(
+    analyzer: ChangeAnalyzer, targets: list, workers: int, label: str
+) -> None:
+    """Analyze repositories concurrently, timing from start to each result."""
+    latencies = []
+    start = time.perf_counter()
+    for repository, analysis in analyzer.analyze_repositories(
+        targets, max_workers=workers
+    ):
+        if analysis is None:
+            sys.exit(f"Analysis of {repository.name} failed")
+        latencies.append(time.perf_counter() - start)
+    _report(label, latencies, time.perf_counter() - start)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=8, help="Repositories")
+    parser.add_argument("--commits", type=int, default=40, help="Commits per repo")
+    parser.add_argument("--files", type=int, default=10, help="Files per repo")
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="Artificial LLM latency (s)"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent analyses")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    run_benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
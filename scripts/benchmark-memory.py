@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Benchmark the memory footprint of GitCo's high-volume records.
+
+Builds many records of each type from JSON payloads, as a sync or discovery
+run does, and measures the memory the records retain with tracemalloc: once
+with GitCo's slotted records, which intern repeated strings and keep
+collections in tuples, and once with equivalent plain dataclasses holding
+the parsed lists, as the records were before. Issue bodies are left out so
+the numbers reflect the record structure.
+
+Usage:
+    python scripts/benchmark-memory.py --count 50000
+"""
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field, fields, make_dataclass
+from typing import Any, Callable
+
+from gitco.libs.config import Repository
+from gitco.libs.contribution_tracker import Contribution
+from gitco.libs.detector import BreakingChange, SecurityUpdate
+from gitco.libs.discovery import IssueRecommendation, SkillMatch
+from gitco.libs.git_ops import BatchResult
+from gitco.libs.github_client import GitHubIssue
+
+LABELS = [
+    "bug",
+    "enhancement",
+    "documentation",
+    "good first issue",
+    "help wanted",
+    "question",
+    "performance",
+    "security",
+    "dependencies",
+    "tests",
+    "ci",
+    "refactor",
+]
+SKILLS = ["python", "javascript", "go", "rust", "api", "devops", "docs", "testing"]
+LOGINS = [f"user{i}" for i in range(200)]
+REPOSITORIES = [f"org{i % 20}/repo{i}" for i in range(100)]
+
+
+@dataclass
+class RecordCase:
+    """A record type with a generator of JSON payloads for it."""
+
+    record_type: type
+    payload: Callable[[random.Random, int], dict[str, Any]]
+    # Extra constructor arguments that are shared objects, not JSON
+    shared: dict[str, Any] = field(default_factory=dict)
+
+
+def _timestamp(rng: random.Random) -> str:
+    """Generate a GitHub-style timestamp from the last two years."""
+    seconds = time.time() - rng.random() * 730 * 86400
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(seconds))
+
+
+def _issue(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate a GitHub issue payload."""
+    repository = rng.choice(REPOSITORIES)
+    return {
+        "number": number,
+        "title": f"Issue {number} in {repository}",
+        "state": rng.choice(["open", "closed"]),
+        "labels": rng.sample(LABELS, rng.randrange(5)),
+        "assignees": rng.sample(LOGINS, rng.randrange(3)),
+        "created_at": _timestamp(rng),
+        "updated_at": _timestamp(rng),
+        "html_url": f"https://github.com/{repository}/issues/{number}",
+        "user": rng.choice(LOGINS),
+        "comments_count": rng.randrange(20),
+        "reactions_count": rng.randrange(10),
+    }
+
+
+def _contribution(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate a contribution payload."""
+    repository = rng.choice(REPOSITORIES)
+    return {
+        "repository": repository,
+        "issue_number": number,
+        "issue_title": f"Issue {number} in {repository}",
+        "issue_url": f"https://github.com/{repository}/issues/{number}",
+        "contribution_type": rng.choice(["issue", "pr"]),
+        "status": rng.choice(["open", "closed", "merged"]),
+        "created_at": _timestamp(rng),
+        "updated_at": _timestamp(rng),
+        "skills_used": rng.sample(SKILLS, rng.randrange(4)),
+        "impact_score": round(rng.random(), 3),
+        "labels": rng.sample(LABELS, rng.randrange(5)),
+        "assignees": rng.sample(LOGINS, rng.randrange(3)),
+        "comments_count": rng.randrange(20),
+        "reactions_count": rng.randrange(10),
+    }
+
+
+def _skill_match(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate a skill match payload."""
+    return {
+        "skill": rng.choice(SKILLS),
+        "confidence": round(rng.random(), 3),
+        "match_type": rng.choice(["exact", "partial", "related", "language"]),
+        "evidence": [f"...context {number}.{i}..." for i in range(rng.randrange(4))],
+    }
+
+
+def _recommendation(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate the JSON part of an issue recommendation payload."""
+    return {
+        "overall_score": round(rng.random(), 3),
+        "difficulty_level": rng.choice(["beginner", "intermediate", "advanced"]),
+        "estimated_time": rng.choice(["quick", "medium", "long"]),
+        "tags": rng.sample(SKILLS + ["beginner-friendly", "help-wanted"], 4),
+    }
+
+
+def _security_update(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate a security update payload."""
+    return {
+        "type": rng.choice(["vulnerability_fix", "authentication", "encryption"]),
+        "description": f"Security code change detected: change {number}",
+        "severity": rng.choice(["critical", "high", "medium", "low"]),
+        "affected_components": [f"module_{rng.randrange(50)}.py"],
+    }
+
+
+def _breaking_change(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate a breaking change payload."""
+    return {
+        "type": rng.choice(["api_signature_change", "configuration_change"]),
+        "description": f"API signature changes detected in module_{number}.py",
+        "severity": rng.choice(["high", "medium", "low"]),
+        "affected_components": [f"module_{number}.py", "unknown"],
+        "migration_guidance": "Review API usage and update method calls",
+    }
+
+
+def _batch_result(rng: random.Random, number: int) -> dict[str, Any]:
+    """Generate a batch result payload."""
+    repository = rng.choice(REPOSITORIES)
+    return {
+        "repository_name": repository,
+        "repository_path": f"/home/user/code/{repository}",
+        "success": rng.random() < 0.9,
+        "operation": "sync",
+        "message": f"Synced {repository}",
+        "details": {},
+        "duration": rng.random() * 5,
+    }
+
+
+def _plain_variant(record_type: type) -> type:
+    """Create a plain dataclass with the same fields, as records were before."""
+    return make_dataclass(
+        f"Plain{record_type.__name__}",
+        [
+            (
+                f.name,
+                Any,
+                field(default=f.default, default_factory=f.default_factory),
+            )
+            for f in fields(record_type)
+        ],
+    )
+
+
+def _measure(
+    record_type: type, payloads: list[str], shared: dict[str, Any]
+) -> tuple[float, float]:
+    """Build records from payloads and measure what they retain.
+
+    Returns:
+        Retained bytes per record and microseconds per record.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [record_type(**json.loads(payload), **shared) for payload in payloads]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del records
+
+    start = time.perf_counter()
+    records = [record_type(**json.loads(payload), **shared) for payload in payloads]
+    elapsed = time.perf_counter() - start
+    return retained / len(records), elapsed / len(records) * 1e6
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """Measure every record type in both variants."""
+    rng = random.Random(args.seed)
+    issue = GitHubIssue(**_issue(rng, 0))
+    repository = Repository(
+        name="repo0", fork="user/repo0", upstream="org0/repo0", local_path="."
+    )
+    cases = [
+        RecordCase(GitHubIssue, _issue),
+        RecordCase(Contribution, _contribution),
+        RecordCase(SkillMatch, _skill_match),
+        RecordCase(
+            IssueRecommendation,
+            _recommendation,
+            {"issue": issue, "repository": repository, "skill_matches": []},
+        ),
+        RecordCase(SecurityUpdate, _security_update),
+        RecordCase(BreakingChange, _breaking_change),
+        RecordCase(BatchResult, _batch_result),
+    ]
+
+    print(f"{args.count} records per type, bytes and microseconds per record")
+    for case in cases:
+        payloads = [json.dumps(case.payload(rng, i)) for i in range(args.count)]
+        plain_bytes, plain_time = _measure(
+            _plain_variant(case.record_type), payloads, case.shared
+        )
+        slotted_bytes, slotted_time = _measure(case.record_type, payloads, case.shared)
+        print(
+            f"{case.record_type.__name__:<20} "
+            f"before {plain_bytes:7.0f} B {plain_time:6.2f} us  "
+            f"after {slotted_bytes:7.0f} B {slotted_time:6.2f} us  "
+            f"saved {1 - slotted_bytes / plain_bytes:6.1%}"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50000, help="Records per type")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    run_benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Benchmark contribution statistics on a large synthetic history.
+
+Fills a temporary contribution database with synthetic contributions and
+times ``gitco contributions stats`` computed per contribution (loading full
+records), with the columnar engine (loading only the fields statistics
+need) and from the daily rollups, for the whole history and for a
+``--days`` window.
+
+Usage:
+    python scripts/benchmark-stats.py --contributions 100000 --repeat 3
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gitco.libs.config import Config
+from gitco.libs.contribution_stats import np
+from gitco.libs.contribution_store import ContributionStore
+from gitco.libs.contribution_tracker import Contribution, ContributionTracker
+
+SKILLS = ["python", "javascript", "go", "rust", "api", "devops", "docs", "testing"]
+STATUSES = ["open", "closed", "merged", "draft"]
+
+
+def create_contributions(count: int, repos: int, seed: int) -> list[Contribution]:
+    """Generate synthetic contributions spread over the last two years.
+
+    Args:
+        count: Number of contributions.
+        repos: Number of distinct repositories.
+        seed: Random seed for reproducible data.
+
+    Returns:
+        Synthetic contributions.
+    """
+    rng = random.Random(seed)
+    now = time.time()
+    contributions = []
+    for number in range(count):
+        updated = now - rng.random() * 730 * 86400
+        created = updated - rng.random() * 30 * 86400
+        repo = rng.randrange(repos)
+        contributions.append(
+            Contribution(
+                repository=f"org{repo % 50}/repo{repo}",
+                issue_number=number,
+                issue_title=f"Synthetic contribution {number}",
+                issue_url=f"https://github.com/org/repo/issues/{number}",
+                contribution_type=rng.choice(["issue", "pr"]),
+                status=rng.choice(STATUSES),
+                created_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(created)),
+                updated_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(updated)),
+                skills_used=rng.sample(SKILLS, rng.randrange(4)),
+                impact_score=round(rng.random(), 3),
+                labels=["bug"] if rng.random() < 0.3 else [],
+                assignees=["someone"] if rng.random() < 0.2 else [],
+                comments_count=rng.randrange(20),
+                reactions_count=rng.randrange(10),
+            )
+        )
+    return contributions
+
+
+def _time(function, repeat: int) -> float:
+    """Get the best wall time of several runs of a function."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """Create the history and time both statistics paths."""
+    if np is None:
+        sys.exit("The columnar statistics engine needs NumPy: pip install gitco[perf]")
+
+    with tempfile.TemporaryDirectory(prefix="gitco-bench-") as temp_dir:
+        root = Path(temp_dir)
+        tracker = ContributionTracker(Config(), None)
+        tracker.store = ContributionStore(
+            database_path=str(root / "contributions.db"),
+            legacy_history_path=str(root / "contribution_history.json"),
+        )
+
+        start = time.perf_counter()
+        contributions = create_contributions(args.contributions, args.repos, args.seed)
+        tracker.add_contributions(contributions)
+        print(
+            f"Stored {args.contributions} contributions "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+
+        for days in (None, args.days):
+            label = "all time" if days is None else f"last {days} days"
+            per_contribution = _time(
+                lambda days=days: tracker._calculate_stats(
+                    tracker.load_contribution_history(days=days)
+                ),
+                args.repeat,
+            )
+            columnar = _time(
+                lambda days=days: tracker._calculate_columnar_stats(days),
+                args.repeat,
+            )
+            rollup = _time(
+                lambda days=days: tracker._calculate_rollup_stats(days), args.repeat
+            )
+            print(
+                f"{label:<16} per contribution {per_contribution:7.3f}s  "
+                f"columnar {columnar:7.3f}s  rollup {rollup:7.3f}s"
+            )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--contributions", type=int, default=100000, help="Contributions"
+    )
+    parser.add_argument("--repos", type=int, default=2000, help="Repositories")
+    parser.add_argument("--days", type=int, default=30, help="Window for --days")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    run_benchmark(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
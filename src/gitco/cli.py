@@ -12,6 +12,7 @@ from . import __version__
 from .utils.common import (
     console,
     get_logger,
+    redirect_output_to_stderr,
     set_quiet_mode,
     setup_logging,
 )
@@ -46,7 +47,7 @@ from .utils.common import (
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["text", "json", "csv"]),
+    type=click.Choice(["text", "json", "csv", "ndjson"]),
     help="Output format for commands",
 )
 @click.option("--no-color", is_flag=True, help="Disable colored output")
@@ -107,6 +108,10 @@ def main(
         log_level=log_level,
     )
 
+    # Standard output is reserved for the streamed JSON records
+    if output_format == "ndjson":
+        redirect_output_to_stderr()
+
     logger = get_logger()
     logger.debug("GitCo CLI started")
 
@@ -59,6 +59,21 @@ def register_backup_commands(main_group):
     "--no-git-history", is_flag=True, help="Exclude git history to reduce size"
 )
 @click.option("--compression", type=int, default=6, help="Compression level (0-9)")
+@click.option(
+    "--exclude",
+    "-x",
+    multiple=True,
+    help="Exclude files and directories matching a glob pattern (repeatable)",
+)
+@click.option(
+    "--split", is_flag=True, help="Write each repository to a separate archive"
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    help="Maximum repositories compressed at once (default: number of CPUs)",
+)
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
 @click.pass_context
 def create(
@@ -69,6 +84,9 @@ def create(
     description: Optional[str],
     no_git_history: bool,
     compression: int,
+    exclude: tuple[str, ...],
+    split: bool,
+    workers: Optional[int],
     quiet: bool,
 ) -> None:
     """Create a backup of repositories and configuration."""
@@ -109,6 +127,9 @@ def create(
             description=description,
             include_git_history=not no_git_history,
             compression_level=compression,
+            exclude_patterns=list(exclude),
+            split_archives=split,
+            max_workers=workers,
         )
 
         if not quiet:
@@ -5,14 +5,18 @@ sync-history, stats, recommendations, export, trending.
 """
 
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
 import click
 
 from ..libs.config import get_config_manager
-from ..libs.exporter import export_contribution_data_to_csv
+from ..libs.exporter import (
+    export_contribution_data_to_csv,
+    export_contributions_to_parquet,
+)
 from ..libs.github_client import create_github_client
 from ..utils.common import (
     print_error_panel,
@@ -40,7 +44,9 @@ def register_contributions_commands(main_group):
 
 @click.command()
 @click.option("--username", required=True, help="GitHub username to sync")
-@click.option("--force", "-f", is_flag=True, help="Force sync even if recent")
+@click.option(
+    "--force", "-f", is_flag=True, help="Re-fetch the full history instead of resuming"
+)
 @click.option("--days", type=int, help="Sync contributions from last N days")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
 @click.pass_context
@@ -81,11 +87,13 @@ def sync_history(
         tracker = create_contribution_tracker(config, github_client)
 
         # Sync contributions
-        tracker.sync_contributions_from_github(username, force=force, days=days)
+        synced = tracker.sync_contributions_from_github(
+            username, force=force, days=days
+        )
 
         print_success_panel(
             "Sync Completed",
-            f"✅ Successfully synced contributions for {username}",
+            f"✅ Successfully synced {synced} contributions for {username}",
         )
 
     except Exception as e:
@@ -100,7 +108,7 @@ def sync_history(
 @click.command()
 @click.option("--days", type=int, help="Show stats for last N days")
 @click.option("--detailed", "-d", is_flag=True, help="Detailed statistics")
-@click.option("--export", help="Export stats to file (.json or .csv)")
+@click.option("--export", help="Export stats to file (.json, .csv or .parquet)")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
 @click.pass_context
 def stats(
@@ -199,22 +207,19 @@ def stats(
                 # Determine export format based on file extension
                 export_path = Path(export)
                 is_csv_export = export_path.suffix.lower() == ".csv"
+                is_parquet_export = export_path.suffix.lower() == ".parquet"
 
-                if is_csv_export:
-                    # Get all contributions for CSV export
-                    all_contributions = tracker.load_contribution_history()
-
-                    # Filter by days if specified
-                    if days:
-                        cutoff_date = datetime.now() - timedelta(days=days)
-                        all_contributions = [
-                            c
-                            for c in all_contributions
-                            if datetime.fromisoformat(c.created_at) >= cutoff_date
-                        ]
-
-                    # Export to CSV
-                    export_contribution_data_to_csv(all_contributions, export)
+                if is_parquet_export:
+                    # Stream contributions from the store into the Parquet file
+                    export_contributions_to_parquet(
+                        tracker.iter_contribution_history(created_days=days), export
+                    )
+                elif is_csv_export:
+                    # Get the contributions created in the period for CSV export
+                    export_contribution_data_to_csv(
+                        list(tracker.iter_contribution_history(created_days=days)),
+                        export,
+                    )
                 else:
                     # JSON export
                     export_data = {
@@ -367,13 +372,18 @@ def recommendations(
 
 @click.command()
 @click.option("--days", type=int, help="Export contributions from last N days")
-@click.option("--output", "-o", required=True, help="Output file path (.csv or .json)")
+@click.option(
+    "--output",
+    "-o",
+    required=True,
+    help="Output file path (.csv, .parquet or .json)",
+)
 @click.option("--include-stats", "-s", is_flag=True, help="Include summary statistics")
 @click.pass_context
 def export(
     ctx: click.Context, days: Optional[int], output: str, include_stats: bool
 ) -> None:
-    """Export contribution data to CSV or JSON format."""
+    """Export contribution data to CSV, Parquet or JSON format."""
     print_info_panel(
         "Exporting Contribution Data",
         f"Preparing contribution data for export to {output}...",
@@ -398,17 +408,19 @@ def export(
 
         tracker = create_contribution_tracker(config, github_client)
 
-        # Get all contributions
-        all_contributions = tracker.load_contribution_history()
-
-        # Filter by days if specified
-        if days:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            all_contributions = [
-                c
-                for c in all_contributions
-                if datetime.fromisoformat(c.created_at) >= cutoff_date
-            ]
+        # Determine export format based on file extension
+        export_path = Path(output)
+        is_csv_export = export_path.suffix.lower() == ".csv"
+        is_parquet_export = export_path.suffix.lower() == ".parquet"
+
+        # Get the contributions created in the period, if one is given
+        stream = tracker.iter_contribution_history(created_days=days)
+        if is_parquet_export:
+            # Stream contributions from the store instead of loading them all
+            first = next(stream, None)
+            all_contributions = [] if first is None else [first]
+        else:
+            all_contributions = list(stream)
 
         if not all_contributions:
             print_warning_panel(
@@ -417,13 +429,12 @@ def export(
             )
             return
 
-        # Determine export format based on file extension
-        export_path = Path(output)
-        is_csv_export = export_path.suffix.lower() == ".csv"
-
         if is_csv_export:
             # Export to CSV
             export_contribution_data_to_csv(all_contributions, output, include_stats)
+        elif is_parquet_export:
+            # Export to Parquet
+            export_contributions_to_parquet(chain(all_contributions, stream), output)
         else:
             # Export to JSON
             export_data = {
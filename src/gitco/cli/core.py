@@ -6,13 +6,17 @@ status, activity, logs, performance, version, help, completion, validate-repo.
 
 import os
 import sys
-from typing import Optional
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, fields
+from typing import Any, Optional
 
 import click
 import yaml
 
 from .. import __version__
-from ..libs.config import ConfigManager, create_sample_config
+from ..libs.config import Config, ConfigManager, create_sample_config
+from ..libs.exporter import NDJSONWriter
 from ..utils.common import (
     console,
     get_logger,
@@ -20,9 +24,12 @@ from ..utils.common import (
     log_operation_start,
     log_operation_success,
     print_error_panel,
+    print_status_table,
     print_success_panel,
     print_warning_panel,
 )
+from ..utils.exception import ConfigurationError
+from .github import create_github_client_with_fallback
 
 
 def register_core_commands(main_group):
@@ -41,6 +48,216 @@ def register_core_commands(main_group):
     main_group.add_command(validate_repo)
 
 
+# Health statuses grouped as the status command's --filter names them
+_HEALTH_GROUPS = {
+    "excellent": "healthy",
+    "good": "healthy",
+    "fair": "needs_attention",
+    "poor": "critical",
+    "critical": "critical",
+}
+
+# Metrics the status and activity commands' --sort names stand for
+_HEALTH_SORT_FIELDS = {
+    "health": "overall_health_score",
+    "activity": "recent_commits_30d",
+    "stars": "stars_count",
+    "forks": "forks_count",
+}
+_ACTIVITY_SORT_FIELDS = {
+    "activity": "activity_score",
+    "engagement": "engagement_score",
+    "commits": "commits_last_30d",
+    "contributors": "active_contributors_30d",
+}
+
+
+def _activity_level(activity_score: float) -> str:
+    """Classify an activity score the way the activity summary counts it."""
+    if activity_score >= 0.7:
+        return "high"
+    if activity_score >= 0.3:
+        return "moderate"
+    return "low"
+
+
+def _repository_configs(
+    config: Config, names: Optional[list[str]] = None
+) -> list[dict[str, Any]]:
+    """Get configured repositories in the form the library APIs take.
+
+    Args:
+        config: GitCo configuration
+        names: Only the repositories with these names
+
+    Returns:
+        Repository configurations with their local paths expanded
+
+    Raises:
+        ConfigurationError: If a named repository is not configured
+    """
+    repositories = {
+        repository.name: {
+            **asdict(repository),
+            "local_path": os.path.expanduser(repository.local_path),
+        }
+        for repository in config.repositories or []
+    }
+    if names is None:
+        return list(repositories.values())
+
+    missing = [name for name in names if name not in repositories]
+    if missing:
+        raise ConfigurationError(
+            f"Repository not found in configuration: {', '.join(missing)}"
+        )
+    return [repositories[name] for name in names]
+
+
+def _analyze_repositories(
+    change_analyzer: Any,
+    repositories: list[dict[str, Any]],
+    stream: Optional[NDJSONWriter],
+    custom_prompt: Optional[str] = None,
+    use_llm: bool = True,
+    num_commits: int = 10,
+    detailed: bool = False,
+    quiet: bool = False,
+) -> dict[str, Optional[dict[str, Any]]]:
+    """Analyze repositories, showing each result as soon as it completes.
+
+    LLM analyses run concurrently under the provider's token budget and are
+    displayed in the order they complete. On a terminal each analysis field
+    is displayed as soon as the streamed response completes it, so the
+    summary shows up before the rest of the response has arrived.
+
+    Args:
+        change_analyzer: Change analyzer to analyze with
+        repositories: Repository configurations from ``_repository_configs``
+        stream: Writer receiving one record per analysis, if streaming NDJSON
+        custom_prompt: Custom analysis prompt
+        use_llm: Whether to analyze with the LLM instead of patterns only
+        num_commits: Number of recent commits to analyze per repository
+        detailed: Also show the changes the detectors found
+        quiet: Suppress output
+
+    Returns:
+        Analysis results by repository name, None where there was nothing to
+        analyze or the analysis failed
+    """
+    from ..libs.config import Repository
+    from ..libs.git_ops import GitRepository
+
+    targets = [
+        (Repository(**repository), GitRepository(repository["local_path"]))
+        for repository in repositories
+    ]
+    stream_fields = use_llm and not quiet and console.is_terminal
+    if use_llm:
+        analyses = change_analyzer.analyze_repositories(
+            targets,
+            custom_prompt=custom_prompt,
+            stream=stream_fields,
+            num_commits=num_commits,
+        )
+    else:
+        analyses = _iter_pattern_analyses(change_analyzer, targets, num_commits)
+
+    results: dict[str, Optional[dict[str, Any]]] = {}
+    for repository, analysis in analyses:
+        record = asdict(analysis) if analysis else None
+        results[repository.name] = record
+        if stream:
+            stream.write({"repository": repository.name, "analysis": record})
+
+        if quiet:
+            continue
+        if analysis is None:
+            print_warning_panel(
+                f"No analysis for {repository.name}",
+                "There were no changes to analyze or the analysis failed",
+            )
+            continue
+        if not stream_fields:
+            change_analyzer.display_analysis(analysis, repository.name)
+        if detailed:
+            _print_detected_changes(analysis, repository.name)
+    return results
+
+
+def _iter_pattern_analyses(
+    change_analyzer: Any, targets: list[tuple[Any, Any]], num_commits: int
+) -> Iterator[tuple[Any, Any]]:
+    """Analyze repositories one at a time with the pattern detectors only."""
+    from ..libs.analyzer import ChangeAnalysis
+
+    for repository, git_repo in targets:
+        result = change_analyzer.analyze_changes_without_llm(
+            repository, git_repo, num_commits
+        )
+        yield repository, ChangeAnalysis(
+            **{
+                field.name: result[field.name]
+                for field in fields(ChangeAnalysis)
+                if field.name in result
+            }
+        )
+
+
+def _print_detected_changes(analysis: Any, repository_name: str) -> None:
+    """Print the changes the pattern detectors found in an analysis."""
+    detected = [
+        ("Breaking change", analysis.detailed_breaking_changes),
+        ("Security update", analysis.detailed_security_updates),
+        ("Deprecation", analysis.detailed_deprecations),
+    ]
+    rows = [
+        {
+            "Kind": kind,
+            "Type": change.type,
+            "Severity": change.severity,
+            "Description": change.description,
+        }
+        for kind, changes in detected
+        for change in changes or []
+    ]
+    if rows:
+        print_status_table(
+            f"Detected Changes - {repository_name}",
+            rows,
+            ["Kind", "Type", "Severity", "Description"],
+        )
+
+
+def _ndjson_output(ctx: click.Context) -> bool:
+    """Check whether per-repository records are streamed as NDJSON."""
+    return bool(ctx.obj.get("output_format") == "ndjson")
+
+
+@contextmanager
+def _result_stream(
+    ctx: click.Context, export: Optional[str]
+) -> Iterator[Optional[NDJSONWriter]]:
+    """Stream one JSON record per result when ``--output-format ndjson`` is set.
+
+    Records go to the export file when one is given and to standard output
+    otherwise; in this mode the CLI sends all other output to standard error.
+
+    Args:
+        ctx: Click context
+        export: Export file path, if any
+
+    Yields:
+        The open writer, or None for the other output formats
+    """
+    if not _ndjson_output(ctx):
+        yield None
+        return
+
+    with NDJSONWriter(export) as writer:
+        yield writer
+
+
 @click.command()
 @click.option("--force", "-f", is_flag=True, help="Overwrite existing configuration")
 @click.option("--template", "-t", help="Use custom template for configuration")
@@ -218,8 +435,6 @@ def init(
 @click.option("--repo", "-r", help="Sync specific repository")
 @click.option("--batch", "-b", is_flag=True, help="Batch sync all repositories")
 @click.option("--analyze", "-a", is_flag=True, help="Run analysis after sync")
-@click.option("--stash", is_flag=True, help="Stash local changes before sync")
-@click.option("--force", "-f", is_flag=True, help="Force sync even if conflicts")
 @click.option("--max-repos", type=int, help="Maximum repositories per batch")
 @click.option("--export", help="Export sync report")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
@@ -250,8 +465,6 @@ def sync(
     repo: Optional[str],
     batch: bool,
     analyze: bool,
-    stash: bool,
-    force: bool,
     max_repos: Optional[int],
     export: Optional[str],
     quiet: bool,
@@ -261,63 +474,86 @@ def sync(
     log_backups: Optional[int],
     max_workers: int,
 ):
-    """Synchronize repositories with upstream changes."""
+    """Synchronize repositories with upstream changes.
+
+    Uncommitted changes are stashed before each sync and restored afterwards.
+    """
     log_operation_start(
         "repository synchronization", repo=repo, batch=batch, analyze=analyze
     )
 
     try:
-        from ..libs.config import ConfigManager
-        from ..libs.git_ops import GitOperations
+        from ..libs.git_ops import GitRepositoryManager
 
         config_manager = ConfigManager(ctx.obj.get("config"))
         config = config_manager.load_config()
-        git_ops = GitOperations(config)
-
-        if repo:
-            # Sync specific repository
-            result = git_ops.sync_repository(repo, stash=stash, force=force)
-            if analyze:
-                from ..libs.analyzer import Analyzer
-
-                analyzer = Analyzer(config)
-                analyzer.analyze_repository(repo)
-        elif batch:
-            # Batch sync all repositories
-            repos_to_sync = list(config.repositories.keys())
-            if max_repos:
-                repos_to_sync = repos_to_sync[:max_repos]
-
-            results = git_ops.batch_sync(
-                repos_to_sync, max_workers=max_workers, stash=stash, force=force
+        repositories = _repository_configs(config, [repo] if repo else None)
+        if max_repos:
+            repositories = repositories[:max_repos]
+
+        change_analyzer = None
+        if analyze:
+            from ..libs.analyzer import ChangeAnalyzer
+
+            # Set up the LLM provider first so a missing API key fails the
+            # command before anything is synchronized
+            change_analyzer = ChangeAnalyzer(config)
+            change_analyzer.get_analyzer(config.settings.llm_provider)
+
+        with _result_stream(ctx, export) as stream:
+            # Without --batch, repositories are synchronized one at a time
+            results = GitRepositoryManager().batch_sync_repositories(
+                repositories,
+                max_workers=max_workers if batch else 1,
+                show_progress=not quiet,
+                on_result=stream.write if stream else None,
             )
 
-            if analyze:
-                from ..libs.analyzer import Analyzer
-
-                analyzer = Analyzer(config)
-                for repo_name in repos_to_sync:
-                    analyzer.analyze_repository(repo_name)
-        else:
-            # Sync all repositories individually
-            results = git_ops.sync_all_repositories(stash=stash, force=force)
+            analysis_results = None
+            if change_analyzer:
+                synced = {
+                    result.repository_name for result in results if result.success
+                }
+                analysis_results = _analyze_repositories(
+                    change_analyzer,
+                    [
+                        repository
+                        for repository in repositories
+                        if repository["name"] in synced
+                    ],
+                    stream,
+                    quiet=quiet,
+                )
 
-        if export:
-            # Export sync report
-            import json
+            if export and not stream:
+                import json
 
-            with open(export, "w") as f:
-                json.dump(
-                    {"sync_results": results if "results" in locals() else "completed"},
-                    f,
-                    indent=2,
-                )
+                report: dict[str, Any] = {
+                    "sync_results": [asdict(result) for result in results]
+                }
+                if analysis_results is not None:
+                    report["analysis_results"] = analysis_results
+                with open(export, "w") as f:
+                    json.dump(report, f, indent=2, default=str)
 
-        log_operation_success("repository synchronization", repo=repo, batch=batch)
-        if not quiet:
-            print_success_panel(
-                "Sync completed", "All repositories synchronized successfully"
+            failed = [result for result in results if not result.success]
+            log_operation_success(
+                "repository synchronization",
+                repo=repo,
+                batch=batch,
+                failed_count=len(failed),
             )
+            if not quiet:
+                if failed:
+                    print_warning_panel(
+                        "Sync completed with errors",
+                        f"{len(failed)} of {len(results)} repositories failed: "
+                        + ", ".join(result.repository_name for result in failed),
+                    )
+                else:
+                    print_success_panel(
+                        "Sync completed", "All repositories synchronized successfully"
+                    )
 
     except Exception as e:
         log_operation_failure("repository synchronization", e, repo=repo, batch=batch)
@@ -331,9 +567,17 @@ def sync(
 @click.option("--detailed", "-d", is_flag=True, help="Detailed analysis")
 @click.option("--prompt", "-p", help="Custom analysis prompt")
 @click.option("--model", help="LLM model to use")
-@click.option("--provider", help="LLM provider to use (openai only)")
+@click.option(
+    "--provider",
+    help="LLM provider to use: openai, local or another registered provider",
+)
 @click.option("--no-llm", is_flag=True, help="Skip LLM analysis")
-@click.option("--max-commits", type=int, help="Maximum commits to analyze")
+@click.option(
+    "--max-commits",
+    type=int,
+    default=10,
+    help="Maximum commits to analyze (default: 10)",
+)
 @click.option("--export", "-e", help="Export analysis results")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output")
 @click.pass_context
@@ -346,61 +590,66 @@ def analyze(
     model: Optional[str],
     provider: Optional[str],
     no_llm: bool,
-    max_commits: Optional[int],
+    max_commits: int,
     export: Optional[str],
     quiet: bool,
 ):
     """Analyze repository changes using AI."""
+    if provider:
+        from ..libs.analyzer import get_analyzer_providers
+
+        providers = get_analyzer_providers()
+        if provider not in providers:
+            raise click.BadParameter(
+                f"must be one of: {', '.join(providers)}", param_hint="--provider"
+            )
+
     log_operation_start(
         "repository analysis", repo=repo, repos=repos, detailed=detailed
     )
 
     try:
-        from ..libs.analyzer import Analyzer
-        from ..libs.config import ConfigManager
+        from ..libs.analyzer import ChangeAnalyzer
 
         config_manager = ConfigManager(ctx.obj.get("config"))
         config = config_manager.load_config()
-        analyzer = Analyzer(config)
 
         # Override settings if provided
-        if model:
-            config.settings.llm_model = model
         if provider:
             config.settings.llm_provider = provider
+        change_analyzer = ChangeAnalyzer(config)
+        if model and not no_llm:
+            change_analyzer.get_analyzer(config.settings.llm_provider).model = model
 
-        repositories = []
+        names = None
         if repo:
-            repositories = [repo]
+            names = [repo]
         elif repos:
-            repositories = [r.strip() for r in repos.split(",")]
-        else:
-            repositories = list(config.repositories.keys())
-
-        results = {}
-        for repo_name in repositories:
-            if not quiet:
-                console.print(f"[blue]Analyzing repository: {repo_name}[/blue]")
-
-            analysis_result = analyzer.analyze_repository(
-                repo_name,
-                detailed=detailed,
+            names = [r.strip() for r in repos.split(",")]
+        repositories = _repository_configs(config, names)
+
+        with _result_stream(ctx, export) as stream:
+            results = _analyze_repositories(
+                change_analyzer,
+                repositories,
+                stream,
                 custom_prompt=prompt,
                 use_llm=not no_llm,
-                max_commits=max_commits,
+                num_commits=max_commits,
+                detailed=detailed,
+                quiet=quiet,
             )
-            results[repo_name] = analysis_result
 
-        if export:
+        if export and not stream:
             import json
 
             with open(export, "w") as f:
                 json.dump(results, f, indent=2, default=str)
 
-        log_operation_success("repository analysis", repo_count=len(repositories))
+        log_operation_success("repository analysis", repo_count=len(results))
         if not quiet:
             print_success_panel(
-                "Analysis completed", f"Analyzed {len(repositories)} repositories"
+                "Analysis completed", f"Analyzed {len(results)} repositories"
             )
 
     except Exception as e:
@@ -444,46 +693,42 @@ def discover(
     )
 
     try:
-        from ..libs.config import ConfigManager
-        from ..libs.discovery import DiscoveryEngine
+        from ..libs.discovery import IssueDiscovery, print_issue_recommendation
+        from ..libs.exporter import export_discovery_results
 
         config_manager = ConfigManager(ctx.obj.get("config"))
         config = config_manager.load_config()
-        discovery_engine = DiscoveryEngine(config)
-
-        # Build filters
-        filters = {}
-        if skill:
-            filters["skill"] = skill
-        if label:
-            filters["label"] = label
         if repos:
-            filters["repos"] = [r.strip() for r in repos.split(",")]
-        if min_confidence:
-            filters["min_confidence"] = min_confidence
-
-        # Discover opportunities
-        opportunities = discovery_engine.discover_opportunities(
-            filters=filters,
-            limit=limit,
-            personalized=personalized,
-            show_history=show_history,
+            names = {name.strip() for name in repos.split(",")}
+            config.repositories = [
+                repository
+                for repository in config.repositories or []
+                if repository.name in names
+            ]
+        discovery_engine = IssueDiscovery(
+            create_github_client_with_fallback(config_manager), config
         )
 
-        if export:
-            import json
+        with _result_stream(ctx, export) as stream:
+            opportunities = discovery_engine.discover_opportunities(
+                skill_filter=skill,
+                label_filter=label,
+                limit=limit,
+                min_confidence=min_confidence or 0.1,
+                include_personalization=personalized,
+                on_recommendation=stream.write if stream else None,
+            )
 
-            with open(export, "w") as f:
-                json.dump(opportunities, f, indent=2, default=str)
+            if export and not stream:
+                export_discovery_results(opportunities, export)
 
-        if not quiet:
-            console.print(
-                f"[green]Found {len(opportunities)} contribution opportunities[/green]"
-            )
-            for i, opp in enumerate(opportunities[:10], 1):  # Show first 10
+            if not quiet:
                 console.print(
-                    f"{i}. {opp.get('title', 'N/A')} ({opp.get('confidence', 0):.2f})"
+                    f"[green]Found {len(opportunities)} contribution opportunities"
+                    "[/green]"
                 )
+                for i, opportunity in enumerate(opportunities[:10], 1):
+                    print_issue_recommendation(opportunity, i)
 
         log_operation_success(
             "contribution discovery", opportunity_count=len(opportunities)
@@ -524,102 +769,99 @@ def status(
     )
 
     try:
-        from ..libs.config import ConfigManager
-        from ..libs.health_metrics import HealthMetrics
+        from ..libs.health_metrics import RepositoryHealthCalculator
+        from ..libs.metric_snapshots import MetricSnapshotStore
 
         config_manager = ConfigManager(ctx.obj.get("config"))
         config = config_manager.load_config()
-        health_metrics = HealthMetrics(config)
+        health_calculator = RepositoryHealthCalculator(
+            config,
+            create_github_client_with_fallback(config_manager),
+            MetricSnapshotStore(),
+        )
+        repositories = _repository_configs(config, [repo] if repo else None)
 
-        if repo:
-            # Get status for specific repository
-            status_info = health_metrics.get_repository_status(repo, detailed=detailed)
-            repositories_status = {repo: status_info}
-        else:
-            # Get status for all repositories
-            repositories_status = health_metrics.get_all_repositories_status(
-                detailed=detailed
-            )
+        with _result_stream(ctx, export) as stream:
+            repository_metrics = []
 
-        # Apply filters
-        if filter:
-            repositories_status = {
-                name: status
-                for name, status in repositories_status.items()
-                if status.get("health_status") == filter
-            }
+            def on_metrics(metrics: Any) -> None:
+                repository_metrics.append(metrics)
+                if stream:
+                    stream.write(metrics)
 
-        # Sort results
-        if sort:
-            repositories_status = dict(
-                sorted(
-                    repositories_status.items(),
-                    key=lambda x: x[1].get(sort, 0),
-                    reverse=True,
-                )
+            summary = health_calculator.calculate_health_summary(
+                repositories, on_metrics=on_metrics
             )
 
-        if export:
-            import json
-
-            with open(export, "w") as f:
-                json.dump(repositories_status, f, indent=2, default=str)
-
-        if not quiet:
-            if overview:
-                # Show overview status
-                total_repos = len(repositories_status)
-                healthy = len(
-                    [
-                        s
-                        for s in repositories_status.values()
-                        if s.get("health_status") == "healthy"
-                    ]
-                )
-                needs_attention = len(
-                    [
-                        s
-                        for s in repositories_status.values()
-                        if s.get("health_status") == "needs_attention"
-                    ]
-                )
-                critical = len(
-                    [
-                        s
-                        for s in repositories_status.values()
-                        if s.get("health_status") == "critical"
-                    ]
+            # Apply filters
+            if filter:
+                repository_metrics = [
+                    metrics
+                    for metrics in repository_metrics
+                    if _HEALTH_GROUPS.get(metrics.health_status) == filter
+                ]
+
+            # Sort results, by name unless a field is given
+            repository_metrics.sort(key=lambda metrics: metrics.repository_name)
+            if sort:
+                sort_field = _HEALTH_SORT_FIELDS.get(sort, sort)
+                repository_metrics.sort(
+                    key=lambda metrics: getattr(metrics, sort_field, 0) or 0,
+                    reverse=True,
                 )
 
-                console.print("[green]Repository Status Overview[/green]")
-                console.print(f"Total repositories: {total_repos}")
-                console.print(f"Healthy: {healthy}")
-                console.print(f"Needs attention: {needs_attention}")
-                console.print(f"Critical: {critical}")
-            else:
-                # Show detailed status
-                for repo_name, status_info in repositories_status.items():
-                    health = status_info.get("health_status", "unknown")
-                    color = {
-                        "healthy": "green",
-                        "needs_attention": "yellow",
-                        "critical": "red",
-                    }.get(health, "white")
-                    console.print(f"[{color}]{repo_name}: {health}[/{color}]")
+            if export and not stream:
+                import json
+
+                with open(export, "w") as f:
+                    json.dump(
+                        {
+                            "summary": asdict(summary),
+                            "repositories": [
+                                asdict(metrics) for metrics in repository_metrics
+                            ],
+                        },
+                        f,
+                        indent=2,
+                        default=str,
+                    )
 
-                    if detailed:
-                        console.print(
-                            f"  Last sync: {status_info.get('last_sync', 'N/A')}"
-                        )
-                        console.print(
-                            f"  Commits behind: {status_info.get('commits_behind', 'N/A')}"
-                        )
+            if not quiet:
+                if overview:
+                    # Show overview status
+                    console.print("[green]Repository Status Overview[/green]")
+                    console.print(f"Total repositories: {summary.total_repositories}")
+                    console.print(f"Healthy: {summary.healthy_repositories}")
+                    console.print(
+                        f"Needs attention: {summary.needs_attention_repositories}"
+                    )
+                    console.print(f"Critical: {summary.critical_repositories}")
+                else:
+                    # Show detailed status
+                    for metrics in repository_metrics:
+                        health = _HEALTH_GROUPS.get(metrics.health_status, "unknown")
+                        color = {
+                            "healthy": "green",
+                            "needs_attention": "yellow",
+                            "critical": "red",
+                        }.get(health, "white")
                         console.print(
-                            f"  Local changes: {status_info.get('local_changes', 'N/A')}"
+                            f"[{color}]{metrics.repository_name}: "
+                            f"{metrics.health_status}[/{color}]"
                         )
 
+                        if detailed:
+                            console.print(
+                                "  Days since last sync: "
+                                f"{metrics.days_since_last_sync or 'N/A'}"
+                            )
+                            console.print(f"  Sync status: {metrics.sync_status}")
+                            console.print(
+                                f"  Local changes: {metrics.uncommitted_changes}"
+                            )
+
         log_operation_success(
-            "repository status check", repo_count=len(repositories_status)
+            "repository status check", repo_count=len(repository_metrics)
         )
 
     except Exception as e:
@@ -652,72 +894,87 @@ def activity(
 
     try:
         from ..libs.activity_dashboard import ActivityDashboard
-        from ..libs.config import ConfigManager
+        from ..libs.metric_snapshots import MetricSnapshotStore
 
         config_manager = ConfigManager(ctx.obj.get("config"))
         config = config_manager.load_config()
-        activity_dashboard = ActivityDashboard(config)
+        activity_dashboard = ActivityDashboard(
+            config,
+            create_github_client_with_fallback(config_manager),
+            MetricSnapshotStore(),
+        )
+        repositories = _repository_configs(config, [repo] if repo else None)
 
-        if repo:
-            # Get activity for specific repository
-            activity_info = activity_dashboard.get_repository_activity(
-                repo, detailed=detailed
-            )
-            repositories_activity = {repo: activity_info}
-        else:
-            # Get activity for all repositories
-            repositories_activity = activity_dashboard.get_all_repositories_activity(
-                detailed=detailed
-            )
+        with _result_stream(ctx, export) as stream:
+            repository_activity = []
 
-        # Apply filters
-        if filter:
-            repositories_activity = {
-                name: activity
-                for name, activity in repositories_activity.items()
-                if activity.get("activity_level") == filter
-            }
+            def on_metrics(metrics: Any) -> None:
+                repository_activity.append(metrics)
+                if stream:
+                    stream.write(metrics)
 
-        # Sort results
-        if sort:
-            repositories_activity = dict(
-                sorted(
-                    repositories_activity.items(),
-                    key=lambda x: x[1].get(sort, 0),
-                    reverse=True,
-                )
+            summary = activity_dashboard.calculate_activity_summary(
+                repositories, on_metrics=on_metrics
             )
 
-        if export:
-            import json
-
-            with open(export, "w") as f:
-                json.dump(repositories_activity, f, indent=2, default=str)
-
-        if not quiet:
-            console.print("[green]Repository Activity Dashboard[/green]")
-            for repo_name, activity_info in repositories_activity.items():
-                activity_level = activity_info.get("activity_level", "unknown")
-                color = {"high": "green", "moderate": "yellow", "low": "red"}.get(
-                    activity_level, "white"
-                )
-                console.print(
-                    f"[{color}]{repo_name}: {activity_level} activity[/{color}]"
+            # Apply filters
+            if filter:
+                repository_activity = [
+                    metrics
+                    for metrics in repository_activity
+                    if _activity_level(metrics.activity_score) == filter
+                ]
+
+            # Sort results
+            if sort:
+                sort_field = _ACTIVITY_SORT_FIELDS.get(sort, sort)
+                repository_activity.sort(
+                    key=lambda metrics: getattr(metrics, sort_field, 0) or 0,
+                    reverse=True,
                 )
 
-                if detailed:
-                    console.print(
-                        f"  Recent commits: {activity_info.get('recent_commits', 'N/A')}"
+            if export and not stream:
+                import json
+
+                with open(export, "w") as f:
+                    json.dump(
+                        {
+                            "summary": asdict(summary),
+                            "repositories": [
+                                asdict(metrics) for metrics in repository_activity
+                            ],
+                        },
+                        f,
+                        indent=2,
+                        default=str,
                     )
-                    console.print(
-                        f"  Contributors: {activity_info.get('contributors', 'N/A')}"
+
+            if not quiet:
+                console.print("[green]Repository Activity Dashboard[/green]")
+                for metrics in repository_activity:
+                    activity_level = _activity_level(metrics.activity_score)
+                    color = {"high": "green", "moderate": "yellow", "low": "red"}.get(
+                        activity_level, "white"
                     )
                     console.print(
-                        f"  Engagement score: {activity_info.get('engagement_score', 'N/A')}"
+                        f"[{color}]{metrics.repository_name}: "
+                        f"{activity_level} activity[/{color}]"
                     )
 
+                    if detailed:
+                        console.print(
+                            f"  Commits (7d/30d): {metrics.commits_last_7d}/"
+                            f"{metrics.commits_last_30d}"
+                        )
+                        console.print(
+                            f"  Contributors (30d): {metrics.active_contributors_30d}"
+                        )
+                        console.print(
+                            f"  Engagement score: {metrics.engagement_score:.2f}"
+                        )
+
         log_operation_success(
-            "repository activity dashboard", repo_count=len(repositories_activity)
+            "repository activity dashboard", repo_count=len(repository_activity)
         )
 
     except Exception as e:
@@ -12,14 +12,19 @@ __url__ = "https://github.com/41technologies/gitco"
 from .activity_dashboard import ActivityDashboard, ActivityMetrics
 from .analyzer import ChangeAnalysis, ChangeAnalyzer
 from .backup import BackupManager, BackupMetadata
+from .commit_activity import CommitActivity, scan_commit_activity
 from .config import Config, ConfigManager, Repository
+from .contribution_store import ContributionStore
 from .contribution_tracker import Contribution, ContributionStats, ContributionTracker
 from .detector import BreakingChangeDetector, SecurityDeprecationDetector
-from .discovery import ContributionDiscovery
-from .exporter import DataExporter
-from .git_ops import GitOperations, GitRepository, GitRepositoryManager
+from .diff_condenser import DiffCondenser, condense_diff
+from .diff_parser import DiffHunk, parse_unified_diff
+from .discovery import IssueDiscovery
+from .exporter import NDJSONWriter
+from .git_ops import GitRepository, GitRepositoryManager
 from .github_client import GitHubClient, GitHubIssue, GitHubRepository
-from .health_metrics import HealthMetrics, RepositoryHealthMetrics
+from .health_metrics import RepositoryHealthCalculator, RepositoryHealthMetrics
+from .metric_snapshots import MetricSnapshotStore
 
 __all__ = [
     "__version__",
@@ -34,7 +39,12 @@ __all__ = [
     "ChangeAnalysis",
     "BreakingChangeDetector",
     "SecurityDeprecationDetector",
-    "GitOperations",
+    "DiffCondenser",
+    "condense_diff",
+    "DiffHunk",
+    "parse_unified_diff",
+    "CommitActivity",
+    "scan_commit_activity",
     "GitRepository",
     "GitRepositoryManager",
     "GitHubClient",
@@ -43,12 +53,14 @@ __all__ = [
     "ContributionTracker",
     "Contribution",
     "ContributionStats",
-    "ContributionDiscovery",
+    "ContributionStore",
+    "IssueDiscovery",
     "BackupManager",
     "BackupMetadata",
-    "DataExporter",
+    "NDJSONWriter",
     "ActivityDashboard",
     "ActivityMetrics",
-    "HealthMetrics",
+    "RepositoryHealthCalculator",
     "RepositoryHealthMetrics",
+    "MetricSnapshotStore",
 ]
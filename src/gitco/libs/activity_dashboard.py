@@ -1,12 +1,16 @@
 """Repository activity dashboard for GitCo."""
 
+import time
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Optional
 
-from ..utils.common import get_logger
+from ..utils.common import get_logger, parse_iso_timestamp
+from .commit_activity import CommitActivity
 from .config import Config
 from .git_ops import GitRepository
-from .github_client import GitHubClient
+from .github_client import RECENT_ISSUES_LIMIT, GitHubClient
+from .metric_snapshots import MetricSnapshotStore
 
 
 @dataclass
@@ -97,10 +101,23 @@ class ActivitySummary:
 class ActivityDashboard:
     """Repository activity dashboard calculator."""
 
-    def __init__(self, config: Config, github_client: GitHubClient):
-        """Initialize the activity dashboard."""
+    def __init__(
+        self,
+        config: Config,
+        github_client: GitHubClient,
+        snapshot_store: Optional[MetricSnapshotStore] = None,
+    ):
+        """Initialize the activity dashboard.
+
+        Args:
+            config: GitCo configuration
+            github_client: GitHub API client
+            snapshot_store: Store of the metric snapshots status runs record;
+                without one, growth is not reported
+        """
         self.config = config
         self.github_client = github_client
+        self.snapshot_store = snapshot_store
         self.logger = get_logger()
 
     def calculate_repository_activity(
@@ -113,11 +130,15 @@ class ActivityDashboard:
         )
 
         try:
+            # Scan the local history once for activity and patterns
+            commit_activity = self._scan_commit_activity(repository_config)
+
             # Calculate local git activity
-            self._calculate_local_activity(repository_config, metrics)
+            self._calculate_local_activity(commit_activity, metrics)
 
             # Calculate GitHub activity
-            self._calculate_github_activity(repository_config, metrics)
+            with self.github_client.request_scope():
+                self._calculate_github_activity(repository_config, metrics)
 
             # Calculate engagement metrics
             self._calculate_engagement_metrics(repository_config, metrics)
@@ -126,7 +147,7 @@ class ActivityDashboard:
             self._calculate_trending_metrics(repository_config, metrics)
 
             # Calculate activity patterns
-            self._calculate_activity_patterns(repository_config, metrics)
+            self._calculate_activity_patterns(commit_activity, metrics)
 
             # Calculate derived metrics
             self._calculate_derived_metrics(metrics)
@@ -139,15 +160,30 @@ class ActivityDashboard:
         return metrics
 
     def calculate_activity_summary(
-        self, repositories: list[dict[str, Any]]
+        self,
+        repositories: list[dict[str, Any]],
+        on_metrics: Optional[Callable[[ActivityMetrics], None]] = None,
     ) -> ActivitySummary:
-        """Calculate activity summary across all repositories."""
+        """Calculate activity summary across all repositories.
+
+        Args:
+            repositories: List of repository configurations
+            on_metrics: Called with each repository's metrics as soon as
+                they are calculated, e.g. to stream them to a consumer
+
+        Returns:
+            Activity summary
+        """
         summary = ActivitySummary()
         all_metrics = []
 
-        for repo_config in repositories:
-            metrics = self.calculate_repository_activity(repo_config)
-            all_metrics.append(metrics)
+        # One scope for the whole run, so each lookup is made at most once
+        with self.github_client.request_scope():
+            for repo_config in repositories:
+                metrics = self.calculate_repository_activity(repo_config)
+                all_metrics.append(metrics)
+                if on_metrics:
+                    on_metrics(metrics)
 
         if not all_metrics:
             return summary
@@ -186,36 +222,40 @@ class ActivityDashboard:
 
         return summary
 
-    def _calculate_local_activity(
-        self, repository_config: dict[str, Any], metrics: ActivityMetrics
-    ) -> None:
-        """Calculate local git activity metrics."""
+    def _scan_commit_activity(
+        self, repository_config: dict[str, Any]
+    ) -> Optional[CommitActivity]:
+        """Scan a repository's local history with a single git log pass."""
         try:
             local_path = repository_config.get("local_path")
-            if not local_path:
-                return
-
-            git_repo = GitRepository(local_path)
-            if not git_repo.is_git_repository():
-                return
+            if not local_path or not Path(local_path).is_dir():
+                return None
 
-            # Get commit counts for different time periods
-            # Note: These methods don't exist in GitRepository, so we'll use defaults
-            # In a real implementation, these would be calculated from git log
-            metrics.commits_last_24h = 0  # Would be calculated from git log
-            metrics.commits_last_7d = 0  # Would be calculated from git log
-            metrics.commits_last_30d = 0  # Would be calculated from git log
-            metrics.commits_last_90d = 0  # Would be calculated from git log
-            metrics.total_commits = 0  # Would be calculated from git log
-
-            # Get contributor activity
-            metrics.active_contributors_24h = 0  # Would be calculated from git log
-            metrics.active_contributors_7d = 0  # Would be calculated from git log
-            metrics.active_contributors_30d = 0  # Would be calculated from git log
-            metrics.total_contributors = 0  # Would be calculated from git log
+            return GitRepository(local_path).get_commit_activity()
 
         except Exception as e:
-            self.logger.warning(f"Failed to calculate local activity: {e}")
+            self.logger.warning(f"Failed to scan local activity: {e}")
+            return None
+
+    def _calculate_local_activity(
+        self, commit_activity: Optional[CommitActivity], metrics: ActivityMetrics
+    ) -> None:
+        """Calculate local git activity metrics."""
+        if not commit_activity:
+            return
+
+        # Commit counts for different time periods
+        metrics.commits_last_24h = commit_activity.commits_24h
+        metrics.commits_last_7d = commit_activity.commits_7d
+        metrics.commits_last_30d = commit_activity.commits_30d
+        metrics.commits_last_90d = commit_activity.commits_90d
+        metrics.total_commits = commit_activity.total_commits
+
+        # Contributor activity
+        metrics.active_contributors_24h = commit_activity.authors_24h
+        metrics.active_contributors_7d = commit_activity.authors_7d
+        metrics.active_contributors_30d = commit_activity.authors_30d
+        metrics.total_contributors = commit_activity.total_authors
 
     def _calculate_github_activity(
         self, repository_config: dict[str, Any], metrics: ActivityMetrics
@@ -231,15 +271,21 @@ class ActivityDashboard:
             if not repo_info:
                 return
 
-            # Get recent issues and PRs
-            # Note: get_issues doesn't accept 'since' parameter, so we'll use defaults
-            issues = self.github_client.get_issues(repo_name, state="all")
-
-            new_issues = [i for i in issues if i.state == "open"]
-            closed_issues = [i for i in issues if i.state == "closed"]
+            # Recently updated issues and PRs, newest first; the same listing
+            # the health calculator uses, so a request scope fetches it once
+            issues = self.github_client.get_issues(
+                repo_name, state="all", limit=RECENT_ISSUES_LIMIT
+            )
 
-            metrics.new_issues_7d = len(new_issues)
-            metrics.closed_issues_7d = len(closed_issues)
+            week_ago = time.time() - 7 * 24 * 3600
+            metrics.new_issues_7d = sum(
+                1 for i in issues if parse_iso_timestamp(i.created_at) >= week_ago
+            )
+            metrics.closed_issues_7d = sum(
+                1
+                for i in issues
+                if i.state == "closed" and i.updated_timestamp >= week_ago
+            )
             metrics.open_issues = repo_info.open_issues_count
             metrics.open_prs = 0  # Would be calculated from PR data
 
@@ -279,46 +325,45 @@ class ActivityDashboard:
     def _calculate_trending_metrics(
         self, repository_config: dict[str, Any], metrics: ActivityMetrics
     ) -> None:
-        """Calculate trending metrics."""
+        """Calculate trending metrics from the snapshots status runs record."""
+        if self.snapshot_store is None:
+            return
+
         try:
             repo_name = repository_config.get("name")
             if not repo_name:
                 return
 
-            # Get repository information for trending data
-            repo_info = self.github_client.get_repository(repo_name)
-            if not repo_info:
+            growth = self.snapshot_store.growth([repo_name], days=7).get(repo_name)
+            if not growth:
                 return
 
-            # Calculate trending metrics (simplified)
-            metrics.stars_growth_7d = 0  # Would be calculated from historical data
-            metrics.forks_growth_7d = 0  # Would be calculated from historical data
-            metrics.views_growth_7d = 0  # Would be calculated from historical data
+            metrics.stars_growth_7d = growth.stars
+            metrics.forks_growth_7d = growth.forks
+            # Traffic data needs push access, so views are not tracked
+            metrics.views_growth_7d = 0
 
         except Exception as e:
             self.logger.warning(f"Failed to calculate trending metrics: {e}")
 
     def _calculate_activity_patterns(
-        self, repository_config: dict[str, Any], metrics: ActivityMetrics
+        self, commit_activity: Optional[CommitActivity], metrics: ActivityMetrics
     ) -> None:
         """Calculate activity patterns."""
-        try:
-            local_path = repository_config.get("local_path")
-            if not local_path:
-                return
+        if not commit_activity:
+            return
 
-            git_repo = GitRepository(local_path)
-            if not git_repo.is_git_repository():
-                return
-
-            # Calculate activity patterns (simplified)
-            # In a real implementation, this would analyze commit timestamps
-            metrics.most_active_hour = 14  # Default to 2 PM
-            metrics.most_active_day = "Wednesday"  # Default
-            metrics.activity_trend = "stable"  # Would be calculated from trends
+        metrics.most_active_hour = commit_activity.most_active_hour
+        metrics.most_active_day = commit_activity.most_active_day
 
-        except Exception as e:
-            self.logger.warning(f"Failed to calculate activity patterns: {e}")
+        # Compare the last 30 days with the monthly rate of the 60 before
+        previous_rate = (commit_activity.commits_90d - commit_activity.commits_30d) / 2
+        if commit_activity.commits_30d > previous_rate * 1.25:
+            metrics.activity_trend = "increasing"
+        elif commit_activity.commits_30d < previous_rate * 0.75:
+            metrics.activity_trend = "decreasing"
+        else:
+            metrics.activity_trend = "stable"
 
     def _calculate_derived_metrics(self, metrics: ActivityMetrics) -> None:
         """Calculate derived metrics and health indicators."""
@@ -441,7 +486,9 @@ class ActivityDashboard:
 
 
 def create_activity_dashboard(
-    config: Config, github_client: GitHubClient
+    config: Config,
+    github_client: GitHubClient,
+    snapshot_store: Optional[MetricSnapshotStore] = None,
 ) -> ActivityDashboard:
     """Create an activity dashboard instance."""
-    return ActivityDashboard(config, github_client)
+    return ActivityDashboard(config, github_client, snapshot_store)
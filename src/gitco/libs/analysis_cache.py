@@ -0,0 +1,190 @@
+"""Persistent content-addressed cache for LLM analysis results."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ..utils.common import get_logger
+
+DEFAULT_CACHE_DIR = "~/.gitco/cache/llm"
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 500
+
+# Bump when the stored payload layout changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+
+class AnalysisCache:
+    """Disk cache of parsed LLM analyses keyed by the exact request content.
+
+    Each entry is a small JSON file named after the SHA-256 of the model,
+    system prompt and rendered user prompt, so identical requests map to the
+    same entry and any change to the diff, commit messages or prompt template
+    produces a new key. Entries expire after ``ttl_seconds``; when more than
+    ``max_entries`` are stored, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize the analysis cache.
+
+        Args:
+            cache_dir: Cache directory (defaults to ~/.gitco/cache/llm).
+            ttl_seconds: Entry lifetime in seconds.
+            max_entries: Maximum number of entries kept on disk.
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = get_logger()
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, prompt: str) -> str:
+        """Build the cache key for an LLM request.
+
+        Args:
+            model: Model name.
+            system_prompt: System prompt sent to the model.
+            prompt: Rendered user prompt sent to the model.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        digest = hashlib.sha256()
+        for part in (str(CACHE_FORMAT_VERSION), model, system_prompt, prompt):
+            encoded = part.encode("utf-8")
+            # Length-prefix each part so boundaries cannot be shifted
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Look up a cached payload.
+
+        Args:
+            key: Cache key from ``make_key``.
+
+        Returns:
+            Cached payload, or None if missing, expired or unreadable.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Discarding unreadable cache entry {path.name}: {e}")
+            self._remove(path)
+            return None
+
+        created_at = entry.get("created_at", 0.0)
+        if time.time() - created_at > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        # Refresh the access time used for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        payload: Optional[dict[str, Any]] = entry.get("payload")
+        return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        """Store a payload and evict old entries if the cache is full.
+
+        Write failures are logged and otherwise ignored; the cache is an
+        optimization and must never break an analysis.
+
+        Args:
+            key: Cache key from ``make_key``.
+            payload: JSON-serializable payload to store.
+        """
+        entry = {"created_at": time.time(), "payload": payload}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=".tmp-", suffix=".json"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, self._entry_path(key))
+            except BaseException:
+                self._remove(Path(tmp_path))
+                raise
+        except OSError as e:
+            self.logger.warning(f"Failed to write analysis cache entry: {e}")
+            return
+
+        self._evict()
+
+    def clear(self) -> int:
+        """Remove all cache entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for path in self._entries():
+            if self._remove(path):
+                removed += 1
+        return removed
+
+    def _entries(self) -> list[Path]:
+        """List cache entry files."""
+        if not self.cache_dir.is_dir():
+            return []
+        return [
+            path
+            for path in self.cache_dir.glob("*.json")
+            if not path.name.startswith(".tmp-")
+        ]
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones over the limit."""
+        now = time.time()
+        live: list[tuple[float, Path]] = []
+        for path in self._entries():
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            # mtime tracks last access, so an untouched entry past the TTL is
+            # certainly expired; recently read ones are checked on the next get
+            if now - mtime > self.ttl_seconds:
+                self._remove(path)
+            else:
+                live.append((mtime, path))
+
+        excess = len(live) - self.max_entries
+        if excess > 0:
+            live.sort()
+            for _, path in live[:excess]:
+                self._remove(path)
+
+    def _remove(self, path: Path) -> bool:
+        """Remove a file, ignoring errors.
+
+        Returns:
+            True if the file was removed.
+        """
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
@@ -1,9 +1,15 @@
 """AI-powered change analysis for GitCo."""
 
+import hashlib
+import json
 import os
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Optional
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from string import Template
+from typing import Any, Callable, Optional
 
 import openai
 import requests
@@ -12,6 +18,7 @@ from rich.panel import Panel
 from ..prompts import PromptManager
 from ..utils.common import (
     console,
+    estimate_tokens,
     get_logger,
 )
 from ..utils.exception import (
@@ -20,8 +27,13 @@ from ..utils.exception import (
     ReadTimeoutError,
     RequestTimeoutError,
 )
-from ..utils.rate_limiter import RateLimitedAPIClient, get_rate_limiter
+from ..utils.rate_limiter import (
+    RateLimitedAPIClient,
+    get_rate_limiter,
+    get_token_budget,
+)
 from ..utils.retry import TIMEOUT_AWARE_RETRY_CONFIG, with_retry
+from .analysis_cache import AnalysisCache
 from .config import Config, Repository
 from .detector import (
     BreakingChange,
@@ -30,7 +42,15 @@ from .detector import (
     SecurityDeprecationDetector,
     SecurityUpdate,
 )
+from .diff_parser import DiffHunk
 from .git_ops import GitRepository
+from .json_stream import IncrementalJSONObjectParser, parse_json_object
+
+# Summary used when the LLM response could not be parsed; never cached
+PARSE_FAILED_SUMMARY = "Analysis completed (parsing failed)"
+
+# Callback receiving each analysis field as soon as it is available
+FieldCallback = Callable[[str, Any], None]
 
 
 @dataclass
@@ -59,6 +79,89 @@ class AnalysisRequest:
     diff_content: str
     commit_messages: list[str]
     custom_prompt: Optional[str] = None
+    # Every hunk read while condensing diff_content; detectors use these
+    # instead of re-parsing the condensed text
+    diff_hunks: Optional[list[DiffHunk]] = None
+
+
+# Detailed detection fields of ChangeAnalysis and their record types
+_DETAIL_TYPES: dict[str, type] = {
+    "detailed_breaking_changes": BreakingChange,
+    "detailed_security_updates": SecurityUpdate,
+    "detailed_deprecations": Deprecation,
+}
+
+
+def _analysis_to_payload(
+    analysis: ChangeAnalysis, include_details: bool = False
+) -> dict[str, Any]:
+    """Convert an analysis into a JSON-serializable cache payload.
+
+    Args:
+        analysis: Analysis to convert.
+        include_details: Whether to include the detailed detections.
+
+    Returns:
+        Payload dictionary.
+    """
+    payload: dict[str, Any] = {
+        "summary": analysis.summary,
+        "breaking_changes": analysis.breaking_changes,
+        "new_features": analysis.new_features,
+        "bug_fixes": analysis.bug_fixes,
+        "security_updates": analysis.security_updates,
+        "deprecations": analysis.deprecations,
+        "recommendations": analysis.recommendations,
+        "confidence": analysis.confidence,
+    }
+    if include_details:
+        for field_name in _DETAIL_TYPES:
+            details = getattr(analysis, field_name) or []
+            payload[field_name] = [asdict(detail) for detail in details]
+    return payload
+
+
+def _analysis_from_payload(payload: dict[str, Any]) -> ChangeAnalysis:
+    """Rebuild an analysis from a cache payload.
+
+    Args:
+        payload: Payload produced by ``_analysis_to_payload``.
+
+    Returns:
+        Rebuilt analysis.
+
+    Raises:
+        TypeError: If the payload does not match the analysis fields.
+    """
+    data = dict(payload)
+    for field_name, detail_type in _DETAIL_TYPES.items():
+        if data.get(field_name) is not None:
+            data[field_name] = [detail_type(**detail) for detail in data[field_name]]
+    return ChangeAnalysis(**data)
+
+
+def _merge_unique(lists: list[list[str]]) -> list[str]:
+    """Concatenate lists of strings, dropping case-insensitive duplicates."""
+    seen: set[str] = set()
+    merged = []
+    for items in lists:
+        for item in items:
+            key = item.strip().casefold()
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(item)
+    return merged
+
+
+# Titles and border styles of list fields shown by display_analysis
+_LIST_PANELS: dict[str, tuple[str, str]] = {
+    "breaking_changes": ("🚨 Breaking Changes", "red"),
+    "new_features": ("✨ New Features", "green"),
+    "bug_fixes": ("🐛 Bug Fixes", "yellow"),
+    "security_updates": ("🔒 Security Updates", "red"),
+    "deprecations": ("⚠️ Deprecations", "yellow"),
+    "recommendations": ("💡 Recommendations", "cyan"),
+}
 
 
 class BaseAnalyzer(ABC):
@@ -80,6 +183,7 @@ class BaseAnalyzer(ABC):
         self.breaking_detector = BreakingChangeDetector()
         self.security_deprecation_detector = SecurityDeprecationDetector()
         self.prompt_manager = PromptManager()
+        self.cache: Optional[AnalysisCache] = None
 
     @abstractmethod
     def _call_llm_api(self, prompt: str, system_prompt: str) -> str:
@@ -97,6 +201,54 @@ class BaseAnalyzer(ABC):
         """
         pass
 
+    def _call_llm_api_streaming(
+        self, prompt: str, system_prompt: str, on_field: FieldCallback
+    ) -> dict[str, Any]:
+        """Call the LLM API, reporting response fields as they complete.
+
+        Providers without streaming support get the whole response at once
+        and report all fields when it arrives.
+
+        Args:
+            prompt: The user prompt to send to the LLM.
+            system_prompt: The system prompt to send to the LLM.
+            on_field: Called with each top-level response field and its value.
+
+        Returns:
+            Parsed response fields, or the raw response under ``"_raw"`` if
+            it did not contain a complete JSON object.
+
+        Raises:
+            Exception: If the API call fails.
+        """
+        return self._consume_response_chunks(
+            [self._call_llm_api(prompt, system_prompt)], on_field
+        )
+
+    def _consume_response_chunks(
+        self, chunks: Any, on_field: FieldCallback
+    ) -> dict[str, Any]:
+        """Incrementally parse response text chunks.
+
+        Args:
+            chunks: Iterable of response text pieces.
+            on_field: Called with each top-level response field and its value.
+
+        Returns:
+            Parsed response fields, or the raw response under ``"_raw"`` if
+            it did not contain a complete JSON object.
+        """
+        parser = IncrementalJSONObjectParser()
+        raw_parts = []
+        for chunk in chunks:
+            raw_parts.append(chunk)
+            for key, value in parser.feed(chunk):
+                on_field(key, value)
+
+        if parser.complete:
+            return parser.fields
+        return {"_raw": "".join(raw_parts)}
+
     def _get_api_name(self) -> str:
         """Get the name of the API being used.
 
@@ -106,11 +258,15 @@ class BaseAnalyzer(ABC):
         api_name: str = "OpenAI"
         return api_name
 
-    def analyze_changes(self, request: AnalysisRequest) -> ChangeAnalysis:
+    def analyze_changes(
+        self, request: AnalysisRequest, on_field: Optional[FieldCallback] = None
+    ) -> ChangeAnalysis:
         """Analyze changes using AI.
 
         Args:
             request: Analysis request containing repository and change data.
+            on_field: Optional callback receiving each analysis field as soon
+                as it is available, streaming the LLM response if supported.
 
         Returns:
             Analysis result with summary and categorized changes.
@@ -121,16 +277,16 @@ class BaseAnalyzer(ABC):
         try:
             # Detect breaking changes, security updates, and deprecations
             detected_breaking_changes = self.breaking_detector.detect_breaking_changes(
-                request.diff_content, request.commit_messages
+                request.diff_content, request.commit_messages, request.diff_hunks
             )
             detected_security_updates = (
                 self.security_deprecation_detector.detect_security_updates(
-                    request.diff_content, request.commit_messages
+                    request.diff_content, request.commit_messages, request.diff_hunks
                 )
             )
             detected_deprecations = (
                 self.security_deprecation_detector.detect_deprecations(
-                    request.diff_content, request.commit_messages
+                    request.diff_content, request.commit_messages, request.diff_hunks
                 )
             )
 
@@ -145,11 +301,40 @@ class BaseAnalyzer(ABC):
             # Get system prompt
             system_prompt = self._get_system_prompt()
 
-            # Call LLM API
-            response = self._call_llm_api(prompt, system_prompt)
-
-            # Parse response
-            analysis = self._parse_analysis_response(response)
+            # Reuse a previous analysis of the exact same request
+            cache_key = AnalysisCache.make_key(self.model, system_prompt, prompt)
+            analysis = self._get_cached_analysis(cache_key)
+
+            if analysis is None:
+                if on_field is None:
+                    # Call LLM API
+                    response = self._call_llm_api(prompt, system_prompt)
+
+                    # Parse response
+                    analysis = self._parse_analysis_response(response)
+                else:
+                    reported: set[str] = set()
+
+                    def report_field(key: str, value: Any) -> None:
+                        reported.add(key)
+                        on_field(key, value)
+
+                    fields = self._call_llm_api_streaming(
+                        prompt, system_prompt, report_field
+                    )
+                    if "_raw" in fields:
+                        # The response was not one complete JSON object, so
+                        # report the fields only parsing it could recover
+                        analysis = self._parse_analysis_response(fields["_raw"])
+                        for key, value in _analysis_to_payload(analysis).items():
+                            if key not in reported:
+                                on_field(key, value)
+                    else:
+                        analysis = self._analysis_from_fields(fields)
+                self._cache_analysis(cache_key, analysis)
+            elif on_field is not None:
+                for key, value in _analysis_to_payload(analysis).items():
+                    on_field(key, value)
 
             # Add detailed detections
             analysis.detailed_breaking_changes = detected_breaking_changes
@@ -162,6 +347,46 @@ class BaseAnalyzer(ABC):
             self.logger.error(f"Analysis failed: {e}")
             raise
 
+    def _get_cached_analysis(self, cache_key: str) -> Optional[ChangeAnalysis]:
+        """Load a cached analysis for the given request key.
+
+        Args:
+            cache_key: Key built from the model and prompts.
+
+        Returns:
+            Cached analysis, or None on a cache miss.
+        """
+        if self.cache is None:
+            return None
+
+        payload = self.cache.get(cache_key)
+        if payload is None:
+            return None
+
+        try:
+            analysis = _analysis_from_payload(payload)
+        except TypeError as e:
+            self.logger.debug(f"Ignoring incompatible cached analysis: {e}")
+            return None
+
+        self.logger.debug(f"Using cached {self._get_api_name()} analysis")
+        return analysis
+
+    def _cache_analysis(self, cache_key: str, analysis: ChangeAnalysis) -> None:
+        """Store a parsed analysis in the cache.
+
+        Detailed detections are not stored; they are cheap to recompute and
+        are attached to every result by ``analyze_changes``.
+
+        Args:
+            cache_key: Key built from the model and prompts.
+            analysis: Parsed analysis to store.
+        """
+        if self.cache is None or analysis.summary == PARSE_FAILED_SUMMARY:
+            return
+
+        self.cache.put(cache_key, _analysis_to_payload(analysis))
+
     def _build_analysis_prompt(
         self,
         request: AnalysisRequest,
@@ -249,22 +474,12 @@ Always respond with valid JSON as specified in the user prompt."""
         """
         try:
             parsed = self._parse_text_response(response)
-
-            return ChangeAnalysis(
-                summary=parsed.get("summary", "No summary provided"),
-                breaking_changes=parsed.get("breaking_changes", []),
-                new_features=parsed.get("new_features", []),
-                bug_fixes=parsed.get("bug_fixes", []),
-                security_updates=parsed.get("security_updates", []),
-                deprecations=parsed.get("deprecations", []),
-                recommendations=parsed.get("recommendations", []),
-                confidence=parsed.get("confidence", 0.5),
-            )
+            return self._analysis_from_fields(parsed)
         except Exception as e:
             self.logger.warning(f"Failed to parse LLM response: {e}")
             # Return a basic analysis
             return ChangeAnalysis(
-                summary="Analysis completed (parsing failed)",
+                summary=PARSE_FAILED_SUMMARY,
                 breaking_changes=[],
                 new_features=[],
                 bug_fixes=[],
@@ -274,6 +489,26 @@ Always respond with valid JSON as specified in the user prompt."""
                 confidence=0.3,
             )
 
+    def _analysis_from_fields(self, parsed: dict[str, Any]) -> ChangeAnalysis:
+        """Build an analysis from parsed response fields.
+
+        Args:
+            parsed: Parsed response fields.
+
+        Returns:
+            Analysis result with defaults for missing fields.
+        """
+        return ChangeAnalysis(
+            summary=parsed.get("summary", "No summary provided"),
+            breaking_changes=parsed.get("breaking_changes", []),
+            new_features=parsed.get("new_features", []),
+            bug_fixes=parsed.get("bug_fixes", []),
+            security_updates=parsed.get("security_updates", []),
+            deprecations=parsed.get("deprecations", []),
+            recommendations=parsed.get("recommendations", []),
+            confidence=parsed.get("confidence", 0.5),
+        )
+
     def _parse_text_response(self, response: str) -> dict[str, Any]:
         """Parse text response from LLM.
 
@@ -286,14 +521,11 @@ Always respond with valid JSON as specified in the user prompt."""
         import json
         import re
 
-        # Try to extract JSON from the response
-        json_match = re.search(r"\{.*\}", response, re.DOTALL)
-        if json_match:
-            try:
-                json_result: dict[str, Any] = json.loads(json_match.group())
-                return json_result
-            except json.JSONDecodeError:
-                pass
+        # Try to extract the first JSON object from the response
+        try:
+            return parse_json_object(response)
+        except ValueError:
+            pass
 
         # If JSON extraction fails, try to parse the entire response
         try:
@@ -431,6 +663,8 @@ class OpenAIAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
         timeout: int = 30,
         connect_timeout: Optional[int] = None,
         read_timeout: Optional[int] = None,
+        max_tokens: int = 4000,
+        tokens_per_minute: int = 90000,
     ):
         """Initialize OpenAI analyzer.
 
@@ -441,12 +675,16 @@ class OpenAIAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
             timeout: Request timeout in seconds
             connect_timeout: Connection timeout in seconds
             read_timeout: Read timeout in seconds
+            max_tokens: Maximum completion tokens per request
+            tokens_per_minute: Token budget shared by all OpenAI requests
         """
         super().__init__(model)
 
-        # Initialize rate limiter
+        # Initialize rate limiter and token budget
         rate_limiter = get_rate_limiter("openai")
         RateLimitedAPIClient.__init__(self, rate_limiter)
+        self.token_budget = get_token_budget("openai", tokens_per_minute)
+        self.max_tokens = max_tokens
 
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -481,9 +719,70 @@ class OpenAIAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
             NetworkTimeoutError: When network operation times out
             Exception: If the API call fails.
         """
+        response = self._create_completion(prompt, system_prompt)
+
+        # Log token usage
+        if hasattr(response, "usage") and response.usage:
+            self.logger.debug(f"OpenAI API call: {response.usage.total_tokens} tokens")
+
+        return response.choices[0].message.content or ""
+
+    def _call_llm_api_streaming(
+        self, prompt: str, system_prompt: str, on_field: FieldCallback
+    ) -> dict[str, Any]:
+        """Stream the completion, reporting response fields as they complete.
+
+        Only opening the stream is retried; once fields have been reported a
+        retry would report them twice.
+
+        Args:
+            prompt: The user prompt to send to the LLM.
+            system_prompt: The system prompt to send to the LLM.
+            on_field: Called with each top-level response field and its value.
+
+        Returns:
+            Parsed response fields, or the raw response under ``"_raw"`` if
+            it did not contain a complete JSON object.
+
+        Raises:
+            NetworkTimeoutError: When network operation times out
+            Exception: If the API call fails.
+        """
+        stream = self._create_completion(prompt, system_prompt, stream=True)
+        return self._consume_response_chunks(self._iter_stream_text(stream), on_field)
+
+    def _iter_stream_text(self, stream: Any) -> Iterator[str]:
+        """Yield the text deltas of a streamed chat completion."""
+        for chunk in stream:
+            if chunk.choices:
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
+
+    def _create_completion(
+        self, prompt: str, system_prompt: str, stream: bool = False
+    ) -> Any:
+        """Send a chat completion request under the rate limits.
+
+        Args:
+            prompt: The user prompt to send to the LLM.
+            system_prompt: The system prompt to send to the LLM.
+            stream: Whether to request a streamed response.
+
+        Returns:
+            The completion, or a stream of completion chunks.
+
+        Raises:
+            NetworkTimeoutError: When network operation times out
+            Exception: If the API call fails.
+        """
+        # Completion tokens count against the budget up to max_tokens
+        estimated_tokens = estimate_tokens(system_prompt + prompt) + self.max_tokens
+
         try:
 
             def make_openai_request() -> Any:
+                self.token_budget.acquire(estimated_tokens)
                 return self.client.chat.completions.create(
                     model=self.model,
                     messages=[
@@ -491,19 +790,12 @@ class OpenAIAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
                         {"role": "user", "content": prompt},
                     ],
                     temperature=0.1,
-                    max_tokens=4000,
+                    max_tokens=self.max_tokens,
                     timeout=self.timeout,
+                    stream=stream,
                 )
 
-            response = self.make_rate_limited_request(make_openai_request)
-
-            # Log token usage
-            if hasattr(response, "usage") and response.usage:
-                self.logger.debug(
-                    f"OpenAI API call: {response.usage.total_tokens} tokens"
-                )
-
-            return response.choices[0].message.content or ""
+            return self.make_rate_limited_request(make_openai_request)
 
         except requests.exceptions.ConnectTimeout as e:
             raise ConnectionTimeoutError(
@@ -542,6 +834,166 @@ class OpenAIAnalyzer(BaseAnalyzer, RateLimitedAPIClient):
         return "OpenAI"
 
 
+class LocalAnalyzer(BaseAnalyzer):
+    """Deterministic offline analyzer.
+
+    Answers without any network access, after an optional artificial delay,
+    so that the analysis pipeline itself (detection, prompt building,
+    parsing and caching) can be exercised and benchmarked reproducibly.
+
+    By default the response echoes the detections listed in the prompt. A
+    ``string.Template`` response can be supplied instead; it may reference
+    ``$repository``, ``$commit_count``, ``$prompt_chars``,
+    ``$prompt_tokens`` and ``$digest`` (a short hash of the prompt).
+    """
+
+    def __init__(
+        self,
+        model: str = "local",
+        response_template: Optional[str] = None,
+        latency: float = 0.0,
+    ):
+        """Initialize local analyzer.
+
+        Args:
+            model: Model name reported for caching.
+            response_template: Optional response template.
+            latency: Artificial response delay in seconds.
+        """
+        super().__init__(model)
+        self.response_template = response_template
+        self.latency = latency
+
+    def _call_llm_api(self, prompt: str, system_prompt: str) -> str:
+        """Produce a deterministic response for the prompt.
+
+        Args:
+            prompt: The user prompt.
+            system_prompt: The system prompt (ignored).
+
+        Returns:
+            The response text.
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        commit_messages = self._prompt_section_items(prompt, "Recent Commit Messages:")
+        values = {
+            "repository": self._prompt_value(prompt, "Repository:"),
+            "commit_count": len(commit_messages),
+            "prompt_chars": len(prompt),
+            "prompt_tokens": estimate_tokens(prompt),
+            "digest": hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12],
+        }
+        if self.response_template is not None:
+            return Template(self.response_template).safe_substitute(values)
+
+        return json.dumps(
+            {
+                "summary": (
+                    f"Local analysis of {values['commit_count']} commits in "
+                    f"{values['repository']} ({values['digest']})"
+                ),
+                "breaking_changes": self._prompt_section_items(
+                    prompt, "Detected Breaking Changes:"
+                ),
+                "new_features": [],
+                "bug_fixes": [],
+                "security_updates": self._prompt_section_items(
+                    prompt, "Detected Security Updates:"
+                ),
+                "deprecations": self._prompt_section_items(
+                    prompt, "Detected Deprecations:"
+                ),
+                "recommendations": [],
+                "confidence": 0.5,
+            }
+        )
+
+    def _prompt_value(self, prompt: str, label: str) -> str:
+        """Get the value of the first ``label value`` line of the prompt."""
+        for line in prompt.splitlines():
+            if line.startswith(label):
+                return line[len(label) :].strip()
+        return ""
+
+    def _prompt_section_items(self, prompt: str, header: str) -> list[str]:
+        """Get the ``- item`` lines following a section header of the prompt."""
+        _, found, rest = prompt.partition(f"\n{header}\n")
+        if not found:
+            return []
+
+        items = []
+        for line in rest.splitlines():
+            if not line.startswith("- "):
+                break
+            items.append(line[2:])
+        return items
+
+    def _get_api_name(self) -> str:
+        """Get the name of the API provider.
+
+        Returns:
+            The name of the API provider (Local).
+        """
+        return "Local"
+
+
+# Factory creating a configured analyzer for a provider
+AnalyzerFactory = Callable[[Config], BaseAnalyzer]
+
+_analyzer_factories: dict[str, AnalyzerFactory] = {}
+
+
+def register_analyzer(provider: str, factory: AnalyzerFactory) -> None:
+    """Register an LLM provider for ``ChangeAnalyzer.get_analyzer``.
+
+    Args:
+        provider: Provider name used in settings.llm_provider.
+        factory: Callable creating an analyzer from the configuration.
+    """
+    _analyzer_factories[provider] = factory
+
+
+def get_analyzer_providers() -> list[str]:
+    """Get the names of all registered LLM providers.
+
+    Returns:
+        Sorted provider names.
+    """
+    return sorted(_analyzer_factories)
+
+
+def _create_openai_analyzer(config: Config) -> BaseAnalyzer:
+    """Create the OpenAI analyzer from configuration."""
+    return OpenAIAnalyzer(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        model="gpt-3.5-turbo",
+        base_url=config.settings.llm_openai_api_url,
+        timeout=30,
+        connect_timeout=None,
+        read_timeout=None,
+        max_tokens=config.settings.max_tokens_per_request,
+        tokens_per_minute=config.settings.llm_tokens_per_minute,
+    )
+
+
+def _create_local_analyzer(config: Config) -> BaseAnalyzer:
+    """Create the local analyzer from configuration."""
+    response_template = None
+    if config.settings.llm_local_response_file:
+        with open(os.path.expanduser(config.settings.llm_local_response_file)) as f:
+            response_template = f.read()
+    return LocalAnalyzer(
+        response_template=response_template,
+        latency=config.settings.llm_local_latency,
+    )
+
+
+register_analyzer("openai", _create_openai_analyzer)
+register_analyzer("local", _create_local_analyzer)
+
+
 class ChangeAnalyzer:
     """Main change analyzer that coordinates different LLM providers."""
 
@@ -556,12 +1008,20 @@ class ChangeAnalyzer:
         self.analyzers: dict[str, BaseAnalyzer] = {}
         self.breaking_change_detector = BreakingChangeDetector()
         self.security_deprecation_detector = SecurityDeprecationDetector()
+        self.analysis_cache: Optional[AnalysisCache] = (
+            AnalysisCache(
+                ttl_seconds=config.settings.llm_cache_ttl_hours * 3600,
+                max_entries=config.settings.llm_cache_max_entries,
+            )
+            if config.settings.llm_cache_enabled
+            else None
+        )
 
     def get_analyzer(self, provider: str = "openai") -> BaseAnalyzer:
         """Get analyzer for the specified provider.
 
         Args:
-            provider: Provider name (only "openai" is supported).
+            provider: Registered provider name (e.g. "openai" or "local").
 
         Returns:
             Configured analyzer instance.
@@ -572,28 +1032,26 @@ class ChangeAnalyzer:
         if provider in self.analyzers:
             return self.analyzers[provider]
 
-        if provider == "openai":
-            openai_analyzer: BaseAnalyzer = OpenAIAnalyzer(
-                api_key=os.getenv("OPENAI_API_KEY"),
-                model="gpt-3.5-turbo",
-                base_url=self.config.settings.llm_openai_api_url,
-                timeout=30,
-                connect_timeout=None,
-                read_timeout=None,
-            )
-            self.analyzers[provider] = openai_analyzer
-            return openai_analyzer
-        else:
+        factory = _analyzer_factories.get(provider)
+        if factory is None:
             raise ValueError(
-                f"Unsupported LLM provider: {provider}. Only 'openai' is supported."
+                f"Unsupported LLM provider: {provider}. Supported providers: "
+                f"{', '.join(get_analyzer_providers())}."
             )
 
+        analyzer = factory(self.config)
+        analyzer.cache = self.analysis_cache
+        self.analyzers[provider] = analyzer
+        return analyzer
+
     def analyze_repository_changes(
         self,
         repository: Repository,
         git_repo: GitRepository,
         custom_prompt: Optional[str] = None,
         provider: Optional[str] = None,
+        stream: bool = False,
+        num_commits: int = 10,
     ) -> Optional[ChangeAnalysis]:
         """Analyze changes in a repository.
 
@@ -602,14 +1060,22 @@ class ChangeAnalyzer:
             git_repo: Git repository instance.
             custom_prompt: Custom prompt for analysis.
             provider: LLM provider to use.
+            stream: Stream the LLM response and display each analysis field
+                as soon as it completes.
+            num_commits: Number of recent commits to analyze.
 
         Returns:
             Analysis result or None if analysis fails.
         """
         try:
-            # Get recent changes
-            diff_content = git_repo.get_recent_changes()
-            commit_messages = git_repo.get_recent_commit_messages()
+            # Get recent changes, keeping the hunks for the detectors
+            diff_hunks: list[DiffHunk] = []
+            diff_content = git_repo.get_recent_changes(
+                num_commits,
+                token_budget=self.config.settings.diff_token_budget,
+                on_hunk=diff_hunks.append,
+            )
+            commit_messages = git_repo.get_recent_commit_messages(num_commits)
 
             if not diff_content and not commit_messages:
                 self.logger.info(f"No changes to analyze for {repository.name}")
@@ -622,6 +1088,7 @@ class ChangeAnalyzer:
                 diff_content=diff_content,
                 commit_messages=commit_messages,
                 custom_prompt=custom_prompt,
+                diff_hunks=diff_hunks,
             )
 
             # Get analyzer
@@ -629,7 +1096,8 @@ class ChangeAnalyzer:
             analyzer = self.get_analyzer(analyzer_provider)
 
             # Perform analysis
-            analysis = analyzer.analyze_changes(request)
+            on_field = self._field_display_callback(repository.name) if stream else None
+            analysis = analyzer.analyze_changes(request, on_field)
 
             return analysis
 
@@ -637,6 +1105,269 @@ class ChangeAnalyzer:
             self.logger.error(f"Failed to analyze changes for {repository.name}: {e}")
             return None
 
+    def analyze_repositories(
+        self,
+        targets: list[tuple[Repository, GitRepository]],
+        custom_prompt: Optional[str] = None,
+        provider: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        stream: bool = False,
+        num_commits: int = 10,
+    ) -> Iterator[tuple[Repository, Optional[ChangeAnalysis]]]:
+        """Analyze several repositories concurrently.
+
+        Up to ``max_workers`` analyses run at once. Their LLM requests still
+        go through the provider's shared rate limiter and token budget, so
+        concurrency only overlaps the time spent waiting on responses.
+
+        Args:
+            targets: Repositories to analyze with their Git repository instances.
+            custom_prompt: Custom prompt for analysis.
+            provider: LLM provider to use.
+            max_workers: Maximum concurrent analyses (defaults to
+                settings.llm_max_concurrent_requests).
+            stream: Display each analysis field as soon as it completes. Every
+                panel names its repository, so concurrent analyses stay apart.
+            num_commits: Number of recent commits to analyze per repository.
+
+        Yields:
+            (repository, analysis) pairs in completion order; analysis is None
+            when there were no changes or the analysis failed.
+        """
+        if not targets:
+            return
+
+        # Create the analyzer up front so workers share a single instance
+        analyzer_provider = provider or self.config.settings.llm_provider
+        self.get_analyzer(analyzer_provider)
+
+        workers = max_workers or self.config.settings.llm_max_concurrent_requests
+        workers = max(1, min(workers, len(targets)))
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="gitco-analyze"
+        ) as executor:
+            future_to_repo = {
+                executor.submit(
+                    self.analyze_repository_changes,
+                    repository,
+                    git_repo,
+                    custom_prompt,
+                    analyzer_provider,
+                    stream=stream,
+                    num_commits=num_commits,
+                ): repository
+                for repository, git_repo in targets
+            }
+
+            try:
+                for future in as_completed(future_to_repo):
+                    # analyze_repository_changes handles its own errors
+                    yield future_to_repo[future], future.result()
+            finally:
+                # Don't start queued analyses if the consumer stops early
+                for future in future_to_repo:
+                    future.cancel()
+
+    def analyze_commit_range(
+        self,
+        repository: Repository,
+        git_repo: GitRepository,
+        commit_range: Optional[str] = None,
+        custom_prompt: Optional[str] = None,
+        provider: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Optional[ChangeAnalysis]:
+        """Analyze a large commit range with map-reduce over commit chunks.
+
+        The range is split into chunks of consecutive commits, counted from
+        the oldest, so new commits only change the last chunk. Chunks are
+        analyzed concurrently (map) and the partial analyses are merged into
+        one result (reduce). Chunk results are cached by their commit hashes,
+        so re-analyzing after a few new commits only processes new chunks.
+
+        Args:
+            repository: Repository configuration.
+            git_repo: Git repository instance.
+            commit_range: Git revision range; defaults to the commits on HEAD
+                that are not on the origin default branch.
+            custom_prompt: Custom prompt for analysis.
+            provider: LLM provider to use.
+            chunk_size: Commits per chunk (defaults to
+                settings.analysis_chunk_commits).
+            max_workers: Maximum concurrent chunk analyses (defaults to
+                settings.llm_max_concurrent_requests).
+
+        Returns:
+            Merged analysis result or None if analysis fails.
+        """
+        try:
+            commits = git_repo.get_range_commits(commit_range)
+            if not commits:
+                self.logger.info(f"No commits to analyze for {repository.name}")
+                return None
+
+            size = max(1, chunk_size or self.config.settings.analysis_chunk_commits)
+            chunks = [commits[i : i + size] for i in range(0, len(commits), size)]
+
+            analyzer_provider = provider or self.config.settings.llm_provider
+            analyzer = self.get_analyzer(analyzer_provider)
+
+            workers = max_workers or self.config.settings.llm_max_concurrent_requests
+            workers = max(1, min(workers, len(chunks)))
+
+            results: list[Optional[ChangeAnalysis]] = [None] * len(chunks)
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="gitco-analyze"
+            ) as executor:
+                future_to_index = {
+                    executor.submit(
+                        self._analyze_commit_chunk,
+                        analyzer,
+                        repository,
+                        git_repo,
+                        chunk,
+                        custom_prompt,
+                    ): index
+                    for index, chunk in enumerate(chunks)
+                }
+                for future in as_completed(future_to_index):
+                    results[future_to_index[future]] = future.result()
+
+            partials = [
+                (chunk, analysis)
+                for chunk, analysis in zip(chunks, results)
+                if analysis is not None
+            ]
+            if not partials:
+                return None
+
+            return self._merge_chunk_analyses(partials)
+
+        except Exception as e:
+            self.logger.error(
+                f"Failed to analyze commit range for {repository.name}: {e}"
+            )
+            return None
+
+    def _analyze_commit_chunk(
+        self,
+        analyzer: BaseAnalyzer,
+        repository: Repository,
+        git_repo: GitRepository,
+        chunk: list[tuple[str, str]],
+        custom_prompt: Optional[str],
+    ) -> Optional[ChangeAnalysis]:
+        """Analyze one chunk of commits, reusing a cached result if possible.
+
+        Args:
+            analyzer: Analyzer to use.
+            repository: Repository configuration.
+            git_repo: Git repository instance.
+            chunk: (commit hash, subject) tuples, oldest first.
+            custom_prompt: Custom prompt for analysis.
+
+        Returns:
+            Chunk analysis, or None if it failed.
+        """
+        commit_hashes = [commit_hash for commit_hash, _ in chunk]
+        token_budget = self.config.settings.diff_token_budget
+
+        # Commit hashes pin the chunk content, so the diff need not be read
+        cache_key = AnalysisCache.make_key(
+            analyzer.model,
+            analyzer._get_system_prompt(),
+            "\0".join(
+                ["chunk", str(token_budget), custom_prompt or ""] + commit_hashes
+            ),
+        )
+        if self.analysis_cache is not None:
+            payload = self.analysis_cache.get(cache_key)
+            if payload is not None:
+                try:
+                    return _analysis_from_payload(payload)
+                except TypeError as e:
+                    self.logger.debug(f"Ignoring incompatible cached chunk: {e}")
+
+        try:
+            diff_hunks: list[DiffHunk] = []
+            request = AnalysisRequest(
+                repository=repository,
+                git_repo=git_repo,
+                diff_content=git_repo.get_commits_diff(
+                    commit_hashes, token_budget, on_hunk=diff_hunks.append
+                ),
+                commit_messages=[subject for _, subject in chunk],
+                custom_prompt=custom_prompt,
+                diff_hunks=diff_hunks,
+            )
+            analysis = analyzer.analyze_changes(request)
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to analyze {len(chunk)} commits from {commit_hashes[0][:7]} "
+                f"in {repository.name}: {e}"
+            )
+            return None
+
+        if self.analysis_cache is not None and analysis.summary != PARSE_FAILED_SUMMARY:
+            self.analysis_cache.put(
+                cache_key, _analysis_to_payload(analysis, include_details=True)
+            )
+        return analysis
+
+    def _merge_chunk_analyses(
+        self, partials: list[tuple[list[tuple[str, str]], ChangeAnalysis]]
+    ) -> ChangeAnalysis:
+        """Merge per-chunk analyses into a single analysis.
+
+        Args:
+            partials: (chunk commits, chunk analysis) pairs, oldest chunk first.
+
+        Returns:
+            Merged analysis.
+        """
+        if len(partials) == 1:
+            return partials[0][1]
+
+        analyses = [analysis for _, analysis in partials]
+        total_commits = sum(len(chunk) for chunk, _ in partials)
+
+        summary_lines = [f"Analyzed {total_commits} commits in {len(partials)} chunks:"]
+        for chunk, analysis in partials:
+            summary_lines.append(
+                f"- {chunk[0][0][:7]}..{chunk[-1][0][:7]} ({len(chunk)} commits): "
+                f"{analysis.summary}"
+            )
+
+        merged_details: dict[str, list[Any]] = {}
+        for field_name in _DETAIL_TYPES:
+            seen: set[tuple[str, str]] = set()
+            details = []
+            for analysis in analyses:
+                for detail in getattr(analysis, field_name) or []:
+                    key = (detail.type, detail.description)
+                    if key not in seen:
+                        seen.add(key)
+                        details.append(detail)
+            merged_details[field_name] = details
+
+        return ChangeAnalysis(
+            summary="\n".join(summary_lines),
+            breaking_changes=_merge_unique([a.breaking_changes for a in analyses]),
+            new_features=_merge_unique([a.new_features for a in analyses]),
+            bug_fixes=_merge_unique([a.bug_fixes for a in analyses]),
+            security_updates=_merge_unique([a.security_updates for a in analyses]),
+            deprecations=_merge_unique([a.deprecations for a in analyses]),
+            recommendations=_merge_unique([a.recommendations for a in analyses]),
+            # Weight each chunk's confidence by the commits it covers
+            confidence=sum(
+                analysis.confidence * len(chunk) for chunk, analysis in partials
+            )
+            / total_commits,
+            **merged_details,
+        )
+
     def analyze_specific_commit(
         self,
         repository: Repository,
@@ -894,136 +1625,141 @@ class ChangeAnalyzer:
             analysis: Analysis result to display.
             repository_name: Name of the repository.
         """
-        # Create summary panel
-        summary_panel = Panel(
-            analysis.summary,
-            title=f"📊 Analysis Summary - {repository_name}",
-            border_style="blue",
-        )
-        console.print(summary_panel)
-
-        # Display breaking changes
-        if analysis.breaking_changes:
-            breaking_panel = Panel(
-                "\n".join(f"• {change}" for change in analysis.breaking_changes),
-                title="🚨 Breaking Changes",
-                border_style="red",
-            )
-            console.print(breaking_panel)
-
-        # Display new features
-        if analysis.new_features:
-            features_panel = Panel(
-                "\n".join(f"• {feature}" for feature in analysis.new_features),
-                title="✨ New Features",
-                border_style="green",
-            )
-            console.print(features_panel)
-
-        # Display bug fixes
-        if analysis.bug_fixes:
-            fixes_panel = Panel(
-                "\n".join(f"• {fix}" for fix in analysis.bug_fixes),
-                title="🐛 Bug Fixes",
-                border_style="yellow",
+        for field_name, value in _analysis_to_payload(analysis).items():
+            self._display_analysis_field(field_name, value, repository_name)
+
+    def _field_display_callback(self, repository_name: str) -> FieldCallback:
+        """Create a callback displaying streamed analysis fields.
+
+        Args:
+            repository_name: Name of the repository.
+
+        Returns:
+            Callback for ``BaseAnalyzer.analyze_changes``.
+        """
+
+        def display_field(field_name: str, value: Any) -> None:
+            self._display_analysis_field(field_name, value, repository_name)
+
+        return display_field
+
+    def _display_analysis_field(
+        self, field_name: str, value: Any, repository_name: str
+    ) -> None:
+        """Display a single analysis field as a panel.
+
+        Fields are rendered independently so that streamed analyses can show
+        each one as soon as it arrives. Unknown fields and values of the
+        wrong type are ignored.
+
+        Args:
+            field_name: Analysis field name.
+            value: Field value.
+            repository_name: Name of the repository.
+        """
+        if field_name == "summary":
+            # Create summary panel
+            summary_panel = Panel(
+                str(value),
+                title=f"📊 Analysis Summary - {repository_name}",
+                border_style="blue",
             )
-            console.print(fixes_panel)
-
-        # Display security updates
-        if analysis.security_updates:
-            security_panel = Panel(
-                "\n".join(f"• {update}" for update in analysis.security_updates),
-                title="🔒 Security Updates",
-                border_style="red",
+            console.print(summary_panel)
+
+        elif field_name in _LIST_PANELS:
+            if not value or not isinstance(value, list):
+                return
+            title, border_style = _LIST_PANELS[field_name]
+            list_panel = Panel(
+                "\n".join(f"• {item}" for item in value),
+                title=f"{title} - {repository_name}",
+                border_style=border_style,
             )
-            console.print(security_panel)
-
-        # Display deprecations
-        if analysis.deprecations:
-            deprecations_panel = Panel(
-                "\n".join(f"• {dep}" for dep in analysis.deprecations),
-                title="⚠️ Deprecations",
-                border_style="yellow",
+            console.print(list_panel)
+
+        elif field_name == "confidence":
+            if not isinstance(value, (int, float)):
+                return
+            # Display confidence
+            confidence_color = (
+                "green" if value > 0.7 else "yellow" if value > 0.4 else "red"
             )
-            console.print(deprecations_panel)
-
-        # Display recommendations
-        if analysis.recommendations:
-            recommendations_panel = Panel(
-                "\n".join(f"• {rec}" for rec in analysis.recommendations),
-                title="💡 Recommendations",
-                border_style="cyan",
+            confidence_panel = Panel(
+                f"Confidence: {value:.1%}",
+                title=f"🎯 Analysis Confidence - {repository_name}",
+                border_style=confidence_color,
             )
-            console.print(recommendations_panel)
-
-        # Display confidence
-        confidence_color = (
-            "green"
-            if analysis.confidence > 0.7
-            else "yellow"
-            if analysis.confidence > 0.4
-            else "red"
-        )
-        confidence_panel = Panel(
-            f"Confidence: {analysis.confidence:.1%}",
-            title="🎯 Analysis Confidence",
-            border_style=confidence_color,
-        )
-        console.print(confidence_panel)
+            console.print(confidence_panel)
 
     def detect_breaking_changes(
-        self, diff_content: str, commit_messages: list[str]
+        self,
+        diff_content: str,
+        commit_messages: list[str],
+        hunks: Optional[list[DiffHunk]] = None,
     ) -> list[BreakingChange]:
         """Detect breaking changes in code changes.
 
         Args:
             diff_content: Git diff content.
             commit_messages: List of commit messages.
+            hunks: Hunks already parsed from the diff.
 
         Returns:
             List of detected breaking changes.
         """
         try:
             detector = BreakingChangeDetector()
-            return detector.detect_breaking_changes(diff_content, commit_messages)
+            return detector.detect_breaking_changes(
+                diff_content, commit_messages, hunks
+            )
         except Exception as e:
             self.logger.error(f"Failed to detect breaking changes: {e}")
             return []
 
     def detect_security_updates(
-        self, diff_content: str, commit_messages: list[str]
+        self,
+        diff_content: str,
+        commit_messages: list[str],
+        hunks: Optional[list[DiffHunk]] = None,
     ) -> list[SecurityUpdate]:
         """Detect security updates in code changes.
 
         Args:
             diff_content: Git diff content.
             commit_messages: List of commit messages.
+            hunks: Hunks already parsed from the diff.
 
         Returns:
             List of detected security updates.
         """
         try:
             detector = SecurityDeprecationDetector()
-            return detector.detect_security_updates(diff_content, commit_messages)
+            return detector.detect_security_updates(
+                diff_content, commit_messages, hunks
+            )
         except Exception as e:
             self.logger.error(f"Failed to detect security updates: {e}")
             return []
 
     def detect_deprecations(
-        self, diff_content: str, commit_messages: list[str]
+        self,
+        diff_content: str,
+        commit_messages: list[str],
+        hunks: Optional[list[DiffHunk]] = None,
     ) -> list[Deprecation]:
         """Detect deprecations in code changes.
 
         Args:
             diff_content: Git diff content.
             commit_messages: List of commit messages.
+            hunks: Hunks already parsed from the diff.
 
         Returns:
             List of detected deprecations.
         """
         try:
             detector = SecurityDeprecationDetector()
-            return detector.detect_deprecations(diff_content, commit_messages)
+            return detector.detect_deprecations(diff_content, commit_messages, hunks)
         except Exception as e:
             self.logger.error(f"Failed to detect deprecations: {e}")
             return []
@@ -1032,20 +1768,27 @@ class ChangeAnalyzer:
         self,
         repository: Repository,
         git_repo: GitRepository,
+        num_commits: int = 10,
     ) -> dict[str, Any]:
         """Analyze changes without using LLM (pattern-based analysis).
 
         Args:
             repository: Repository configuration.
             git_repo: Git repository instance.
+            num_commits: Number of recent commits to analyze.
 
         Returns:
             Analysis result based on pattern detection.
         """
         try:
-            # Get recent changes
-            diff_content = git_repo.get_recent_changes()
-            commit_messages = git_repo.get_recent_commit_messages()
+            # Get recent changes, keeping the hunks for the detectors
+            diff_hunks: list[DiffHunk] = []
+            diff_content = git_repo.get_recent_changes(
+                num_commits,
+                token_budget=self.config.settings.diff_token_budget,
+                on_hunk=diff_hunks.append,
+            )
+            commit_messages = git_repo.get_recent_commit_messages(num_commits)
 
             if not diff_content and not commit_messages:
                 return {
@@ -1062,12 +1805,14 @@ class ChangeAnalyzer:
 
             # Detect patterns
             breaking_changes = self.detect_breaking_changes(
-                diff_content, commit_messages
+                diff_content, commit_messages, diff_hunks
             )
             security_updates = self.detect_security_updates(
-                diff_content, commit_messages
+                diff_content, commit_messages, diff_hunks
+            )
+            deprecations = self.detect_deprecations(
+                diff_content, commit_messages, diff_hunks
             )
-            deprecations = self.detect_deprecations(diff_content, commit_messages)
 
             # Categorize commits
             categories = self._categorize_commits(commit_messages)
@@ -4,10 +4,14 @@ import json
 import os
 import shutil
 import tempfile
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any, Optional
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from rich import box
 from rich.panel import Panel
@@ -26,6 +30,125 @@ from ..utils.common import (
 from ..utils.exception import BackupError, RecoveryError
 
 
+def _is_excluded(
+    name: str, relative_path: str, exclude_patterns: Sequence[str]
+) -> bool:
+    """Check whether a file or directory matches an exclusion pattern.
+
+    Args:
+        name: File or directory name
+        relative_path: Path relative to the repository root, "/"-separated
+        exclude_patterns: Glob patterns matched against the name and the path
+
+    Returns:
+        True if the entry is excluded
+    """
+    return any(
+        fnmatch(name, pattern) or fnmatch(relative_path, pattern)
+        for pattern in exclude_patterns
+    )
+
+
+def _iter_repository_files(
+    repo_path: str, include_git_history: bool, exclude_patterns: Sequence[str]
+) -> Iterator[tuple[str, str]]:
+    """Walk a repository, yielding the files to back up.
+
+    Excluded directories are pruned from the walk, so nothing below them is
+    visited. Only regular files are yielded, which skips broken symlinks,
+    sockets and FIFOs.
+
+    Args:
+        repo_path: Path to repository
+        include_git_history: Whether to include ``.git`` directories
+        exclude_patterns: Glob patterns of files and directories to leave out
+
+    Yields:
+        File path and its "/"-separated path relative to the repository
+    """
+    for root, dirs, files in os.walk(repo_path):
+        relative_root = os.path.relpath(root, repo_path)
+        prefix = (
+            "" if relative_root == "." else relative_root.replace(os.sep, "/") + "/"
+        )
+
+        dirs[:] = [
+            d
+            for d in dirs
+            if (include_git_history or d != ".git")
+            and not _is_excluded(d, prefix + d, exclude_patterns)
+        ]
+
+        for file in files:
+            file_path = os.path.join(root, file)
+            if _is_excluded(file, prefix + file, exclude_patterns):
+                continue
+            if os.path.isfile(file_path):
+                yield file_path, prefix + file
+
+
+def _add_repository_files(
+    zip_file: ZipFile,
+    repo_path: str,
+    include_git_history: bool,
+    exclude_patterns: Sequence[str],
+) -> int:
+    """Stream a repository's files into an archive under ``repositories/<name>/``.
+
+    Args:
+        zip_file: ZIP file to add repository to
+        repo_path: Path to repository
+        include_git_history: Whether to include full git history
+        exclude_patterns: Glob patterns of files and directories to leave out
+
+    Returns:
+        Total size of added files in bytes
+    """
+    repo_prefix = f"repositories/{os.path.basename(repo_path)}/"
+    total_size = 0
+
+    if os.path.isdir(repo_path):
+        # Add repository directory to archive (even if empty)
+        zip_file.write(repo_path, repo_prefix)
+
+        for file_path, relative_path in _iter_repository_files(
+            repo_path, include_git_history, exclude_patterns
+        ):
+            zip_file.write(file_path, repo_prefix + relative_path)
+            total_size += os.path.getsize(file_path)
+
+    return total_size
+
+
+def _write_repository_archive(
+    repo_path: str,
+    archive_path: str,
+    include_git_history: bool,
+    exclude_patterns: Sequence[str],
+    compression_level: int,
+) -> int:
+    """Compress one repository into its own archive.
+
+    Runs in a worker process, so it is a module-level function.
+
+    Args:
+        repo_path: Path to repository
+        archive_path: Path of the archive to write
+        include_git_history: Whether to include full git history
+        exclude_patterns: Glob patterns of files and directories to leave out
+        compression_level: ZIP compression level (0-9)
+
+    Returns:
+        Total size of the archived files in bytes
+    """
+    with ZipFile(
+        archive_path, "w", compression=ZIP_DEFLATED, compresslevel=compression_level
+    ) as zip_file:
+        return _add_repository_files(
+            zip_file, repo_path, include_git_history, exclude_patterns
+        )
+
+
 class BackupMetadata:
     """Metadata for a backup operation."""
 
@@ -157,9 +280,19 @@ class BackupManager:
         description: Optional[str] = None,
         include_git_history: bool = True,
         compression_level: int = 6,
+        exclude_patterns: Optional[list[str]] = None,
+        split_archives: bool = False,
+        max_workers: Optional[int] = None,
     ) -> tuple[str, BackupMetadata]:
         """Create a backup of repositories and configuration.
 
+        Each repository is compressed into its own archive by a pool of
+        worker processes. By default the finished archives are stored in the
+        backup archive as they arrive, without being compressed again; with
+        ``split_archives`` they are kept as separate files in a directory
+        named after the backup instead. With a single worker, repositories
+        are streamed straight into the backup archive.
+
         Args:
             repositories: List of repository paths to backup
             config_path: Path to configuration file to include
@@ -167,6 +300,11 @@ class BackupManager:
             description: Optional description of the backup
             include_git_history: Whether to include full git history
             compression_level: ZIP compression level (0-9)
+            exclude_patterns: Glob patterns of files and directories to leave
+                out, matched against names and repository-relative paths
+            split_archives: Whether to keep one archive per repository
+            max_workers: Maximum repositories compressed at once (defaults to
+                the number of CPUs)
 
         Returns:
             Tuple of (backup_path, metadata)
@@ -176,6 +314,7 @@ class BackupManager:
         """
         backup_id = self._generate_backup_id()
         backup_path = self.backup_dir / f"{backup_id}.zip"
+        repository_archive_dir = self.backup_dir / backup_id
 
         log_operation_start("backup creation", backup_id=backup_id)
 
@@ -191,6 +330,16 @@ class BackupManager:
             if not valid_repos and backup_type != "config-only":
                 raise BackupError("No valid repositories found for backup")
 
+            # Repositories are restored by name, so names must be unique
+            repo_names = [os.path.basename(repo_path) for repo_path in valid_repos]
+            duplicate_names = sorted(
+                {name for name in repo_names if repo_names.count(name) > 1}
+            )
+            if duplicate_names:
+                raise BackupError(
+                    f"Repositories share a name: {', '.join(duplicate_names)}"
+                )
+
             # Create backup archive
             total_size = 0
             with ZipFile(
@@ -199,12 +348,36 @@ class BackupManager:
                 compression=ZIP_DEFLATED,
                 compresslevel=compression_level,
             ) as zip_file:
-                # Add repositories
-                for repo_path in valid_repos:
-                    repo_size = self._add_repository_to_backup(
-                        zip_file, repo_path, include_git_history
-                    )
-                    total_size += repo_size
+                workers = max(
+                    1, min(max_workers or os.cpu_count() or 1, len(valid_repos))
+                )
+                if workers == 1 and not split_archives:
+                    # Without parallelism, stream straight into the backup
+                    for repo_path in valid_repos:
+                        total_size += _add_repository_files(
+                            zip_file,
+                            repo_path,
+                            include_git_history,
+                            exclude_patterns or [],
+                        )
+                else:
+                    # Add repositories as their archives complete
+                    for repo_archive, repo_size in self._write_repository_archives(
+                        valid_repos,
+                        repository_archive_dir,
+                        include_git_history,
+                        exclude_patterns or [],
+                        compression_level,
+                        workers,
+                    ):
+                        if not split_archives:
+                            zip_file.write(
+                                repo_archive,
+                                f"repositories/{repo_archive.name}",
+                                compress_type=ZIP_STORED,
+                            )
+                            repo_archive.unlink()
+                        total_size += repo_size
 
                 # Add configuration
                 config_included = False
@@ -228,6 +401,9 @@ class BackupManager:
                 metadata_json = json.dumps(metadata.to_dict(), indent=2)
                 zip_file.writestr("metadata.json", metadata_json)
 
+            if not split_archives and repository_archive_dir.exists():
+                repository_archive_dir.rmdir()
+
             # Store metadata
             self.backups[backup_id] = metadata
             self._save_metadata()
@@ -245,55 +421,69 @@ class BackupManager:
             # Clean up failed backup
             if backup_path.exists():
                 backup_path.unlink()
+            shutil.rmtree(repository_archive_dir, ignore_errors=True)
             log_operation_failure("backup creation", e, backup_id=backup_id)
             raise BackupError(f"Failed to create backup: {e}") from e
 
-    def _add_repository_to_backup(
-        self, zip_file: ZipFile, repo_path: str, include_git_history: bool
-    ) -> int:
-        """Add a repository to the backup archive.
+    def _write_repository_archives(
+        self,
+        repositories: list[str],
+        archive_dir: Path,
+        include_git_history: bool,
+        exclude_patterns: list[str],
+        compression_level: int,
+        workers: int,
+    ) -> Iterator[tuple[Path, int]]:
+        """Compress repositories into one archive each, in parallel.
 
         Args:
-            zip_file: ZIP file to add repository to
-            repo_path: Path to repository
+            repositories: Paths of repositories to compress
+            archive_dir: Directory to write the archives to
             include_git_history: Whether to include full git history
+            exclude_patterns: Glob patterns of files and directories to leave out
+            compression_level: ZIP compression level (0-9)
+            workers: Number of worker processes; 1 compresses in this process
 
-        Returns:
-            Total size of added files in bytes
+        Yields:
+            Archive path and total size of the archived files, in the order
+            the archives complete
         """
-        repo_name = os.path.basename(repo_path)
-        total_size = 0
-
-        # Create temporary directory for repository copy
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_repo_path = os.path.join(temp_dir, repo_name)
-
-            # Copy repository
-            if os.path.isdir(repo_path):
-                shutil.copytree(repo_path, temp_repo_path, dirs_exist_ok=True)
-
-                # Remove git history if not requested
-                if not include_git_history:
-                    git_dir = os.path.join(temp_repo_path, ".git")
-                    if os.path.exists(git_dir):
-                        shutil.rmtree(git_dir)
-
-                # Add repository directory to archive (even if empty)
-                zip_file.write(temp_repo_path, f"repositories/{repo_name}/")
+        if not repositories:
+            return
 
-                # Add files to archive
-                for root, dirs, files in os.walk(temp_repo_path):
-                    # Skip .git directory if not including history
-                    if not include_git_history:
-                        dirs[:] = [d for d in dirs if d != ".git"]
-
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        arc_name = os.path.relpath(file_path, temp_dir)
-                        zip_file.write(file_path, f"repositories/{arc_name}")
-                        total_size += os.path.getsize(file_path)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        archive_paths = {
+            repo_path: archive_dir / f"{os.path.basename(repo_path)}.zip"
+            for repo_path in repositories
+        }
+        if workers == 1:
+            for repo_path, archive_path in archive_paths.items():
+                yield archive_path, _write_repository_archive(
+                    repo_path,
+                    str(archive_path),
+                    include_git_history,
+                    exclude_patterns,
+                    compression_level,
+                )
+            return
 
-        return total_size
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                pool.submit(
+                    _write_repository_archive,
+                    repo_path,
+                    str(archive_path),
+                    include_git_history,
+                    exclude_patterns,
+                    compression_level,
+                ): archive_path
+                for repo_path, archive_path in archive_paths.items()
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
     def list_backups(self) -> list[BackupMetadata]:
         """List all available backups.
@@ -329,6 +519,7 @@ class BackupManager:
         backup_path = self.backup_dir / f"{backup_id}.zip"
         if backup_path.exists():
             backup_path.unlink()
+        shutil.rmtree(self.backup_dir / backup_id, ignore_errors=True)
 
         del self.backups[backup_id]
         self._save_metadata()
@@ -384,9 +575,12 @@ class BackupManager:
                 # Restore repositories
                 for repo_path in metadata.repositories:
                     try:
-                        restored = self._restore_repository(
-                            zip_file, repo_path, target_dir, overwrite_existing
-                        )
+                        with self._open_repository_archive(
+                            zip_file, backup_id, repo_path
+                        ) as repo_archive:
+                            restored = self._restore_repository(
+                                repo_archive, repo_path, target_dir, overwrite_existing
+                            )
                         if restored:
                             results["repositories_restored"].append(repo_path)
                     except Exception as e:
@@ -419,6 +613,41 @@ class BackupManager:
             log_operation_failure("backup restoration", e, backup_id=backup_id)
             raise RecoveryError(f"Failed to restore backup: {e}") from e
 
+    @contextmanager
+    def _open_repository_archive(
+        self, zip_file: ZipFile, backup_id: str, repo_path: str
+    ) -> Iterator[ZipFile]:
+        """Open the archive holding a repository's files.
+
+        A repository is stored as its own archive inside the backup, as a
+        separate archive next to it, or, in backups made by older versions,
+        directly in the backup archive.
+
+        Args:
+            zip_file: Backup archive
+            backup_id: ID of the backup
+            repo_path: Original repository path
+
+        Yields:
+            Archive with the repository's files under ``repositories/<name>/``
+        """
+        repo_archive_name = f"{os.path.basename(repo_path)}.zip"
+        split_archive = self.backup_dir / backup_id / repo_archive_name
+
+        if f"repositories/{repo_archive_name}" in zip_file.namelist():
+            # Nested archives need a seekable file, so copy it out first
+            with tempfile.TemporaryFile() as temp_file:
+                with zip_file.open(f"repositories/{repo_archive_name}") as source:
+                    shutil.copyfileobj(source, temp_file)
+                temp_file.seek(0)
+                with ZipFile(temp_file, "r") as repo_archive:
+                    yield repo_archive
+        elif split_archive.exists():
+            with ZipFile(split_archive, "r") as repo_archive:
+                yield repo_archive
+        else:
+            yield zip_file
+
     def _restore_repository(
         self,
         zip_file: ZipFile,
@@ -554,6 +783,12 @@ class BackupManager:
                 missing_repos = []
                 for repo_path in metadata.repositories:
                     repo_name = os.path.basename(repo_path)
+                    # Repositories archived on their own
+                    if (
+                        f"repositories/{repo_name}.zip" in zip_file.namelist()
+                        or (self.backup_dir / backup_id / f"{repo_name}.zip").exists()
+                    ):
+                        continue
                     repo_files = [
                         f
                         for f in zip_file.namelist()
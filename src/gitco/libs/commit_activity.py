@@ -0,0 +1,122 @@
+"""Single-pass commit activity scanning for GitCo."""
+
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+# ``git log`` format consumed by ``scan_commit_activity``: author time and email
+COMMIT_ACTIVITY_FORMAT = "--format=%at%x00%ae"
+
+WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+_DAY_SECONDS = 86400
+
+# Activity windows in days, widest first so a scan can stop at the first miss
+_WINDOW_DAYS = (90, 30, 7, 1)
+
+
+def _empty_histogram() -> list[list[int]]:
+    """Create an empty weekday x hour-of-day histogram."""
+    return [[0] * 24 for _ in WEEKDAY_NAMES]
+
+
+@dataclass
+class CommitActivity:
+    """Commit and author activity of a repository's history."""
+
+    total_commits: int = 0
+    total_authors: int = 0
+    commits_24h: int = 0
+    commits_7d: int = 0
+    commits_30d: int = 0
+    commits_90d: int = 0
+    authors_24h: int = 0
+    authors_7d: int = 0
+    authors_30d: int = 0
+    authors_90d: int = 0
+    last_commit_ts: Optional[float] = None  # Epoch seconds
+    # Commits per local weekday (0 is Monday) and hour of day
+    histogram: list[list[int]] = field(default_factory=_empty_histogram)
+
+    @property
+    def most_active_hour(self) -> Optional[int]:
+        """Local hour of day with the most commits, or None without commits."""
+        if not self.total_commits:
+            return None
+        hours = [sum(day[hour] for day in self.histogram) for hour in range(24)]
+        return max(range(24), key=hours.__getitem__)
+
+    @property
+    def most_active_day(self) -> Optional[str]:
+        """Local weekday with the most commits, or None without commits."""
+        if not self.total_commits:
+            return None
+        days = [sum(hours) for hours in self.histogram]
+        return WEEKDAY_NAMES[max(range(len(days)), key=days.__getitem__)]
+
+
+def scan_commit_activity(
+    lines: Iterable[str], now: Optional[float] = None
+) -> CommitActivity:
+    """Summarize commit activity from ``git log`` output in one pass.
+
+    Args:
+        lines: Output of ``git log`` with ``COMMIT_ACTIVITY_FORMAT``, one
+            commit per line; unparseable lines are skipped.
+        now: Epoch seconds the windows end at (defaults to the current time).
+
+    Returns:
+        Commit counts, distinct authors per window and the activity histogram.
+    """
+    now = time.time() if now is None else now
+    cutoffs = [now - days * _DAY_SECONDS for days in _WINDOW_DAYS]
+    window_commits = [0] * len(cutoffs)
+    window_authors: list[set[str]] = [set() for _ in cutoffs]
+    authors: set[str] = set()
+    activity = CommitActivity()
+
+    for line in lines:
+        timestamp, _, email = line.rstrip("\n").partition("\0")
+        try:
+            commit_ts = int(timestamp)
+        except ValueError:
+            continue
+
+        email = email.lower()
+        activity.total_commits += 1
+        authors.add(email)
+        if activity.last_commit_ts is None or commit_ts > activity.last_commit_ts:
+            activity.last_commit_ts = commit_ts
+
+        local_time = time.localtime(commit_ts)
+        activity.histogram[local_time.tm_wday][local_time.tm_hour] += 1
+
+        for index, cutoff in enumerate(cutoffs):
+            if commit_ts < cutoff:
+                break
+            window_commits[index] += 1
+            window_authors[index].add(email)
+
+    activity.total_authors = len(authors)
+    (
+        activity.commits_90d,
+        activity.commits_30d,
+        activity.commits_7d,
+        activity.commits_24h,
+    ) = window_commits
+    (
+        activity.authors_90d,
+        activity.authors_30d,
+        activity.authors_7d,
+        activity.authors_24h,
+    ) = (len(window) for window in window_authors)
+    return activity
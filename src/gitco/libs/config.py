@@ -82,8 +82,20 @@ class Settings:
     min_request_interval: float = 0.1
     # LLM API settings
     llm_openai_api_url: Optional[str] = None
+    # Local LLM provider settings
+    llm_local_latency: float = 0.0
+    llm_local_response_file: Optional[str] = None
     # LLM settings
     max_tokens_per_request: int = 4000
+    diff_token_budget: int = 3000
+    analysis_chunk_commits: int = 25
+    # LLM analysis cache settings
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_hours: int = 24
+    llm_cache_max_entries: int = 500
+    # LLM concurrency settings
+    llm_tokens_per_minute: int = 90000
+    llm_max_concurrent_requests: int = 4
 
 
 @dataclass
@@ -136,8 +148,10 @@ class ConfigValidator:
         Args:
             settings: Settings to validate.
         """
-        # Validate LLM provider
-        valid_providers = ["openai"]
+        # Validate LLM provider against the registered analyzers
+        from .analyzer import get_analyzer_providers
+
+        valid_providers = get_analyzer_providers()
         if settings.llm_provider not in valid_providers:
             self.errors.append(
                 ValidationError(
@@ -223,6 +237,64 @@ class ConfigValidator:
                 )
             )
 
+        if settings.diff_token_budget < 200:
+            self.errors.append(
+                ValidationError(
+                    field="settings.diff_token_budget",
+                    message=f"Value {settings.diff_token_budget} is too low",
+                    suggestion="Must be at least 200 tokens",
+                )
+            )
+
+        if settings.analysis_chunk_commits < 1:
+            self.errors.append(
+                ValidationError(
+                    field="settings.analysis_chunk_commits",
+                    message=f"Value {settings.analysis_chunk_commits} is too low",
+                    suggestion="Must be at least 1 commit",
+                )
+            )
+
+        # Validate LLM cache settings
+        if settings.llm_cache_ttl_hours < 1:
+            self.errors.append(
+                ValidationError(
+                    field="settings.llm_cache_ttl_hours",
+                    message=f"Value {settings.llm_cache_ttl_hours} is too low",
+                    suggestion="Must be at least 1 hour",
+                )
+            )
+        if settings.llm_cache_max_entries < 1:
+            self.errors.append(
+                ValidationError(
+                    field="settings.llm_cache_max_entries",
+                    message=f"Value {settings.llm_cache_max_entries} is too low",
+                    suggestion="Must be at least 1 entry",
+                )
+            )
+
+        # Validate LLM concurrency settings
+        if settings.llm_tokens_per_minute < settings.max_tokens_per_request:
+            self.warnings.append(
+                ValidationError(
+                    field="settings.llm_tokens_per_minute",
+                    message=(
+                        f"Value {settings.llm_tokens_per_minute} is below "
+                        "max_tokens_per_request"
+                    ),
+                    suggestion="Requests will run one at a time; raise the budget",
+                    severity="warning",
+                )
+            )
+        if settings.llm_max_concurrent_requests < 1:
+            self.errors.append(
+                ValidationError(
+                    field="settings.llm_max_concurrent_requests",
+                    message=f"Value {settings.llm_max_concurrent_requests} is too low",
+                    suggestion="Must be at least 1",
+                )
+            )
+
         # Validate GitHub settings
         self._validate_github_settings(settings)
 
@@ -856,10 +928,24 @@ class ConfigManager:
                 github_password_env=settings_data.get("github_password_env"),
                 # LLM API settings
                 llm_openai_api_url=settings_data.get("llm_openai_api_url"),
+                # Local LLM provider settings
+                llm_local_latency=settings_data.get("llm_local_latency", 0.0),
+                llm_local_response_file=settings_data.get("llm_local_response_file"),
                 # LLM settings
                 max_tokens_per_request=settings_data.get(
                     "max_tokens_per_request", 4000
                 ),
+                diff_token_budget=settings_data.get("diff_token_budget", 3000),
+                analysis_chunk_commits=settings_data.get("analysis_chunk_commits", 25),
+                # LLM analysis cache settings
+                llm_cache_enabled=settings_data.get("llm_cache_enabled", True),
+                llm_cache_ttl_hours=settings_data.get("llm_cache_ttl_hours", 24),
+                llm_cache_max_entries=settings_data.get("llm_cache_max_entries", 500),
+                # LLM concurrency settings
+                llm_tokens_per_minute=settings_data.get("llm_tokens_per_minute", 90000),
+                llm_max_concurrent_requests=settings_data.get(
+                    "llm_max_concurrent_requests", 4
+                ),
             )
 
         return config
@@ -893,8 +979,22 @@ class ConfigManager:
                 "github_password_env": config.settings.github_password_env,
                 # LLM API settings
                 "llm_openai_api_url": config.settings.llm_openai_api_url,
+                # Local LLM provider settings
+                "llm_local_latency": config.settings.llm_local_latency,
+                "llm_local_response_file": config.settings.llm_local_response_file,
                 # LLM settings
                 "max_tokens_per_request": config.settings.max_tokens_per_request,
+                "diff_token_budget": config.settings.diff_token_budget,
+                "analysis_chunk_commits": config.settings.analysis_chunk_commits,
+                # LLM analysis cache settings
+                "llm_cache_enabled": config.settings.llm_cache_enabled,
+                "llm_cache_ttl_hours": config.settings.llm_cache_ttl_hours,
+                "llm_cache_max_entries": config.settings.llm_cache_max_entries,
+                # LLM concurrency settings
+                "llm_tokens_per_minute": config.settings.llm_tokens_per_minute,
+                "llm_max_concurrent_requests": (
+                    config.settings.llm_max_concurrent_requests
+                ),
             },
         }
 
@@ -0,0 +1,500 @@
+"""Columnar and rollup-based computation of contribution statistics."""
+
+import time
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
+if TYPE_CHECKING:
+    from .contribution_store import RollupSummary
+    from .contribution_tracker import ContributionStats
+
+DAY_SECONDS = 86400
+
+# Status codes of the status column
+STATUS_CODES = {"open": 0, "closed": 1, "merged": 2}
+OTHER_STATUS = 3
+
+HIGH_IMPACT_THRESHOLD = 0.7
+CRITICAL_IMPACT_THRESHOLD = 0.9
+TRENDING_THRESHOLD = 0.2
+DECLINING_THRESHOLD = -0.2
+RECENT_ACTIVITY_LIMIT = 10
+TIMELINE_MONTHS = 12
+
+
+def _column(values: array, dtype: Any) -> Any:
+    """Wrap an ``array`` buffer as a NumPy column without copying it."""
+    if not values:
+        return np.empty(0, dtype=dtype)
+    return np.frombuffer(values, dtype=dtype)
+
+
+@dataclass
+class ContributionColumns:
+    """Contribution history as parallel typed columns.
+
+    Row ``i`` of every per-contribution column describes the same
+    contribution. Repositories, creation months and skills are interned to
+    integer ids whose order is the order of first appearance. Skills are
+    stored as an incidence list of ``(skill_rows[k], skill_ids[k])`` pairs.
+    """
+
+    row_ids: Any
+    updated_ts: Any
+    impact: Any
+    status: Any
+    repo_ids: Any
+    month_ids: Any
+    comments: Any
+    reactions: Any
+    has_assignees: Any
+    skill_rows: Any
+    skill_ids: Any
+    repositories: list[str]
+    months: list[str]
+    skills: list[str]
+
+    def __len__(self) -> int:
+        """Get the number of contributions."""
+        return len(self.row_ids)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[tuple[Any, ...]],
+        skill_rows: Iterable[tuple[int, str]],
+    ) -> "ContributionColumns":
+        """Build columns from ``ContributionStore.read_stat_rows`` output.
+
+        Values are appended to compact ``array`` buffers, which NumPy then
+        wraps without copying.
+
+        Args:
+            rows: Contribution rows, sorted by row id.
+            skill_rows: ``(row id, skill)`` pairs of those contributions, in
+                the same order.
+
+        Returns:
+            Columnar contribution history.
+        """
+        # Transpose the rows so each column is converted in one C-level call
+        rows = list(rows)
+        (
+            ids,
+            repository_names,
+            status_names,
+            created_months,
+            updated,
+            impact_scores,
+            comments_counts,
+            reactions_counts,
+            assigned,
+        ) = (
+            zip(*rows) if rows else ((),) * 9
+        )
+
+        # Names are interned to ids in first-seen order
+        repositories: dict[str, int] = {}
+        months: dict[str, int] = {}
+        skills: dict[str, int] = {}
+        row_ids = array("q", ids)
+        updated_ts = array("d", updated)
+        impact = array("d", impact_scores)
+        status = array(
+            "b", [STATUS_CODES.get(name, OTHER_STATUS) for name in status_names]
+        )
+        repo_ids = array(
+            "q",
+            [
+                repositories.setdefault(name, len(repositories))
+                for name in repository_names
+            ],
+        )
+        # Unparseable creation times have no month and are left out
+        month_ids = array(
+            "q",
+            [
+                -1 if month is None else months.setdefault(month, len(months))
+                for month in created_months
+            ],
+        )
+        comments = array("q", comments_counts)
+        reactions = array("q", reactions_counts)
+        has_assignees = array("B", assigned)
+
+        skill_rows = list(skill_rows)
+        skill_row_ids, skill_names = zip(*skill_rows) if skill_rows else ((), ())
+        skill_ids = array(
+            "q", [skills.setdefault(name, len(skills)) for name in skill_names]
+        )
+        row_id_column = _column(row_ids, np.int64)
+        # Rows are sorted by id, so a binary search maps skills to row indexes
+        skill_index = np.searchsorted(
+            row_id_column, _column(array("q", skill_row_ids), np.int64)
+        )
+
+        return cls(
+            row_ids=row_id_column,
+            updated_ts=_column(updated_ts, np.float64),
+            impact=_column(impact, np.float64),
+            status=_column(status, np.int8),
+            repo_ids=_column(repo_ids, np.int64),
+            month_ids=_column(month_ids, np.int64),
+            comments=_column(comments, np.int64),
+            reactions=_column(reactions, np.int64),
+            has_assignees=_column(has_assignees, np.bool_),
+            skill_rows=skill_index,
+            skill_ids=_column(skill_ids, np.int64),
+            repositories=list(repositories),
+            months=list(months),
+            skills=list(skills),
+        )
+
+
+def trend_boundaries(now: float) -> tuple[float, float, float]:
+    """Get the start times of the trend windows.
+
+    Args:
+        now: Reference epoch time.
+
+    Returns:
+        Epoch times 7, 30 and 60 days before ``now``.
+    """
+    return now - 7 * DAY_SECONDS, now - 30 * DAY_SECONDS, now - 60 * DAY_SECONDS
+
+
+def _empty_timeline(now: float) -> dict[str, int]:
+    """Get a zeroed timeline of the last 12 months, keyed ``YYYY-MM``."""
+    current = datetime.fromtimestamp(now)
+    return {
+        (current - timedelta(days=30 * i)).strftime("%Y-%m"): 0
+        for i in range(TIMELINE_MONTHS)
+    }
+
+
+def _growth_rate(recent: int, older: int) -> float:
+    """Relative change in activity: 1.0 for new activity, 0.0 for none."""
+    if older > 0:
+        return (recent - older) / older
+    return 1.0 if recent > 0 else 0.0
+
+
+def _classify_skill_trends(stats: "ContributionStats") -> None:
+    """Fill trending and declining skills from the skill growth rates."""
+    for skill, growth_rate in stats.skill_growth_rate.items():
+        if growth_rate >= TRENDING_THRESHOLD:
+            stats.trending_skills.append(skill)
+        elif growth_rate <= DECLINING_THRESHOLD:
+            stats.declining_skills.append(skill)
+    stats.trending_skills.sort(key=lambda s: stats.skill_growth_rate[s], reverse=True)
+    stats.declining_skills.sort(key=lambda s: stats.skill_growth_rate[s])
+
+
+def _influence_score(stats: "ContributionStats") -> float:
+    """Combine impact, collaboration and recognition into influence."""
+    return (
+        stats.average_impact_score * 0.4
+        + stats.collaboration_score * 0.3
+        + stats.recognition_score * 0.3
+    )
+
+
+def _growth_rates(
+    group_ids: Any, recent: Any, older: Any, names: list[str]
+) -> dict[str, float]:
+    """Compare per-group activity in the last 30 days with the 30 before.
+
+    Args:
+        group_ids: Group id of each entry.
+        recent: Mask of entries in the last 30 days.
+        older: Mask of entries 30 to 60 days old.
+        names: Group names by id.
+
+    Returns:
+        Relative change per group: 1.0 for new activity, 0.0 for none.
+    """
+    size = len(names)
+    recent_counts = np.bincount(group_ids[recent], minlength=size)
+    older_counts = np.bincount(group_ids[older], minlength=size)
+    rates = np.where(
+        older_counts > 0,
+        (recent_counts - older_counts) / np.maximum(older_counts, 1),
+        np.where(recent_counts > 0, 1.0, 0.0),
+    )
+    return dict(zip(names, rates.tolist()))
+
+
+def _group_means(group_ids: Any, values: Any, names: list[str]) -> dict[str, float]:
+    """Average values per group, for groups with at least one entry."""
+    size = len(names)
+    counts = np.bincount(group_ids, minlength=size)
+    sums = np.bincount(group_ids, weights=values, minlength=size)
+    return {
+        name: float(sums[group] / counts[group])
+        for group, name in enumerate(names)
+        if counts[group]
+    }
+
+
+def fill_contribution_stats(
+    columns: ContributionColumns,
+    stats: "ContributionStats",
+    now: Optional[float] = None,
+) -> list[int]:
+    """Compute every statistic from vectorized masks over the columns.
+
+    Timestamps are compared as epoch seconds, and each time window is
+    computed once as a boolean mask and shared by all metrics that use it.
+
+    Args:
+        columns: Contribution history to summarize.
+        stats: Statistics object to fill in (``recent_activity`` excepted).
+        now: Reference epoch time (defaults to the current time).
+
+    Returns:
+        Row ids of the most recently updated contributions, newest first,
+        for the caller to load as ``recent_activity``.
+    """
+    if now is None:
+        now = time.time()
+
+    total = len(columns)
+    stats.total_contributions = total
+
+    timeline = _empty_timeline(now)
+    if not total:
+        stats.contribution_timeline = timeline
+        return []
+
+    status_counts = np.bincount(columns.status, minlength=OTHER_STATUS + 1)
+    stats.open_contributions = int(status_counts[STATUS_CODES["open"]])
+    stats.closed_contributions = int(status_counts[STATUS_CODES["closed"]])
+    stats.merged_contributions = int(status_counts[STATUS_CODES["merged"]])
+    stats.repositories_contributed_to = len(columns.repositories)
+    stats.skills_developed = set(columns.skills)
+
+    impact = columns.impact
+    stats.total_impact_score = float(impact.sum())
+    stats.average_impact_score = stats.total_impact_score / total
+
+    valid_months = columns.month_ids[columns.month_ids >= 0]
+    month_counts = np.bincount(valid_months, minlength=len(columns.months))
+    for month_id, month in enumerate(columns.months):
+        if month in timeline:
+            timeline[month] = int(month_counts[month_id])
+    stats.contribution_timeline = timeline
+
+    # Time windows, shared by trends, velocity and growth rates
+    updated = columns.updated_ts
+    recent_7d = updated >= now - 7 * DAY_SECONDS
+    recent_30d = updated >= now - 30 * DAY_SECONDS
+    older_30d = ~recent_30d & (updated >= now - 60 * DAY_SECONDS)
+
+    stats.impact_trend_30d = _impact_trend(impact, recent_30d)
+    stats.impact_trend_7d = _impact_trend(impact, recent_7d)
+    stats.high_impact_contributions = int((impact > HIGH_IMPACT_THRESHOLD).sum())
+    stats.critical_contributions = int((impact > CRITICAL_IMPACT_THRESHOLD).sum())
+
+    skill_rows = columns.skill_rows
+    skill_ids = columns.skill_ids
+    if len(skill_ids):
+        stats.skill_impact_scores = _group_means(
+            skill_ids, impact[skill_rows], columns.skills
+        )
+        stats.skill_growth_rate = _growth_rates(
+            skill_ids, recent_30d[skill_rows], older_30d[skill_rows], columns.skills
+        )
+    stats.repository_impact_scores = _group_means(
+        columns.repo_ids, impact, columns.repositories
+    )
+
+    stats.contribution_velocity = int(recent_30d.sum()) / 30.0
+    stats.repository_engagement_trend = _growth_rates(
+        columns.repo_ids, recent_30d, older_30d, columns.repositories
+    )
+
+    _classify_skill_trends(stats)
+    _fill_advanced_metrics(columns, stats)
+
+    # Stable sort keeps insertion order among equal update times
+    newest = np.argsort(-updated, kind="stable")[:RECENT_ACTIVITY_LIMIT]
+    return [int(row_id) for row_id in columns.row_ids[newest]]
+
+
+def _impact_trend(impact: Any, recent: Any) -> float:
+    """Average impact inside a window minus the average outside it."""
+    recent_count = int(recent.sum())
+    if not recent_count:
+        return 0.0
+    recent_average = float(impact[recent].sum()) / recent_count
+    older_count = len(impact) - recent_count
+    if not older_count:
+        return recent_average
+    return recent_average - float(impact[~recent].sum()) / older_count
+
+
+def _fill_advanced_metrics(
+    columns: ContributionColumns, stats: "ContributionStats"
+) -> None:
+    """Compute collaboration, recognition, influence and sustainability."""
+    comments = columns.comments
+    reactions = columns.reactions
+
+    collaboration = (
+        np.where(columns.has_assignees, 0.3, 0.0)
+        + np.where(comments > 0, np.minimum(comments * 0.05, 0.4), 0.0)
+        + np.where(reactions > 0, np.minimum(reactions * 0.1, 0.3), 0.0)
+    )
+    stats.collaboration_score = float(collaboration.mean())
+
+    recognition = np.minimum(reactions * 0.2, 0.6) + np.minimum(comments * 0.1, 0.4)
+    stats.recognition_score = float(recognition.mean())
+
+    stats.influence_score = _influence_score(stats)
+
+    # Lower average gap in whole days = more sustainable, normalized to 30 days
+    if len(columns) > 1:
+        gaps = np.floor_divide(np.diff(np.sort(columns.updated_ts)), DAY_SECONDS)
+        stats.sustainability_score = max(0.0, 1 - float(gaps.mean()) / 30)
+
+
+def fill_rollup_stats(
+    summary: "RollupSummary",
+    stats: "ContributionStats",
+    now: Optional[float] = None,
+) -> None:
+    """Compute every statistic from rollup totals.
+
+    Produces the same statistics as ``fill_contribution_stats``, except
+    that repositories and skills with equal growth rates are ordered by
+    first activity in the window rather than by first insertion.
+
+    Args:
+        summary: Totals from ``ContributionStore.read_rollups``, read with
+            ``trend_boundaries(now)`` as the boundaries.
+        stats: Statistics object to fill in (``recent_activity`` excepted).
+        now: Reference epoch time (defaults to the current time).
+    """
+    if now is None:
+        now = time.time()
+
+    timeline = _empty_timeline(now)
+    for month, count in summary.months:
+        if month in timeline:
+            timeline[month] = count
+    stats.contribution_timeline = timeline
+
+    # The sorted boundaries 60, 30 and 7 days ago split the window into
+    # segments 0 (older), 1 (30 to 60 days), 2 (7 to 30 days) and 3
+    totals = [0] * 9
+    recent_7d = recent_30d = 0
+    recent_7d_impact = recent_30d_impact = 0.0
+    for segment, *measures in summary.totals:
+        totals = [total + value for total, value in zip(totals, measures)]
+        count, impact = measures[0], measures[4]
+        if segment >= 2:
+            recent_30d += count
+            recent_30d_impact += impact
+        if segment == 3:
+            recent_7d += count
+            recent_7d_impact += impact
+    (
+        total,
+        open_count,
+        closed_count,
+        merged_count,
+        impact_sum,
+        high_impact,
+        critical,
+        collaboration_sum,
+        recognition_sum,
+    ) = totals
+
+    stats.total_contributions = total
+    if not total:
+        return
+
+    stats.open_contributions = open_count
+    stats.closed_contributions = closed_count
+    stats.merged_contributions = merged_count
+    stats.total_impact_score = impact_sum
+    stats.average_impact_score = impact_sum / total
+    stats.impact_trend_30d = _window_trend(
+        recent_30d, recent_30d_impact, total, impact_sum
+    )
+    stats.impact_trend_7d = _window_trend(
+        recent_7d, recent_7d_impact, total, impact_sum
+    )
+    stats.high_impact_contributions = high_impact
+    stats.critical_contributions = critical
+    stats.contribution_velocity = recent_30d / 30.0
+
+    repositories: dict[str, list[Any]] = {}
+    for segment, repository, count, impact in summary.repositories:
+        _add_to_group(repositories, repository, segment, count, impact)
+    stats.repositories_contributed_to = len(repositories)
+    stats.repository_impact_scores = {
+        name: group[1] / group[0] for name, group in repositories.items()
+    }
+    stats.repository_engagement_trend = {
+        name: _growth_rate(group[2], group[3]) for name, group in repositories.items()
+    }
+
+    skills: dict[str, list[Any]] = {}
+    for segment, skill, count, impact in summary.skills:
+        _add_to_group(skills, skill, segment, count, impact)
+    stats.skills_developed = set(skills)
+    stats.skill_impact_scores = {
+        name: group[1] / group[0] for name, group in skills.items()
+    }
+    stats.skill_growth_rate = {
+        name: _growth_rate(group[2], group[3]) for name, group in skills.items()
+    }
+    _classify_skill_trends(stats)
+
+    stats.collaboration_score = collaboration_sum / total
+    stats.recognition_score = recognition_sum / total
+    stats.influence_score = _influence_score(stats)
+
+    # Updates within one day are less than a day apart, so only the gaps
+    # between consecutive active days count toward the whole-day average
+    if total > 1:
+        gap_days = sum(
+            (later[1] - earlier[2]) // DAY_SECONDS
+            for earlier, later in zip(summary.days, summary.days[1:])
+        )
+        stats.sustainability_score = max(0.0, 1 - gap_days / (total - 1) / 30)
+
+
+def _add_to_group(
+    groups: dict[str, list[Any]], name: str, segment: int, count: int, impact: float
+) -> None:
+    """Add segment totals to a group's ``[contributions, impact sum, last 30
+    days, 30 to 60 days ago]`` counters."""
+    group = groups.setdefault(name, [0, 0.0, 0, 0])
+    group[0] += count
+    group[1] += impact
+    if segment >= 2:
+        group[2] += count
+    elif segment == 1:
+        group[3] += count
+
+
+def _window_trend(
+    recent_count: int, recent_impact: float, total: int, impact_sum: float
+) -> float:
+    """Average impact inside a window minus the average outside it."""
+    if not recent_count:
+        return 0.0
+    recent_average = recent_impact / recent_count
+    if recent_count == total:
+        return recent_average
+    return recent_average - (impact_sum - recent_impact) / (total - recent_count)
@@ -0,0 +1,1100 @@
+"""SQLite storage for contribution history."""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from ..utils.common import get_logger, parse_iso_timestamp
+from .contribution_stats import (
+    CRITICAL_IMPACT_THRESHOLD,
+    DAY_SECONDS,
+    HIGH_IMPACT_THRESHOLD,
+)
+
+if TYPE_CHECKING:
+    from .contribution_tracker import Contribution
+
+DEFAULT_DATABASE_PATH = "~/.gitco/contributions.db"
+LEGACY_HISTORY_PATH = "~/.gitco/contribution_history.json"
+
+# Recorded in the database so later schema changes can detect older files;
+# version 2 added the daily rollup tables, version 3 reads timestamps without
+# a UTC offset as UTC instead of local time
+SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contributions (
+    id INTEGER PRIMARY KEY,
+    repository TEXT NOT NULL,
+    issue_number INTEGER NOT NULL,
+    issue_title TEXT NOT NULL,
+    issue_url TEXT NOT NULL,
+    contribution_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    created_ts REAL NOT NULL,
+    updated_ts REAL NOT NULL,
+    impact_score REAL NOT NULL DEFAULT 0.0,
+    skills_used TEXT NOT NULL DEFAULT '[]',
+    labels TEXT NOT NULL DEFAULT '[]',
+    milestone TEXT,
+    assignees TEXT NOT NULL DEFAULT '[]',
+    comments_count INTEGER NOT NULL DEFAULT 0,
+    reactions_count INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (repository, issue_number)
+);
+CREATE INDEX IF NOT EXISTS idx_contributions_repository
+    ON contributions (repository);
+CREATE INDEX IF NOT EXISTS idx_contributions_status ON contributions (status);
+CREATE INDEX IF NOT EXISTS idx_contributions_created ON contributions (created_ts);
+CREATE INDEX IF NOT EXISTS idx_contributions_updated ON contributions (updated_ts);
+CREATE TABLE IF NOT EXISTS contribution_skills (
+    contribution_id INTEGER NOT NULL
+        REFERENCES contributions (id) ON DELETE CASCADE,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (contribution_id, skill)
+);
+CREATE INDEX IF NOT EXISTS idx_contribution_skills_skill
+    ON contribution_skills (skill);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS contribution_rollups (
+    day INTEGER NOT NULL,
+    created_month TEXT NOT NULL,
+    contributions INTEGER NOT NULL,
+    open_count INTEGER NOT NULL,
+    closed_count INTEGER NOT NULL,
+    merged_count INTEGER NOT NULL,
+    impact_sum REAL NOT NULL,
+    high_impact_count INTEGER NOT NULL,
+    critical_count INTEGER NOT NULL,
+    collaboration_sum REAL NOT NULL,
+    recognition_sum REAL NOT NULL,
+    min_updated_ts REAL,
+    max_updated_ts REAL,
+    PRIMARY KEY (day, created_month)
+);
+CREATE TABLE IF NOT EXISTS repository_rollups (
+    day INTEGER NOT NULL,
+    repository TEXT NOT NULL,
+    contributions INTEGER NOT NULL,
+    impact_sum REAL NOT NULL,
+    PRIMARY KEY (day, repository)
+);
+CREATE TABLE IF NOT EXISTS skill_rollups (
+    day INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    contributions INTEGER NOT NULL,
+    impact_sum REAL NOT NULL,
+    PRIMARY KEY (day, skill)
+);
+"""
+
+_COLUMNS = (
+    "repository, issue_number, issue_title, issue_url, contribution_type, status, "
+    "created_at, updated_at, created_ts, updated_ts, impact_score, skills_used, "
+    "labels, milestone, assignees, comments_count, reactions_count"
+)
+
+# Fields refreshed when an existing contribution is added again; title, URL,
+# type, creation time, milestone and assignees keep their first recorded value
+_UPSERT_SQL = f"""
+INSERT INTO contributions ({_COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (repository, issue_number) DO UPDATE SET
+    status = excluded.status,
+    updated_at = excluded.updated_at,
+    updated_ts = excluded.updated_ts,
+    impact_score = excluded.impact_score,
+    skills_used = excluded.skills_used,
+    labels = excluded.labels,
+    comments_count = excluded.comments_count,
+    reactions_count = excluded.reactions_count
+"""
+
+# Rollups bucket contributions by the UTC day of their last update, so a
+# statistics window only has to sum the rollup rows of its days: overall
+# totals per day and creation month, and counts and impact per day and
+# repository or skill. Key and measure expressions take a row alias.
+_DAY_SQL = "CAST({row}.updated_ts / 86400 AS INTEGER)"
+_MONTH_SQL = (
+    "CASE WHEN {row}.created_ts != 0 THEN substr({row}.created_at, 1, 7) ELSE '' END"
+)
+_ROLLUP_MEASURES = {
+    "contributions": "1",
+    "open_count": "{row}.status = 'open'",
+    "closed_count": "{row}.status = 'closed'",
+    "merged_count": "{row}.status = 'merged'",
+    "impact_sum": "{row}.impact_score",
+    "high_impact_count": f"{{row}}.impact_score > {HIGH_IMPACT_THRESHOLD}",
+    "critical_count": f"{{row}}.impact_score > {CRITICAL_IMPACT_THRESHOLD}",
+    "collaboration_sum": (
+        "({row}.assignees != '[]') * 0.3"
+        " + CASE WHEN {row}.comments_count > 0"
+        " THEN min({row}.comments_count * 0.05, 0.4) ELSE 0 END"
+        " + CASE WHEN {row}.reactions_count > 0"
+        " THEN min({row}.reactions_count * 0.1, 0.3) ELSE 0 END"
+    ),
+    "recognition_sum": (
+        "min({row}.reactions_count * 0.2, 0.6)"
+        " + min({row}.comments_count * 0.1, 0.4)"
+    ),
+}
+_ROLLUP_NAMES = ", ".join(_ROLLUP_MEASURES)
+
+
+def _measure_sql(row: str) -> str:
+    """Build the select list of the rollup measures of one contribution."""
+    return ", ".join(expr.format(row=row) for expr in _ROLLUP_MEASURES.values())
+
+
+def _add_rollup_sql(row: str) -> str:
+    """Build statements adding a contribution to its rollup rows."""
+    updates = ", ".join(
+        f"{name} = {name} + excluded.{name}" for name in _ROLLUP_MEASURES
+    )
+    return f"""
+    INSERT INTO contribution_rollups (day, created_month, {_ROLLUP_NAMES},
+        min_updated_ts, max_updated_ts)
+    VALUES ({_DAY_SQL.format(row=row)}, {_MONTH_SQL.format(row=row)},
+        {_measure_sql(row)}, {row}.updated_ts, {row}.updated_ts)
+    ON CONFLICT (day, created_month) DO UPDATE SET {updates},
+        min_updated_ts = min(min_updated_ts, excluded.min_updated_ts),
+        max_updated_ts = max(max_updated_ts, excluded.max_updated_ts);
+    INSERT INTO repository_rollups (day, repository, contributions, impact_sum)
+    VALUES ({_DAY_SQL.format(row=row)}, {row}.repository, 1, {row}.impact_score)
+    ON CONFLICT (day, repository) DO UPDATE SET
+        contributions = contributions + 1,
+        impact_sum = impact_sum + excluded.impact_sum;
+    """
+
+
+def _remove_rollup_sql(row: str) -> str:
+    """Build statements removing a contribution from its rollup rows.
+
+    Counts and sums are decremented and emptied rows deleted. The day's
+    update-time range is only recomputed from the remaining contributions
+    when the removed one was at its edge.
+    """
+    updates = ", ".join(
+        f"{name} = {name} - ({expr.format(row=row)})"
+        for name, expr in _ROLLUP_MEASURES.items()
+    )
+    bucket = (
+        f"day = {_DAY_SQL.format(row=row)} "
+        f"AND created_month = {_MONTH_SQL.format(row=row)}"
+    )
+    remaining = (
+        "FROM contributions c "
+        f"WHERE c.updated_ts >= contribution_rollups.day * {DAY_SECONDS} "
+        f"AND c.updated_ts < (contribution_rollups.day + 1) * {DAY_SECONDS} "
+        f"AND {_MONTH_SQL.format(row='c')} = contribution_rollups.created_month"
+    )
+    repository = f"day = {_DAY_SQL.format(row=row)} AND repository = {row}.repository"
+    return f"""
+    UPDATE contribution_rollups SET {updates},
+        min_updated_ts = CASE WHEN {row}.updated_ts <= min_updated_ts
+            THEN (SELECT MIN(c.updated_ts) {remaining})
+            ELSE min_updated_ts END,
+        max_updated_ts = CASE WHEN {row}.updated_ts >= max_updated_ts
+            THEN (SELECT MAX(c.updated_ts) {remaining})
+            ELSE max_updated_ts END
+    WHERE {bucket};
+    DELETE FROM contribution_rollups WHERE {bucket} AND contributions = 0;
+    UPDATE repository_rollups SET contributions = contributions - 1,
+        impact_sum = impact_sum - {row}.impact_score
+    WHERE {repository};
+    DELETE FROM repository_rollups WHERE {repository} AND contributions = 0;
+    """
+
+
+def _add_skill_rollups_sql(row: str) -> str:
+    """Build a statement adding a contribution's skills to the skill rollups."""
+    return f"""
+    INSERT INTO skill_rollups (day, skill, contributions, impact_sum)
+    SELECT {_DAY_SQL.format(row=row)}, skill, 1, {row}.impact_score
+    FROM contribution_skills WHERE contribution_id = {row}.id
+    ON CONFLICT (day, skill) DO UPDATE SET
+        contributions = contributions + 1,
+        impact_sum = impact_sum + excluded.impact_sum;
+    """
+
+
+def _remove_skill_rollups_sql(row: str) -> str:
+    """Build statements removing a contribution's skills from the rollups."""
+    return f"""
+    UPDATE skill_rollups SET contributions = contributions - 1,
+        impact_sum = impact_sum - {row}.impact_score
+    WHERE day = {_DAY_SQL.format(row=row)} AND skill IN (
+        SELECT skill FROM contribution_skills WHERE contribution_id = {row}.id
+    );
+    DELETE FROM skill_rollups
+    WHERE day = {_DAY_SQL.format(row=row)} AND contributions = 0;
+    """
+
+
+# Skill changes look up their contribution, which therefore exists whenever
+# a skill row is written: skills are deleted before their contribution, and
+# a contribution update moves its current skills between rollup rows
+_PARENT = "(SELECT {column} FROM contributions c WHERE c.id = old.contribution_id)"
+_SKILL_KEY_SQL = (
+    f"day = {_PARENT.format(column=_DAY_SQL.format(row='c'))} AND skill = old.skill"
+)
+
+_ROLLUP_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS contributions_rollup_insert
+AFTER INSERT ON contributions BEGIN
+    {_add_rollup_sql("new")}
+END;
+CREATE TRIGGER IF NOT EXISTS contributions_rollup_update
+AFTER UPDATE ON contributions
+WHEN old.updated_ts IS NOT new.updated_ts OR old.status IS NOT new.status
+    OR old.impact_score IS NOT new.impact_score
+    OR old.comments_count IS NOT new.comments_count
+    OR old.reactions_count IS NOT new.reactions_count
+    OR old.assignees IS NOT new.assignees OR old.repository IS NOT new.repository
+    OR old.created_at IS NOT new.created_at OR old.created_ts IS NOT new.created_ts
+BEGIN
+    {_remove_rollup_sql("old")}
+    {_add_rollup_sql("new")}
+    {_remove_skill_rollups_sql("old")}
+    {_add_skill_rollups_sql("new")}
+END;
+CREATE TRIGGER IF NOT EXISTS contributions_rollup_delete_skills
+BEFORE DELETE ON contributions BEGIN
+    DELETE FROM contribution_skills WHERE contribution_id = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS contributions_rollup_delete
+AFTER DELETE ON contributions BEGIN
+    {_remove_rollup_sql("old")}
+END;
+CREATE TRIGGER IF NOT EXISTS contribution_skills_rollup_insert
+AFTER INSERT ON contribution_skills BEGIN
+    INSERT INTO skill_rollups (day, skill, contributions, impact_sum)
+    SELECT {_DAY_SQL.format(row="c")}, new.skill, 1, c.impact_score
+    FROM contributions c WHERE c.id = new.contribution_id
+    ON CONFLICT (day, skill) DO UPDATE SET
+        contributions = contributions + 1,
+        impact_sum = impact_sum + excluded.impact_sum;
+END;
+CREATE TRIGGER IF NOT EXISTS contribution_skills_rollup_delete
+AFTER DELETE ON contribution_skills BEGIN
+    UPDATE skill_rollups SET contributions = contributions - 1,
+        impact_sum = impact_sum - {_PARENT.format(column="c.impact_score")}
+    WHERE {_SKILL_KEY_SQL};
+    DELETE FROM skill_rollups WHERE {_SKILL_KEY_SQL} AND contributions = 0;
+END;
+"""
+
+# Rebuild the rollups from scratch, for databases created before them
+_REBUILD_ROLLUPS_SQL = (
+    "DELETE FROM contribution_rollups",
+    "DELETE FROM repository_rollups",
+    "DELETE FROM skill_rollups",
+    f"""
+    INSERT INTO contribution_rollups (day, created_month, {_ROLLUP_NAMES},
+        min_updated_ts, max_updated_ts)
+    SELECT {_DAY_SQL.format(row="c")}, {_MONTH_SQL.format(row="c")},
+        {", ".join(f"SUM({expr.format(row='c')})" for expr in _ROLLUP_MEASURES.values())},
+        MIN(c.updated_ts), MAX(c.updated_ts)
+    FROM contributions c GROUP BY 1, 2
+    """,
+    f"""
+    INSERT INTO repository_rollups (day, repository, contributions, impact_sum)
+    SELECT {_DAY_SQL.format(row="c")}, c.repository, COUNT(*), SUM(c.impact_score)
+    FROM contributions c GROUP BY 1, 2
+    """,
+    f"""
+    INSERT INTO skill_rollups (day, skill, contributions, impact_sum)
+    SELECT {_DAY_SQL.format(row="c")}, s.skill, COUNT(*), SUM(c.impact_score)
+    FROM contribution_skills s JOIN contributions c ON c.id = s.contribution_id
+    GROUP BY 1, 2
+    """,
+)
+
+
+def _contribution_row(contribution: "Contribution") -> tuple[Any, ...]:
+    """Convert a contribution into a row of the contributions table."""
+    return (
+        contribution.repository,
+        contribution.issue_number,
+        contribution.issue_title,
+        contribution.issue_url,
+        contribution.contribution_type,
+        contribution.status,
+        contribution.created_at,
+        contribution.updated_at,
+        parse_iso_timestamp(contribution.created_at),
+        parse_iso_timestamp(contribution.updated_at),
+        contribution.impact_score,
+        json.dumps(contribution.skills_used),
+        json.dumps(contribution.labels),
+        contribution.milestone,
+        json.dumps(contribution.assignees),
+        contribution.comments_count,
+        contribution.reactions_count,
+    )
+
+
+def _contribution_from_row(row: sqlite3.Row) -> "Contribution":
+    """Convert a row of the contributions table into a contribution."""
+    from .contribution_tracker import Contribution
+
+    return Contribution(
+        repository=row["repository"],
+        issue_number=row["issue_number"],
+        issue_title=row["issue_title"],
+        issue_url=row["issue_url"],
+        contribution_type=row["contribution_type"],
+        status=row["status"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+        skills_used=json.loads(row["skills_used"]),
+        impact_score=row["impact_score"],
+        labels=json.loads(row["labels"]),
+        milestone=row["milestone"],
+        assignees=json.loads(row["assignees"]),
+        comments_count=row["comments_count"],
+        reactions_count=row["reactions_count"],
+    )
+
+
+@dataclass
+class RollupSummary:
+    """Totals of a statistics window, summed from the daily rollups.
+
+    Segments number the parts of the window split by the sorted boundaries
+    it was read with: segment ``k`` holds contributions updated at or after
+    ``k`` of the boundaries. Repository and skill rows come in order of
+    first activity.
+    """
+
+    # (segment, contributions, open_count, closed_count, merged_count,
+    # impact_sum, high_impact_count, critical_count, collaboration_sum,
+    # recognition_sum)
+    totals: list[tuple[Any, ...]]
+    # (created_month, contributions); the month is empty if unparseable
+    months: list[tuple[str, int]]
+    # (day, first update time, last update time) of active days, in order
+    days: list[tuple[int, float, float]]
+    # (segment, repository, contributions, impact_sum)
+    repositories: list[tuple[int, str, int, float]]
+    # (segment, skill, contributions, impact_sum)
+    skills: list[tuple[int, str, int, float]]
+
+
+@dataclass
+class HistorySummary:
+    """Aggregates of the history that personalized issue scoring needs.
+
+    Successful contributions are closed or merged ones with an impact score
+    above 0.5. Skill figures only cover the skills the summary was read for.
+    """
+
+    contributions: int = 0
+    pr_count: int = 0
+    issue_count: int = 0
+    # Successful contributions with an impact score above 0.8, and the rest
+    advanced_successes: int = 0
+    intermediate_successes: int = 0
+    # Contribution count per skill, over the whole history
+    skill_counts: dict[str, int] = field(default_factory=dict)
+    # Whether a closed or merged contribution above 0.6 impact used a skill
+    skilled_engagement: bool = False
+    # Figures for the one repository the summary was read for
+    repository_contributions: int = 0
+    repository_high_impact: int = 0
+    repository_successes: int = 0
+    repository_skills: set[str] = field(default_factory=set)
+
+
+class ContributionStore:
+    """Contribution history in an indexed SQLite database.
+
+    Contributions are keyed by ``(repository, issue_number)``. Repository,
+    status and the creation and update times are indexed, and skills are kept
+    in a separate indexed table, so callers can fetch or aggregate just the
+    rows they need instead of deserializing the whole history. Timestamps are
+    stored both as the original strings and as epoch seconds for range
+    queries. Daily rollups, maintained by triggers on every write, let
+    statistics sum days instead of contributions.
+
+    A legacy ``contribution_history.json`` file is imported the first time
+    the database is opened; the JSON file itself is left untouched.
+    """
+
+    def __init__(
+        self,
+        database_path: Optional[str] = None,
+        legacy_history_path: Optional[str] = None,
+    ):
+        """Initialize the contribution store.
+
+        Args:
+            database_path: SQLite database file (defaults to
+                ~/.gitco/contributions.db).
+            legacy_history_path: JSON history file to migrate from (defaults
+                to ~/.gitco/contribution_history.json).
+        """
+        self.database_path = Path(database_path or DEFAULT_DATABASE_PATH).expanduser()
+        self.legacy_history_path = Path(
+            legacy_history_path or LEGACY_HISTORY_PATH
+        ).expanduser()
+        self.logger = get_logger()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error.
+
+        A connection per operation keeps the store safe to use from several
+        threads; SQLite connections are cheap to open.
+        """
+        self._ensure_initialized()
+        connection = self._open()
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a configured connection to the database."""
+        connection = sqlite3.connect(self.database_path, timeout=30.0)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    def _ensure_initialized(self) -> None:
+        """Create the schema and import legacy JSON history once."""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._open()
+            try:
+                # WAL lets readers proceed while a sync is writing
+                connection.execute("PRAGMA journal_mode = WAL")
+                with connection:
+                    connection.executescript(_SCHEMA + _ROLLUP_TRIGGERS)
+                    self._migrate_schema(connection)
+                    self._migrate_legacy_history(connection)
+            finally:
+                connection.close()
+            self._initialized = True
+
+    def _migrate_schema(self, connection: sqlite3.Connection) -> None:
+        """Bring a database created by an older version up to date.
+
+        Args:
+            connection: Connection inside the initialization transaction.
+        """
+        row = connection.execute(
+            "SELECT value FROM metadata WHERE key = 'schema_version'"
+        ).fetchone()
+        if row is not None and int(row[0]) < 2:
+            # The rollup tables are new and their triggers only see new writes
+            for statement in _REBUILD_ROLLUPS_SQL:
+                connection.execute(statement)
+            self.logger.info(f"Built contribution rollups in {self.database_path}")
+        if row is not None and int(row[0]) < 3:
+            # Recompute epoch times stored from naive timestamps as local
+            # time; the update trigger moves the rows between rollup days
+            connection.create_function(
+                "parse_iso_timestamp", 1, parse_iso_timestamp, deterministic=True
+            )
+            cursor = connection.execute("""
+                UPDATE contributions SET
+                    created_ts = parse_iso_timestamp(created_at),
+                    updated_ts = parse_iso_timestamp(updated_at)
+                WHERE created_ts != parse_iso_timestamp(created_at)
+                    OR updated_ts != parse_iso_timestamp(updated_at)
+                """)
+            self.logger.info(
+                f"Corrected {cursor.rowcount} contribution timestamps in "
+                f"{self.database_path}"
+            )
+        self._set_metadata(connection, "schema_version", str(SCHEMA_VERSION))
+
+    def _migrate_legacy_history(self, connection: sqlite3.Connection) -> None:
+        """Import the legacy JSON history file if it has not been imported yet.
+
+        Entries that do not describe a contribution are skipped with a
+        warning. A file that cannot be read or parsed is left for the next
+        time the store is opened, so fixing it still imports the history;
+        until then the store works without it.
+
+        Args:
+            connection: Connection inside the initialization transaction.
+        """
+        migrated = connection.execute(
+            "SELECT value FROM metadata WHERE key = 'legacy_history_migrated'"
+        ).fetchone()
+        if migrated is not None or not self.legacy_history_path.exists():
+            return
+
+        from .contribution_tracker import Contribution
+
+        try:
+            with open(self.legacy_history_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except OSError as e:
+            self.logger.warning(
+                f"Could not read contribution history from "
+                f"{self.legacy_history_path}, will retry next time: {e}"
+            )
+            return
+        except ValueError as e:
+            self.logger.warning(
+                f"Contribution history in {self.legacy_history_path} is not "
+                f"valid JSON and was not migrated; fix or remove the file: {e}"
+            )
+            return
+
+        items = data.get("contributions", []) if isinstance(data, dict) else None
+        if not isinstance(items, list):
+            self.logger.warning(
+                f"Contribution history in {self.legacy_history_path} has no "
+                f"list of contributions and was not migrated; fix or remove the file"
+            )
+            return
+
+        contributions = []
+        for index, item in enumerate(items):
+            try:
+                contributions.append(Contribution.from_dict(item))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                self.logger.warning(
+                    f"Skipping contribution {index} of "
+                    f"{self.legacy_history_path}: {e!r}"
+                )
+
+        self._upsert_rows(connection, contributions)
+        self._set_metadata(
+            connection, "legacy_history_migrated", str(self.legacy_history_path)
+        )
+        self.logger.info(
+            f"Migrated {len(contributions)} of {len(items)} contributions from "
+            f"{self.legacy_history_path} to {self.database_path}"
+        )
+
+    def _upsert_rows(
+        self, connection: sqlite3.Connection, contributions: Iterable["Contribution"]
+    ) -> int:
+        """Insert or update contributions and their skills.
+
+        Args:
+            connection: Connection inside an open transaction.
+            contributions: Contributions to store.
+
+        Returns:
+            Number of contributions written.
+        """
+        count = 0
+        for contribution in contributions:
+            connection.execute(_UPSERT_SQL, _contribution_row(contribution))
+            row_id = connection.execute(
+                "SELECT id FROM contributions WHERE repository = ? "
+                "AND issue_number = ?",
+                (contribution.repository, contribution.issue_number),
+            ).fetchone()[0]
+            connection.execute(
+                "DELETE FROM contribution_skills WHERE contribution_id = ?", (row_id,)
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO contribution_skills (contribution_id, skill) "
+                "VALUES (?, ?)",
+                [(row_id, skill) for skill in contribution.skills_used],
+            )
+            count += 1
+        return count
+
+    def upsert(self, contribution: "Contribution") -> None:
+        """Add a contribution, or update it if it is already stored.
+
+        Args:
+            contribution: Contribution to store.
+        """
+        self.upsert_many([contribution])
+
+    def upsert_many(
+        self,
+        contributions: Iterable["Contribution"],
+        metadata: Optional[dict[str, str]] = None,
+    ) -> int:
+        """Add or update many contributions in one transaction.
+
+        Either every contribution is written or, on error, none is. When a
+        key appears more than once, the later contribution is applied last,
+        as if the contributions had been upserted one by one.
+
+        Args:
+            contributions: Contributions to store.
+            metadata: Metadata values to set in the same transaction, such
+                as a sync watermark that must only advance with the data.
+
+        Returns:
+            Number of contributions written.
+        """
+        with self._connect() as connection:
+            written = self._upsert_rows(connection, contributions)
+            for key, value in (metadata or {}).items():
+                self._set_metadata(connection, key, value)
+            return written
+
+    def get_metadata(self, key: str) -> Optional[str]:
+        """Read a metadata value.
+
+        Args:
+            key: Metadata key.
+
+        Returns:
+            Stored value, or None if unset.
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM metadata WHERE key = ?", (key,)
+            ).fetchone()
+            return None if row is None else str(row[0])
+
+    def _set_metadata(
+        self, connection: sqlite3.Connection, key: str, value: str
+    ) -> None:
+        """Write a metadata value inside an open transaction."""
+        connection.execute(
+            "INSERT INTO metadata (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def replace_all(self, contributions: Iterable["Contribution"]) -> int:
+        """Replace the entire history in one transaction.
+
+        Args:
+            contributions: Complete new history.
+
+        Returns:
+            Number of contributions stored.
+        """
+        with self._connect() as connection:
+            connection.execute("DELETE FROM contributions")
+            return self._upsert_rows(connection, contributions)
+
+    def query(
+        self,
+        repository: Optional[str] = None,
+        status: Optional[Iterable[str]] = None,
+        skill: Optional[str] = None,
+        created_since: Optional[float] = None,
+        updated_since: Optional[float] = None,
+        min_impact: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> list["Contribution"]:
+        """Fetch contributions matching all given filters, in insertion order.
+
+        Args:
+            repository: Only contributions to this repository.
+            status: Only contributions with one of these statuses.
+            skill: Only contributions that used this skill.
+            created_since: Only contributions created at or after this epoch time.
+            updated_since: Only contributions updated after this epoch time.
+            min_impact: Only contributions with an impact score above this.
+            limit: Maximum number of contributions to return.
+
+        Returns:
+            Matching contributions.
+        """
+        return list(
+            self.iter_query(
+                repository=repository,
+                status=status,
+                skill=skill,
+                created_since=created_since,
+                updated_since=updated_since,
+                min_impact=min_impact,
+                limit=limit,
+            )
+        )
+
+    def iter_query(
+        self,
+        repository: Optional[str] = None,
+        status: Optional[Iterable[str]] = None,
+        skill: Optional[str] = None,
+        created_since: Optional[float] = None,
+        updated_since: Optional[float] = None,
+        min_impact: Optional[float] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Iterator["Contribution"]:
+        """Stream contributions matching all given filters, in insertion order.
+
+        Rows are fetched ``batch_size`` at a time from a cursor that stays open
+        while the iterator is consumed, so only one batch is held in memory.
+
+        Args:
+            repository: Only contributions to this repository.
+            status: Only contributions with one of these statuses.
+            skill: Only contributions that used this skill.
+            created_since: Only contributions created at or after this epoch time.
+            updated_since: Only contributions updated after this epoch time.
+            min_impact: Only contributions with an impact score above this.
+            limit: Maximum number of contributions to return.
+            batch_size: Rows fetched from the database at a time.
+
+        Yields:
+            Matching contributions.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if repository is not None:
+            clauses.append("repository = ?")
+            params.append(repository)
+        if status is not None:
+            statuses = list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if skill is not None:
+            clauses.append(
+                "id IN (SELECT contribution_id FROM contribution_skills "
+                "WHERE skill = ?)"
+            )
+            params.append(skill)
+        if created_since is not None:
+            clauses.append("created_ts >= ?")
+            params.append(created_since)
+        if updated_since is not None:
+            clauses.append("updated_ts > ?")
+            params.append(updated_since)
+        if min_impact is not None:
+            clauses.append("impact_score > ?")
+            params.append(min_impact)
+
+        sql = f"SELECT {_COLUMNS} FROM contributions"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as connection:
+            cursor = connection.execute(sql, params)
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield _contribution_from_row(row)
+
+    def get_many(self, row_ids: Iterable[int]) -> list["Contribution"]:
+        """Fetch contributions by row id.
+
+        Args:
+            row_ids: Row ids, e.g. from ``read_stat_rows``.
+
+        Returns:
+            Contributions in the order of ``row_ids``, skipping unknown ids.
+        """
+        ids = list(row_ids)
+        if not ids:
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT id, {_COLUMNS} FROM contributions "
+                f"WHERE id IN ({', '.join('?' * len(ids))})",
+                ids,
+            )
+            by_id = {row["id"]: _contribution_from_row(row) for row in rows}
+        return [by_id[row_id] for row_id in ids if row_id in by_id]
+
+    def read_stat_rows(
+        self, updated_since: Optional[float] = None
+    ) -> tuple[list[tuple[Any, ...]], list[tuple[int, str]]]:
+        """Read just the fields statistics need, from one consistent snapshot.
+
+        Args:
+            updated_since: Only contributions updated after this epoch time.
+
+        Returns:
+            Contribution rows of ``(id, repository, status, created_month,
+            updated_ts, impact_score, comments_count, reactions_count,
+            has_assignees)`` in insertion order, where ``created_month`` is
+            the ``YYYY-MM`` prefix of a parseable creation time or None, and
+            ``(contribution_id, skill)`` rows for those contributions in the
+            same order.
+        """
+        where = ""
+        params: list[Any] = []
+        if updated_since is not None:
+            where = " WHERE updated_ts > ?"
+            params.append(updated_since)
+
+        with self._connect() as connection:
+            # Plain tuples are much cheaper than Row objects for bulk reads
+            connection.row_factory = None
+            # Both queries must see the same data even if a sync is writing
+            connection.execute("BEGIN")
+            rows = connection.execute(
+                "SELECT id, repository, status, "
+                "CASE WHEN created_ts != 0 THEN substr(created_at, 1, 7) END, "
+                "updated_ts, impact_score, comments_count, reactions_count, "
+                "assignees != '[]' FROM contributions" + where + " ORDER BY id",
+                params,
+            ).fetchall()
+            skill_rows = connection.execute(
+                "SELECT s.contribution_id, s.skill FROM contribution_skills s "
+                "JOIN contributions c ON c.id = s.contribution_id"
+                + where.replace("updated_ts", "c.updated_ts")
+                + " ORDER BY s.contribution_id, s.rowid",
+                params,
+            ).fetchall()
+        return rows, skill_rows
+
+    def most_recent(
+        self, limit: int, updated_since: Optional[float] = None
+    ) -> list["Contribution"]:
+        """Fetch the most recently updated contributions.
+
+        Args:
+            limit: Maximum number of contributions to return.
+            updated_since: Only contributions updated after this epoch time.
+
+        Returns:
+            Contributions, newest first and in insertion order among equal
+            update times.
+        """
+        sql = f"SELECT {_COLUMNS} FROM contributions"
+        params: list[Any] = []
+        if updated_since is not None:
+            sql += " WHERE updated_ts > ?"
+            params.append(updated_since)
+        sql += " ORDER BY updated_ts DESC, id LIMIT ?"
+        params.append(limit)
+        with self._connect() as connection:
+            return [
+                _contribution_from_row(row) for row in connection.execute(sql, params)
+            ]
+
+    def read_rollups(
+        self,
+        updated_since: Optional[float] = None,
+        boundaries: Iterable[float] = (),
+    ) -> RollupSummary:
+        """Sum the daily rollups of a window, split exactly at boundaries.
+
+        Whole days are summed from the rollup tables inside SQLite, so the
+        cost grows with the days in the window (and the repositories active
+        on them) rather than with the contributions. The days containing
+        the window start or a boundary are summed from the contributions
+        themselves, so every contribution falls in the right segment.
+
+        Args:
+            updated_since: Only contributions updated after this epoch time.
+            boundaries: Epoch times splitting the window into segments.
+
+        Returns:
+            Rollup totals of the window.
+        """
+        bounds = sorted(boundaries)
+        params: dict[str, Any] = {f"b{i}": bound for i, bound in enumerate(bounds)}
+        split_days = {int(bound / DAY_SECONDS) for bound in bounds}
+        rollup_where = raw_where = ""
+        if updated_since is not None:
+            params["since"] = updated_since
+            params["first_day"] = int(updated_since / DAY_SECONDS)
+            split_days.add(params["first_day"])
+            rollup_where = " AND day > :first_day"
+            raw_where = " AND c.updated_ts > :since"
+        days = sorted(split_days)
+        params.update({f"d{i}": day for i, day in enumerate(days)})
+        rollup_where = (
+            f"WHERE day NOT IN ({', '.join(f':d{i}' for i in range(len(days)))})"
+            + rollup_where
+        )
+        raw_days = " OR ".join(
+            f"(c.updated_ts >= :d{i} * {DAY_SECONDS} "
+            f"AND c.updated_ts < (:d{i} + 1) * {DAY_SECONDS})"
+            for i in range(len(days))
+        )
+        raw_where = f"WHERE ({raw_days}){raw_where}"
+
+        def segment(timestamp: str) -> str:
+            """Build the expression numbering a timestamp's segment."""
+            return (
+                " + ".join(f"({timestamp} >= :b{i})" for i in range(len(bounds))) or "0"
+            )
+
+        def source(rollup: str, raw: str) -> str:
+            """Combine rollup rows of whole days with split-day contributions."""
+            sql = (
+                f"SELECT {segment(f'day * {DAY_SECONDS}')} AS segment, day, "
+                f"{rollup} {rollup_where}"
+            )
+            if days:
+                sql += (
+                    f" UNION ALL SELECT {segment('c.updated_ts')}, "
+                    f"{_DAY_SQL.format(row='c')}, {raw} {raw_where}"
+                )
+            return sql
+
+        totals = source(
+            f"created_month, {_ROLLUP_NAMES}, min_updated_ts, max_updated_ts "
+            "FROM contribution_rollups",
+            f"{_MONTH_SQL.format(row='c')}, {_measure_sql('c')}, c.updated_ts, "
+            "c.updated_ts FROM contributions c",
+        )
+        repositories = source(
+            "repository, contributions, impact_sum FROM repository_rollups",
+            "c.repository, 1, c.impact_score FROM contributions c",
+        )
+        skills = source(
+            "skill, contributions, impact_sum FROM skill_rollups",
+            "s.skill, 1, c.impact_score FROM contribution_skills s "
+            "JOIN contributions c ON c.id = s.contribution_id",
+        )
+        sums = ", ".join(f"SUM({name})" for name in _ROLLUP_MEASURES)
+
+        with self._connect() as connection:
+            connection.row_factory = None
+            # All totals must come from the same snapshot
+            connection.execute("BEGIN")
+            return RollupSummary(
+                totals=connection.execute(
+                    f"SELECT segment, {sums} FROM ({totals}) GROUP BY segment",
+                    params,
+                ).fetchall(),
+                months=connection.execute(
+                    "SELECT created_month, SUM(contributions) "
+                    f"FROM ({totals}) GROUP BY created_month",
+                    params,
+                ).fetchall(),
+                days=connection.execute(
+                    "SELECT day, MIN(min_updated_ts), MAX(max_updated_ts) "
+                    f"FROM ({totals}) GROUP BY day ORDER BY day",
+                    params,
+                ).fetchall(),
+                repositories=connection.execute(
+                    "SELECT segment, repository, SUM(contributions), SUM(impact_sum) "
+                    f"FROM ({repositories}) GROUP BY segment, repository "
+                    "ORDER BY MIN(day), repository",
+                    params,
+                ).fetchall(),
+                skills=connection.execute(
+                    "SELECT segment, skill, SUM(contributions), SUM(impact_sum) "
+                    f"FROM ({skills}) GROUP BY segment, skill "
+                    "ORDER BY MIN(day), skill",
+                    params,
+                ).fetchall(),
+            )
+
+    def count(self) -> int:
+        """Count stored contributions.
+
+        Returns:
+            Number of contributions.
+        """
+        with self._connect() as connection:
+            row = connection.execute("SELECT COUNT(*) FROM contributions").fetchone()
+            return int(row[0])
+
+    def history_summary(
+        self, repository: str, skills: Iterable[str] = ()
+    ) -> HistorySummary:
+        """Aggregate the history for scoring issues of a repository.
+
+        Everything is counted inside SQLite from one consistent snapshot, so
+        no contribution is deserialized.
+
+        Args:
+            repository: Repository whose own figures to include.
+            skills: Skills to count usage of.
+
+        Returns:
+            Summary of the whole history and of the repository's part of it.
+        """
+        skills = list(dict.fromkeys(skills))
+        skill_list = ", ".join("?" * len(skills))
+        successful = "c.status IN ('closed', 'merged') AND c.impact_score > {}"
+
+        with self._connect() as connection:
+            connection.row_factory = None
+            connection.execute("BEGIN")
+            totals = connection.execute(
+                "SELECT COUNT(*), "
+                "TOTAL(c.contribution_type = 'pr'), "
+                "TOTAL(c.contribution_type = 'issue'), "
+                f"TOTAL({successful.format(0.8)}), "
+                f"TOTAL({successful.format(0.5)} AND c.impact_score <= 0.8), "
+                "TOTAL(c.repository = ?), "
+                "TOTAL(c.repository = ? AND c.impact_score > ?), "
+                f"TOTAL(c.repository = ? AND {successful.format(0.5)}) "
+                "FROM contributions c",
+                (repository, repository, HIGH_IMPACT_THRESHOLD, repository),
+            ).fetchone()
+            repository_skills = connection.execute(
+                "SELECT DISTINCT s.skill FROM contribution_skills s "
+                "JOIN contributions c ON c.id = s.contribution_id "
+                "WHERE c.repository = ?",
+                (repository,),
+            ).fetchall()
+            skill_counts = []
+            skilled_engagement = None
+            if skills:
+                skill_counts = connection.execute(
+                    "SELECT skill, COUNT(*) FROM contribution_skills "
+                    f"WHERE skill IN ({skill_list}) GROUP BY skill",
+                    skills,
+                ).fetchall()
+                skilled_engagement = connection.execute(
+                    "SELECT 1 FROM contribution_skills s "
+                    "JOIN contributions c ON c.id = s.contribution_id "
+                    f"WHERE s.skill IN ({skill_list}) AND {successful.format(0.6)} "
+                    "LIMIT 1",
+                    skills,
+                ).fetchone()
+
+        (
+            contributions,
+            pr_count,
+            issue_count,
+            advanced,
+            intermediate,
+            repository_contributions,
+            repository_high_impact,
+            repository_successes,
+        ) = (int(value) for value in totals)
+        return HistorySummary(
+            contributions=contributions,
+            pr_count=pr_count,
+            issue_count=issue_count,
+            advanced_successes=advanced,
+            intermediate_successes=intermediate,
+            skill_counts={skill: int(count) for skill, count in skill_counts},
+            skilled_engagement=skilled_engagement is not None,
+            repository_contributions=repository_contributions,
+            repository_high_impact=repository_high_impact,
+            repository_successes=repository_successes,
+            repository_skills={skill for (skill,) in repository_skills},
+        )
+
+    def skill_counts(self) -> dict[str, int]:
+        """Count contributions per skill.
+
+        Returns:
+            Contribution count for every skill used, in first-use order.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT skill, COUNT(*) FROM contribution_skills "
+                "GROUP BY skill ORDER BY MIN(contribution_id)"
+            )
+            return {skill: int(count) for skill, count in rows.fetchall()}
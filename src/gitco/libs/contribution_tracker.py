@@ -1,25 +1,64 @@
 """Contribution history tracking for GitCo."""
 
-import json
+import sys
+import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
 from ..utils.common import (
     get_logger,
+    intern_strings,
     log_operation_failure,
     log_operation_start,
     log_operation_success,
+    parse_iso_timestamp,
+    slotted_dataclass,
 )
 from ..utils.exception import ContributionTrackerError
 from .config import Config
+from .contribution_stats import (
+    RECENT_ACTIVITY_LIMIT,
+    ContributionColumns,
+    fill_contribution_stats,
+    fill_rollup_stats,
+    trend_boundaries,
+)
+from .contribution_store import (
+    LEGACY_HISTORY_PATH,
+    ContributionStore,
+    HistorySummary,
+)
 from .github_client import GitHubClient, GitHubIssue
 
 
-@dataclass
+def _cutoff_timestamp(days: Optional[int]) -> Optional[float]:
+    """Get the epoch time ``days`` days ago, or None for no cutoff."""
+    if not days:
+        return None
+    return time.time() - days * 86400
+
+
+def _format_search_time(timestamp: float) -> str:
+    """Format an epoch time for a GitHub search date qualifier."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
 class Contribution:
-    """Represents a single contribution."""
+    """Represents a single contribution.
+
+    Immutable and slotted, with interned repository, skill, label and login
+    strings, since a synced history can hold tens of thousands of them.
+    """
 
     repository: str
     issue_number: int
@@ -29,14 +68,25 @@ class Contribution:
     status: str  # 'open', 'closed', 'merged', 'draft'
     created_at: str
     updated_at: str
-    skills_used: list[str] = field(default_factory=list)
+    skills_used: tuple[str, ...] = ()
     impact_score: float = 0.0
-    labels: list[str] = field(default_factory=list)
+    labels: tuple[str, ...] = ()
     milestone: Optional[str] = None
-    assignees: list[str] = field(default_factory=list)
+    assignees: tuple[str, ...] = ()
     comments_count: int = 0
     reactions_count: int = 0
 
+    def __post_init__(self) -> None:
+        """Intern repeated strings and freeze the collections."""
+        object.__setattr__(self, "repository", sys.intern(self.repository))
+        object.__setattr__(
+            self, "contribution_type", sys.intern(self.contribution_type)
+        )
+        object.__setattr__(self, "status", sys.intern(self.status))
+        object.__setattr__(self, "skills_used", intern_strings(self.skills_used))
+        object.__setattr__(self, "labels", intern_strings(self.labels))
+        object.__setattr__(self, "assignees", intern_strings(self.assignees))
+
     def to_dict(self) -> dict:
         """Convert contribution to dictionary."""
         return {
@@ -48,11 +98,11 @@ class Contribution:
             "status": self.status,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
-            "skills_used": self.skills_used,
+            "skills_used": list(self.skills_used),
             "impact_score": self.impact_score,
-            "labels": self.labels,
+            "labels": list(self.labels),
             "milestone": self.milestone,
-            "assignees": self.assignees,
+            "assignees": list(self.assignees),
             "comments_count": self.comments_count,
             "reactions_count": self.reactions_count,
         }
@@ -141,49 +191,40 @@ class ContributionTracker:
         self.config = config
         self.github_client = github_client
         self.logger = get_logger()
-        self.history_file = Path("~/.gitco/contribution_history.json").expanduser()
-        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        self.history_file = Path(LEGACY_HISTORY_PATH).expanduser()
+        self.store = ContributionStore(legacy_history_path=str(self.history_file))
 
-    def load_contribution_history(self) -> list[Contribution]:
-        """Load contribution history from file.
+    def load_contribution_history(
+        self,
+        repository: Optional[str] = None,
+        status: Optional[list[str]] = None,
+        skill: Optional[str] = None,
+        days: Optional[int] = None,
+    ) -> list[Contribution]:
+        """Load contribution history, optionally only the matching part.
+
+        Args:
+            repository: Only contributions to this repository
+            status: Only contributions with one of these statuses
+            skill: Only contributions that used this skill
+            days: Only contributions updated in this many days (None for all)
 
         Returns:
             List of contributions
         """
         log_operation_start(
-            "loading contribution history", file_path=str(self.history_file)
+            "loading contribution history",
+            file_path=str(self.store.database_path),
+            repository=repository,
         )
 
         try:
-            if not self.history_file.exists():
-                log_operation_success(
-                    "loading contribution history", contributions_count=0
-                )
-                return []
-
-            with open(self.history_file, encoding="utf-8") as f:
-                data = json.load(f)
-
-            contributions = []
-            for item in data.get("contributions", []):
-                contribution = Contribution(
-                    repository=item["repository"],
-                    issue_number=item["issue_number"],
-                    issue_title=item["issue_title"],
-                    issue_url=item["issue_url"],
-                    contribution_type=item["contribution_type"],
-                    status=item["status"],
-                    created_at=item["created_at"],
-                    updated_at=item["updated_at"],
-                    skills_used=item.get("skills_used", []),
-                    impact_score=item.get("impact_score", 0.0),
-                    labels=item.get("labels", []),
-                    milestone=item.get("milestone"),
-                    assignees=item.get("assignees", []),
-                    comments_count=item.get("comments_count", 0),
-                    reactions_count=item.get("reactions_count", 0),
-                )
-                contributions.append(contribution)
+            contributions = self.store.query(
+                repository=repository,
+                status=status,
+                skill=skill,
+                updated_since=_cutoff_timestamp(days),
+            )
 
             log_operation_success(
                 "loading contribution history", contributions_count=len(contributions)
@@ -196,8 +237,59 @@ class ContributionTracker:
                 f"Failed to load contribution history: {e}"
             ) from e
 
+    def summarize_contribution_history(
+        self, repository: str, skills: list[str]
+    ) -> HistorySummary:
+        """Aggregate contribution history for scoring a repository's issues.
+
+        Args:
+            repository: Repository whose own figures to include
+            skills: Skills to count usage of
+
+        Returns:
+            Summary of the history, counted in the store
+
+        Raises:
+            ContributionTrackerError: If the history cannot be read.
+        """
+        try:
+            return self.store.history_summary(repository, skills)
+        except Exception as e:
+            log_operation_failure("summarizing contribution history", e)
+            raise ContributionTrackerError(
+                f"Failed to summarize contribution history: {e}"
+            ) from e
+
+    def iter_contribution_history(
+        self, created_days: Optional[int] = None
+    ) -> Iterator[Contribution]:
+        """Stream contribution history straight from the store.
+
+        Unlike ``load_contribution_history`` the history is never held in
+        memory as a whole, which suits exports of any size.
+
+        Args:
+            created_days: Only contributions created in this many days
+                (None for all)
+
+        Yields:
+            Contributions in insertion order
+
+        Raises:
+            ContributionTrackerError: If the history cannot be read.
+        """
+        try:
+            yield from self.store.iter_query(
+                created_since=_cutoff_timestamp(created_days)
+            )
+        except Exception as e:
+            log_operation_failure("streaming contribution history", e)
+            raise ContributionTrackerError(
+                f"Failed to stream contribution history: {e}"
+            ) from e
+
     def save_contribution_history(self, contributions: list[Contribution]) -> None:
-        """Save contribution history to file.
+        """Replace the stored contribution history.
 
         Args:
             contributions: List of contributions to save
@@ -207,32 +299,7 @@ class ContributionTracker:
         )
 
         try:
-            data = {
-                "last_updated": datetime.now().isoformat(),
-                "contributions": [
-                    {
-                        "repository": c.repository,
-                        "issue_number": c.issue_number,
-                        "issue_title": c.issue_title,
-                        "issue_url": c.issue_url,
-                        "contribution_type": c.contribution_type,
-                        "status": c.status,
-                        "created_at": c.created_at,
-                        "updated_at": c.updated_at,
-                        "skills_used": c.skills_used,
-                        "impact_score": c.impact_score,
-                        "labels": c.labels,
-                        "milestone": c.milestone,
-                        "assignees": c.assignees,
-                        "comments_count": c.comments_count,
-                        "reactions_count": c.reactions_count,
-                    }
-                    for c in contributions
-                ],
-            }
-
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self.store.replace_all(contributions)
 
             log_operation_success(
                 "saving contribution history", contributions_count=len(contributions)
@@ -245,7 +312,7 @@ class ContributionTracker:
             ) from e
 
     def add_contribution(self, contribution: Contribution) -> None:
-        """Add a new contribution to history.
+        """Add a new contribution to history, or update the existing one.
 
         Args:
             contribution: Contribution to add
@@ -257,33 +324,7 @@ class ContributionTracker:
         )
 
         try:
-            contributions = self.load_contribution_history()
-
-            # Check if contribution already exists
-            existing = next(
-                (
-                    c
-                    for c in contributions
-                    if c.repository == contribution.repository
-                    and c.issue_number == contribution.issue_number
-                ),
-                None,
-            )
-
-            if existing:
-                # Update existing contribution
-                existing.updated_at = contribution.updated_at
-                existing.status = contribution.status
-                existing.skills_used = contribution.skills_used
-                existing.impact_score = contribution.impact_score
-                existing.labels = contribution.labels
-                existing.comments_count = contribution.comments_count
-                existing.reactions_count = contribution.reactions_count
-            else:
-                # Add new contribution
-                contributions.append(contribution)
-
-            self.save_contribution_history(contributions)
+            self.store.upsert(contribution)
             log_operation_success(
                 "adding contribution",
                 repository=contribution.repository,
@@ -294,6 +335,32 @@ class ContributionTracker:
             log_operation_failure("adding contribution", e)
             raise ContributionTrackerError(f"Failed to add contribution: {e}") from e
 
+    def add_contributions(self, contributions: list[Contribution]) -> int:
+        """Add or update many contributions in a single transaction.
+
+        Contributions are matched on ``(repository, issue_number)`` and
+        updated exactly as ``add_contribution`` would, without reading or
+        rewriting the rest of the history.
+
+        Args:
+            contributions: Contributions to add
+
+        Returns:
+            Number of contributions written
+        """
+        log_operation_start(
+            "adding contributions", contributions_count=len(contributions)
+        )
+
+        try:
+            written = self.store.upsert_many(contributions)
+            log_operation_success("adding contributions", contributions_count=written)
+            return written
+
+        except Exception as e:
+            log_operation_failure("adding contributions", e)
+            raise ContributionTrackerError(f"Failed to add contributions: {e}") from e
+
     def get_contribution_stats(self, days: Optional[int] = None) -> ContributionStats:
         """Get contribution statistics.
 
@@ -306,76 +373,22 @@ class ContributionTracker:
         log_operation_start("calculating contribution stats", days=days)
 
         try:
-            contributions = self.load_contribution_history()
-
-            if days:
-                cutoff_date = datetime.now() - timedelta(days=days)
-                contributions = [
-                    c
-                    for c in contributions
-                    if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                    > cutoff_date
-                ]
-
-            stats = ContributionStats()
-            stats.total_contributions = len(contributions)
-
-            # Count by status
-            for contribution in contributions:
-                if contribution.status == "open":
-                    stats.open_contributions += 1
-                elif contribution.status == "closed":
-                    stats.closed_contributions += 1
-                elif contribution.status == "merged":
-                    stats.merged_contributions += 1
-
-            # Get unique repositories
-            repositories = {c.repository for c in contributions}
-            stats.repositories_contributed_to = len(repositories)
-
-            # Collect skills
-            for contribution in contributions:
-                stats.skills_developed.update(contribution.skills_used)
-                stats.total_impact_score += contribution.impact_score
-
-            # Calculate averages
-            if stats.total_contributions > 0:
-                stats.average_impact_score = (
-                    stats.total_impact_score / stats.total_contributions
+            stats = None
+            try:
+                stats = self._calculate_rollup_stats(days)
+            except Exception as e:
+                self.logger.warning(
+                    f"Rollup stats failed, computing from contributions: {e}"
                 )
-
-            # Build timeline (last 12 months)
-            timeline = {}
-            for i in range(12):
-                date = datetime.now() - timedelta(days=30 * i)
-                month_key = date.strftime("%Y-%m")
-                timeline[month_key] = 0
-
-            for contribution in contributions:
+            if stats is None and np is not None:
                 try:
-                    date = datetime.fromisoformat(
-                        contribution.created_at.replace("Z", "+00:00")
+                    stats = self._calculate_columnar_stats(days)
+                except Exception as e:
+                    self.logger.warning(
+                        f"Columnar stats failed, computing per contribution: {e}"
                     )
-                    month_key = date.strftime("%Y-%m")
-                    if month_key in timeline:
-                        timeline[month_key] += 1
-                except ValueError:
-                    continue
-
-            stats.contribution_timeline = timeline
-
-            # Get recent activity (last 10 contributions)
-            sorted_contributions = sorted(
-                contributions,
-                key=lambda x: datetime.fromisoformat(
-                    x.updated_at.replace("Z", "+00:00")
-                ),
-                reverse=True,
-            )
-            stats.recent_activity = sorted_contributions[:10]
-
-            # Calculate enhanced impact metrics and trending analysis
-            self._calculate_enhanced_impact_metrics(contributions, stats)
+            if stats is None:
+                stats = self._calculate_stats(self.load_contribution_history(days=days))
 
             log_operation_success(
                 "calculating contribution stats",
@@ -389,13 +402,139 @@ class ContributionTracker:
                 f"Failed to calculate contribution stats: {e}"
             ) from e
 
-    def sync_contributions_from_github(self, username: str) -> None:
+    def _calculate_rollup_stats(self, days: Optional[int]) -> ContributionStats:
+        """Calculate statistics by summing the store's daily rollups.
+
+        Args:
+            days: Number of days to look back (None for all time)
+
+        Returns:
+            Contribution statistics
+        """
+        now = time.time()
+        updated_since = None if not days else now - days * 86400
+        summary = self.store.read_rollups(
+            updated_since=updated_since, boundaries=trend_boundaries(now)
+        )
+        stats = ContributionStats()
+        fill_rollup_stats(summary, stats, now=now)
+        stats.recent_activity = self.store.most_recent(
+            RECENT_ACTIVITY_LIMIT, updated_since=updated_since
+        )
+        return stats
+
+    def _calculate_columnar_stats(self, days: Optional[int]) -> ContributionStats:
+        """Calculate statistics from columns of only the fields they need.
+
+        Args:
+            days: Number of days to look back (None for all time)
+
+        Returns:
+            Contribution statistics
+        """
+        rows, skill_rows = self.store.read_stat_rows(
+            updated_since=_cutoff_timestamp(days)
+        )
+        columns = ContributionColumns.from_rows(rows, skill_rows)
+        stats = ContributionStats()
+        recent_ids = fill_contribution_stats(columns, stats)
+        stats.recent_activity = self.store.get_many(recent_ids)
+        return stats
+
+    def _calculate_stats(self, contributions: list[Contribution]) -> ContributionStats:
+        """Calculate statistics contribution by contribution.
+
+        Used when NumPy is not installed; produces the same statistics as
+        the columnar path.
+
+        Args:
+            contributions: Contributions to summarize
+
+        Returns:
+            Contribution statistics
+        """
+        stats = ContributionStats()
+        stats.total_contributions = len(contributions)
+
+        # Count by status
+        for contribution in contributions:
+            if contribution.status == "open":
+                stats.open_contributions += 1
+            elif contribution.status == "closed":
+                stats.closed_contributions += 1
+            elif contribution.status == "merged":
+                stats.merged_contributions += 1
+
+        # Get unique repositories
+        repositories = {c.repository for c in contributions}
+        stats.repositories_contributed_to = len(repositories)
+
+        # Collect skills
+        for contribution in contributions:
+            stats.skills_developed.update(contribution.skills_used)
+            stats.total_impact_score += contribution.impact_score
+
+        # Calculate averages
+        if stats.total_contributions > 0:
+            stats.average_impact_score = (
+                stats.total_impact_score / stats.total_contributions
+            )
+
+        # Build timeline (last 12 months)
+        timeline = {}
+        for i in range(12):
+            date = datetime.now() - timedelta(days=30 * i)
+            month_key = date.strftime("%Y-%m")
+            timeline[month_key] = 0
+
+        for contribution in contributions:
+            try:
+                date = datetime.fromisoformat(
+                    contribution.created_at.replace("Z", "+00:00")
+                )
+                month_key = date.strftime("%Y-%m")
+                if month_key in timeline:
+                    timeline[month_key] += 1
+            except ValueError:
+                continue
+
+        stats.contribution_timeline = timeline
+
+        # Get recent activity (last 10 contributions)
+        sorted_contributions = sorted(
+            contributions,
+            key=lambda x: parse_iso_timestamp(x.updated_at),
+            reverse=True,
+        )
+        stats.recent_activity = sorted_contributions[:10]
+
+        # Calculate enhanced impact metrics and trending analysis
+        self._calculate_enhanced_impact_metrics(contributions, stats)
+
+        return stats
+
+    def sync_contributions_from_github(
+        self, username: str, force: bool = False, days: Optional[int] = None
+    ) -> int:
         """Sync contributions from GitHub API.
 
+        Only issues and PRs updated since the last complete sync are fetched,
+        using a per-user watermark kept in the store. All matching results
+        are paged through and merged with one bulk upsert; the watermark
+        advances in the same transaction, so an interrupted sync simply
+        resumes from the previous watermark next time.
+
         Args:
             username: GitHub username to sync contributions for
+            force: Ignore the watermark and fetch the full history
+            days: Only sync contributions updated in the last N days
+
+        Returns:
+            Number of contributions synced
         """
-        log_operation_start("syncing contributions from GitHub", username=username)
+        log_operation_start(
+            "syncing contributions from GitHub", username=username, force=force
+        )
 
         if not self.github_client:
             raise ContributionTrackerError(
@@ -403,53 +542,40 @@ class ContributionTracker:
             )
 
         try:
-            # Get user's issues and PRs
-            issues = self.github_client.search_issues(
-                query=f"author:{username}", state="all", limit=100
+            watermark_key = f"sync_watermark:{username}"
+            watermark = None if force else self.store.get_metadata(watermark_key)
+
+            since = watermark
+            if days:
+                since = _format_search_time(_cutoff_timestamp(days) or 0.0)
+
+            # A sync starting after the stored watermark leaves a gap, so only
+            # syncs that cover everything since the watermark may advance it
+            complete = since is None or (
+                watermark is not None
+                and parse_iso_timestamp(since) <= parse_iso_timestamp(watermark)
             )
 
-            contributions = []
-            for issue in issues:
-                # Determine contribution type
-                contribution_type = (
-                    "pr" if "pull_request" in issue.html_url else "issue"
-                )
+            issues = self.github_client.search_all_issues(
+                query=f"author:{username}", state="all", updated_after=since
+            )
 
-                # Calculate impact score based on various factors
-                impact_score = self._calculate_impact_score(issue)
-
-                # Extract skills from labels and content
-                skills_used = self._extract_skills_from_issue(issue)
-
-                contribution = Contribution(
-                    repository=issue.html_url.split("/")[-4]
-                    + "/"
-                    + issue.html_url.split("/")[-3],
-                    issue_number=issue.number,
-                    issue_title=issue.title,
-                    issue_url=issue.html_url,
-                    contribution_type=contribution_type,
-                    status=issue.state,
-                    created_at=issue.created_at,
-                    updated_at=issue.updated_at,
-                    skills_used=skills_used,
-                    impact_score=impact_score,
-                    labels=issue.labels,
-                    milestone=issue.milestone,
-                    assignees=issue.assignees,
-                    comments_count=issue.comments_count,
-                    reactions_count=issue.reactions_count,
-                )
-                contributions.append(contribution)
+            contributions = [self._contribution_from_issue(issue) for issue in issues]
 
-            # Save all contributions
-            for contribution in contributions:
-                self.add_contribution(contribution)
+            metadata = {}
+            if complete and issues:
+                newest = max(issue.updated_timestamp for issue in issues)
+                metadata[watermark_key] = _format_search_time(newest)
+
+            # Save all contributions and the new watermark in one transaction
+            self.store.upsert_many(contributions, metadata=metadata)
 
             log_operation_success(
                 "syncing contributions from GitHub",
                 contributions_synced=len(contributions),
+                watermark=metadata.get(watermark_key, watermark),
             )
+            return len(contributions)
 
         except Exception as e:
             log_operation_failure("syncing contributions from GitHub", e)
@@ -457,6 +583,44 @@ class ContributionTracker:
                 f"Failed to sync contributions from GitHub: {e}"
             ) from e
 
+    def _contribution_from_issue(self, issue: GitHubIssue) -> Contribution:
+        """Build a contribution record from a GitHub issue or PR.
+
+        Args:
+            issue: GitHub issue
+
+        Returns:
+            Contribution for the issue
+        """
+        # Determine contribution type
+        contribution_type = "pr" if "pull_request" in issue.html_url else "issue"
+
+        # Calculate impact score based on various factors
+        impact_score = self._calculate_impact_score(issue)
+
+        # Extract skills from labels and content
+        skills_used = self._extract_skills_from_issue(issue)
+
+        return Contribution(
+            repository=issue.html_url.split("/")[-4]
+            + "/"
+            + issue.html_url.split("/")[-3],
+            issue_number=issue.number,
+            issue_title=issue.title,
+            issue_url=issue.html_url,
+            contribution_type=contribution_type,
+            status=issue.state,
+            created_at=issue.created_at,
+            updated_at=issue.updated_at,
+            skills_used=tuple(skills_used),
+            impact_score=impact_score,
+            labels=issue.labels,
+            milestone=issue.milestone,
+            assignees=issue.assignees,
+            comments_count=issue.comments_count,
+            reactions_count=issue.reactions_count,
+        )
+
     def _calculate_impact_score(self, issue: GitHubIssue) -> float:
         """Calculate impact score for an issue.
 
@@ -541,22 +705,23 @@ class ContributionTracker:
             stats: Stats object to update
         """
         try:
-            now = datetime.now()
-            thirty_days_ago = now - timedelta(days=30)
-            seven_days_ago = now - timedelta(days=7)
+            now = time.time()
+            thirty_days_ago = now - 30 * 86400
+            seven_days_ago = now - 7 * 86400
+            timestamps = [parse_iso_timestamp(c.updated_at) for c in contributions]
 
-            # Filter contributions by time periods
+            # Split contributions by time periods
             recent_30d = [
-                c
-                for c in contributions
-                if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                >= thirty_days_ago
+                c for c, ts in zip(contributions, timestamps) if ts >= thirty_days_ago
+            ]
+            older_30d = [
+                c for c, ts in zip(contributions, timestamps) if ts < thirty_days_ago
             ]
             recent_7d = [
-                c
-                for c in contributions
-                if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                >= seven_days_ago
+                c for c, ts in zip(contributions, timestamps) if ts >= seven_days_ago
+            ]
+            older_7d = [
+                c for c, ts in zip(contributions, timestamps) if ts < seven_days_ago
             ]
 
             # Calculate trends (comparing recent vs older periods)
@@ -564,7 +729,6 @@ class ContributionTracker:
                 avg_recent_30d = sum(c.impact_score for c in recent_30d) / len(
                     recent_30d
                 )
-                older_30d = [c for c in contributions if c not in recent_30d]
                 if older_30d:
                     avg_older_30d = sum(c.impact_score for c in older_30d) / len(
                         older_30d
@@ -575,7 +739,6 @@ class ContributionTracker:
 
             if recent_7d:
                 avg_recent_7d = sum(c.impact_score for c in recent_7d) / len(recent_7d)
-                older_7d = [c for c in contributions if c not in recent_7d]
                 if older_7d:
                     avg_older_7d = sum(c.impact_score for c in older_7d) / len(older_7d)
                     stats.impact_trend_7d = avg_recent_7d - avg_older_7d
@@ -659,16 +822,15 @@ class ContributionTracker:
             stats: Stats object to update
         """
         try:
-            now = datetime.now()
-            thirty_days_ago = now - timedelta(days=30)
-            sixty_days_ago = now - timedelta(days=60)
+            now = time.time()
+            thirty_days_ago = now - 30 * 86400
+            sixty_days_ago = now - 60 * 86400
 
             # Calculate contribution velocity (contributions per day over last 30 days)
             recent_30d = [
                 c
                 for c in contributions
-                if datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                >= thirty_days_ago
+                if parse_iso_timestamp(c.updated_at) >= thirty_days_ago
             ]
             stats.contribution_velocity = len(recent_30d) / 30.0
 
@@ -692,25 +854,23 @@ class ContributionTracker:
         self,
         contributions: list[Contribution],
         stats: ContributionStats,
-        thirty_days_ago: datetime,
-        sixty_days_ago: datetime,
+        thirty_days_ago: float,
+        sixty_days_ago: float,
     ) -> None:
         """Calculate growth rates for skills.
 
         Args:
             contributions: List of contributions
             stats: Stats object to update
-            thirty_days_ago: 30 days ago timestamp
-            sixty_days_ago: 60 days ago timestamp
+            thirty_days_ago: Epoch time 30 days ago
+            sixty_days_ago: Epoch time 60 days ago
         """
         try:
             # Group contributions by skill and time period
             skill_periods = {}
 
             for contribution in contributions:
-                contrib_date = datetime.fromisoformat(
-                    contribution.updated_at.replace("Z", "+00:00")
-                )
+                contrib_date = parse_iso_timestamp(contribution.updated_at)
 
                 for skill in contribution.skills_used:
                     if skill not in skill_periods:
@@ -740,25 +900,23 @@ class ContributionTracker:
         self,
         contributions: list[Contribution],
         stats: ContributionStats,
-        thirty_days_ago: datetime,
-        sixty_days_ago: datetime,
+        thirty_days_ago: float,
+        sixty_days_ago: float,
     ) -> None:
         """Calculate engagement trends for repositories.
 
         Args:
             contributions: List of contributions
             stats: Stats object to update
-            thirty_days_ago: 30 days ago timestamp
-            sixty_days_ago: 60 days ago timestamp
+            thirty_days_ago: Epoch time 30 days ago
+            sixty_days_ago: Epoch time 60 days ago
         """
         try:
             # Group contributions by repository and time period
             repo_periods = {}
 
             for contribution in contributions:
-                contrib_date = datetime.fromisoformat(
-                    contribution.updated_at.replace("Z", "+00:00")
-                )
+                contrib_date = parse_iso_timestamp(contribution.updated_at)
                 repo = contribution.repository
 
                 if repo not in repo_periods:
@@ -863,16 +1021,13 @@ class ContributionTracker:
             # Sustainability score (based on consistent contribution over time)
             if len(contributions) > 1:
                 # Calculate consistency over time
-                dates = [
-                    datetime.fromisoformat(c.updated_at.replace("Z", "+00:00"))
-                    for c in contributions
-                ]
+                dates = [parse_iso_timestamp(c.updated_at) for c in contributions]
                 dates.sort()
 
                 if len(dates) > 1:
                     time_spans = []
                     for i in range(1, len(dates)):
-                        span = (dates[i] - dates[i - 1]).days
+                        span = (dates[i] - dates[i - 1]) // 86400  # whole days
                         time_spans.append(span)
 
                     avg_span = sum(time_spans) / len(time_spans)
@@ -965,19 +1120,8 @@ class ContributionTracker:
         )
 
         try:
-            contributions = self.load_contribution_history()
-
             # Analyze past contributions to understand patterns
-            skill_frequency: dict[str, int] = {}
-            repository_frequency: dict[str, int] = {}
-
-            for contribution in contributions:
-                for skill in contribution.skills_used:
-                    skill_frequency[skill] = skill_frequency.get(skill, 0) + 1
-
-                repository_frequency[contribution.repository] = (
-                    repository_frequency.get(contribution.repository, 0) + 1
-                )
+            skill_frequency = self.store.skill_counts()
 
             # Find most successful skills and repositories
             top_skills = sorted(
@@ -991,13 +1135,9 @@ class ContributionTracker:
             for skill, _ in top_skills:
                 if skill in user_skills:
                     # Find recent high-impact contributions in this skill
-                    skill_contributions = [
-                        c
-                        for c in contributions
-                        if skill in c.skills_used and c.impact_score > 0.5
-                    ]
-                    if skill_contributions:
-                        recommendations.extend(skill_contributions[:2])
+                    recommendations.extend(
+                        self.store.query(skill=skill, min_impact=0.5, limit=2)
+                    )
 
             # Recommend exploring new skills
             for skill in user_skills:
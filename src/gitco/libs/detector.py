@@ -1,26 +1,142 @@
 """Pattern-based detection for GitCo."""
 
+import hashlib
 import re
+import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Optional, Union
 
 from ..patterns import (
     BREAKING_CHANGE_PATTERNS,
-    CRITICAL_SECURITY_PATTERNS,
+    BREAKING_CHANGE_REGEX,
+    BREAKING_CHANGE_TYPE_REGEXES,
+    CVE_REGEX,
     DEPRECATION_PATTERNS,
-    HIGH_DEPRECATION_PATTERNS,
-    HIGH_SECURITY_PATTERNS,
+    DEPRECATION_REGEX,
+    HIGH_DEPRECATION_REGEX,
+    HIGH_SECURITY_REGEX,
     HIGH_SEVERITY_PATTERNS,
-    MEDIUM_DEPRECATION_PATTERNS,
-    MEDIUM_SECURITY_PATTERNS,
+    HIGH_SEVERITY_REGEX,
+    MEDIUM_DEPRECATION_REGEX,
+    MEDIUM_SECURITY_REGEX,
     MEDIUM_SEVERITY_PATTERNS,
+    MEDIUM_SEVERITY_REGEX,
     SECURITY_PATTERNS,
+    SECURITY_REGEX,
+    compile_any_pattern,
+    compile_grouped_patterns,
+)
+from ..utils.common import get_logger, slotted_dataclass
+from .diff_parser import DiffHunk, parse_unified_diff
+
+# Pattern sets accepted by the matching helpers: raw lists/dicts or precompiled
+GroupedPatterns = Union[dict[str, list[str]], re.Pattern[str]]
+AnyPatterns = Union[list[str], re.Pattern[str]]
+
+
+@lru_cache(maxsize=64)
+def _compile_grouped(key: tuple[tuple[str, tuple[str, ...]], ...]) -> re.Pattern[str]:
+    """Compile and cache a grouped alternation for ad-hoc pattern dicts."""
+    return compile_grouped_patterns({t: list(patterns) for t, patterns in key})
+
+
+@lru_cache(maxsize=64)
+def _compile_any(key: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile and cache an alternation for ad-hoc pattern lists."""
+    return compile_any_pattern(list(key))
+
+
+# File names, function names and class names, in extraction order
+COMPONENT_REGEXES: list[re.Pattern[str]] = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"(\w+\.py)",
+        r"(\w+\.js)",
+        r"(\w+\.ts)",
+        r"(\w+\.java)",
+        r"(\w+\.go)",
+        r"(\w+\.rs)",
+        r"def\s+(\w+)",
+        r"function\s+(\w+)",
+        r"(\w+)\s*\([^)]*\)",
+        r"class\s+(\w+)",
+    ]
+]
+
+COMPONENT_COMMON_WORDS = frozenset(
+    {"def", "function", "class", "return", "pass", "None", "True", "False"}
 )
-from ..utils.common import get_logger
 
 
-@dataclass
+class TextResultCache:
+    """Bounded LRU cache of per-text analysis results.
+
+    Entries are keyed on a hash of the text content rather than the text
+    itself, so large diffs are not kept alive by the cache. Safe to share
+    between threads.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[Hashable, ...], Any] = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compute(
+        self, key: tuple[Hashable, ...], text: str, compute: Callable[[str], Any]
+    ) -> Any:
+        """Return the cached result for text, computing it on a miss.
+
+        Args:
+            key: Identifies the kind of analysis (and its parameters).
+            text: Text being analyzed.
+            compute: Function producing the result from the text.
+
+        Returns:
+            Cached or freshly computed result.
+        """
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        cache_key = (*key, len(text), digest)
+
+        with self._lock:
+            if cache_key in self._entries:
+                self._entries.move_to_end(cache_key)
+                return self._entries[cache_key]
+
+        result = compute(text)
+
+        with self._lock:
+            self._entries[cache_key] = result
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by all detector instances
+_text_result_cache = TextResultCache()
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
 class SecurityUpdate:
     """Represents a detected security update."""
 
@@ -28,13 +144,14 @@ class SecurityUpdate:
     description: str
     severity: str  # "critical", "high", "medium", "low"
     cve_id: Optional[str] = None
-    affected_components: Optional[list[str]] = None
+    affected_components: tuple[str, ...] = ()
     remediation_guidance: Optional[str] = None
 
     def __post_init__(self) -> None:
-        """Initialize default values."""
-        if self.affected_components is None:
-            self.affected_components = []
+        """Freeze the affected components, sharing an existing tuple."""
+        object.__setattr__(
+            self, "affected_components", tuple(self.affected_components or ())
+        )
 
 
 @dataclass
@@ -55,16 +172,21 @@ class Deprecation:
             self.affected_components = []
 
 
-@dataclass
+@slotted_dataclass
+@dataclass(frozen=True)
 class BreakingChange:
     """Represents a detected breaking change."""
 
     type: str
     description: str
     severity: str  # "high", "medium", "low"
-    affected_components: list[str]
+    affected_components: tuple[str, ...]
     migration_guidance: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        """Freeze the affected components, sharing an existing tuple."""
+        object.__setattr__(self, "affected_components", tuple(self.affected_components))
+
 
 class BaseDetector(ABC):
     """Base class for all pattern-based detectors.
@@ -89,36 +211,44 @@ class BaseDetector(ABC):
         pass
 
     def _match_patterns(
-        self, text: str, patterns: dict[str, list[str]]
+        self, text: str, patterns: GroupedPatterns
     ) -> list[tuple[str, str]]:
         """Match patterns in text and return matches with their types.
 
+        All pattern types are matched in a single pass over the text using a
+        combined alternation; the type of each match comes from its group name.
+        Overlapping hits are reported once, as the leftmost alternative.
+
         Args:
             text: Text to search in.
-            patterns: Dictionary of pattern types to regex patterns.
+            patterns: Dictionary of pattern types to regex patterns, or a regex
+                compiled with ``compile_grouped_patterns``.
 
         Returns:
             List of tuples (type, matched_text).
         """
-        matches = []
-        text_lower = text.lower()
-
-        for pattern_type, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                try:
-                    matches_found = re.finditer(pattern, text_lower, re.IGNORECASE)
-                    for match in matches_found:
-                        matches.append((pattern_type, match.group()))
-                except re.error as e:
-                    self.logger.warning(f"Invalid regex pattern '{pattern}': {e}")
+        if isinstance(patterns, dict):
+            try:
+                patterns = _compile_grouped(
+                    tuple((t, tuple(p)) for t, p in patterns.items())
+                )
+            except re.error as e:
+                self.logger.warning(f"Invalid regex pattern set: {e}")
+                return []
 
-        return matches
+        return [
+            (match.lastgroup or "", match.group())
+            for match in patterns.finditer(text.lower())
+        ]
 
     def _determine_severity(
-        self, text: str, high_patterns: list[str], medium_patterns: list[str]
+        self, text: str, high_patterns: AnyPatterns, medium_patterns: AnyPatterns
     ) -> str:
         """Determine severity based on patterns in text.
 
+        Results are memoized per text content, so classifying many matches
+        found in the same message or hunk scans it only once.
+
         Args:
             text: Text to analyze.
             high_patterns: Patterns indicating high severity.
@@ -127,71 +257,105 @@ class BaseDetector(ABC):
         Returns:
             Severity level: "high", "medium", or "low".
         """
-        text_lower = text.lower()
+        if isinstance(high_patterns, list):
+            high_patterns = _compile_any(tuple(high_patterns))
+        if isinstance(medium_patterns, list):
+            medium_patterns = _compile_any(tuple(medium_patterns))
+
+        def classify(content: str) -> str:
+            text_lower = content.lower()
 
-        # Check for high severity patterns
-        for pattern in high_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            # Check for high severity patterns
+            if high_patterns.search(text_lower):
                 return "high"
 
-        # Check for medium severity patterns
-        for pattern in medium_patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+            # Check for medium severity patterns
+            if medium_patterns.search(text_lower):
                 return "medium"
 
-        return "low"
+            return "low"
 
-    def _extract_affected_components(self, text: str) -> list[str]:
+        result: str = _text_result_cache.get_or_compute(
+            ("severity", high_patterns, medium_patterns), text, classify
+        )
+        return result
+
+    def _extract_affected_components(self, text: str) -> tuple[str, ...]:
         """Extract affected components from text.
 
+        Results are memoized per text content, so repeated extraction over the
+        same message or hunk runs the component regexes only once, and all
+        detections from one text share the same tuple.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Affected component names.
+        """
+        components: tuple[str, ...] = _text_result_cache.get_or_compute(
+            ("components",), text, self._compute_affected_components
+        )
+        return components
+
+    @staticmethod
+    def _compute_affected_components(text: str) -> tuple[str, ...]:
+        """Run the component regexes over text.
+
         Args:
             text: Text to analyze.
 
         Returns:
-            List of affected component names.
+            Affected component names, or ("unknown",) if none were found.
         """
         components = []
 
         # Look for file names, function names, class names, etc.
-        file_patterns = [
-            r"(\w+\.py)",
-            r"(\w+\.js)",
-            r"(\w+\.ts)",
-            r"(\w+\.java)",
-            r"(\w+\.go)",
-            r"(\w+\.rs)",
-        ]
+        for regex in COMPONENT_REGEXES:
+            components.extend(regex.findall(text))
 
-        function_patterns = [
-            r"def\s+(\w+)",
-            r"function\s+(\w+)",
-            r"(\w+)\s*\([^)]*\)",
-        ]
+        # Remove duplicates and filter out common words
+        unique_components = set(components) - COMPONENT_COMMON_WORDS
 
-        class_patterns = [
-            r"class\s+(\w+)",
-        ]
+        if not unique_components:
+            return ("unknown",)
+        return tuple(sys.intern(component) for component in unique_components)
 
-        all_patterns = file_patterns + function_patterns + class_patterns
+    def _iter_diff_hunks(
+        self, diff_content: str, hunks: Optional[list[DiffHunk]] = None
+    ) -> Iterator[DiffHunk]:
+        """Iterate over the hunks of diff content.
 
-        for pattern in all_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            components.extend(matches)
+        Detectors analyze only the added and removed lines of each hunk, so
+        context lines, file headers and ``--stat`` output cannot trigger
+        matches. Text without any unified diff structure is yielded as one
+        pseudo-hunk so that it is still analyzed as a whole.
 
-        # Remove duplicates and filter out common words
-        common_words = {
-            "def",
-            "function",
-            "class",
-            "return",
-            "pass",
-            "None",
-            "True",
-            "False",
-        }
-        components = list(set(components) - common_words)
-
-        return components if components else ["unknown"]
+        Args:
+            diff_content: Git diff content.
+            hunks: Hunks already parsed from the diff, e.g. while it was
+                condensed; analyzed instead of re-parsing ``diff_content``.
+
+        Yields:
+            Diff hunks in diff order.
+        """
+        if hunks:
+            yield from hunks
+            return
+
+        found = False
+        for hunk in parse_unified_diff(diff_content.splitlines()):
+            found = True
+            yield hunk
+
+        if not found and diff_content.strip():
+            yield DiffHunk(
+                file_path="",
+                header="",
+                old_start=0,
+                new_start=0,
+                added_lines=[diff_content],
+            )
 
     def _log_detection(self, detector_type: str, count: int) -> None:
         """Log detection results.
@@ -213,6 +377,8 @@ class SecurityDeprecationDetector(BaseDetector):
         # Use imported patterns
         self.security_patterns = SECURITY_PATTERNS
         self.deprecation_patterns = DEPRECATION_PATTERNS
+        self.security_regex = SECURITY_REGEX
+        self.deprecation_regex = DEPRECATION_REGEX
 
     def get_detector_name(self) -> str:
         """Get the name of the detector."""
@@ -223,13 +389,18 @@ class SecurityDeprecationDetector(BaseDetector):
         return ["security_update", "deprecation"]
 
     def detect_security_updates(
-        self, diff_content: str, commit_messages: list[str]
+        self,
+        diff_content: str,
+        commit_messages: list[str],
+        hunks: Optional[list[DiffHunk]] = None,
     ) -> list[SecurityUpdate]:
         """Detect security updates in diff content and commit messages.
 
         Args:
             diff_content: Git diff content.
             commit_messages: List of commit messages.
+            hunks: Hunks already parsed from the diff, e.g. while it was
+                condensed; analyzed instead of re-parsing ``diff_content``.
 
         Returns:
             List of detected security updates.
@@ -241,19 +412,24 @@ class SecurityDeprecationDetector(BaseDetector):
             security_updates.extend(self._analyze_commit_for_security(message))
 
         # Analyze diff content for security updates
-        security_updates.extend(self._analyze_diff_for_security(diff_content))
+        security_updates.extend(self._analyze_diff_for_security(diff_content, hunks))
 
         self._log_detection("security updates", len(security_updates))
         return security_updates
 
     def detect_deprecations(
-        self, diff_content: str, commit_messages: list[str]
+        self,
+        diff_content: str,
+        commit_messages: list[str],
+        hunks: Optional[list[DiffHunk]] = None,
     ) -> list[Deprecation]:
         """Detect deprecations in diff content and commit messages.
 
         Args:
             diff_content: Git diff content.
             commit_messages: List of commit messages.
+            hunks: Hunks already parsed from the diff, e.g. while it was
+                condensed; analyzed instead of re-parsing ``diff_content``.
 
         Returns:
             List of detected deprecations.
@@ -265,7 +441,7 @@ class SecurityDeprecationDetector(BaseDetector):
             deprecations.extend(self._analyze_commit_for_deprecation(message))
 
         # Analyze diff content for deprecations
-        deprecations.extend(self._analyze_diff_for_deprecation(diff_content))
+        deprecations.extend(self._analyze_diff_for_deprecation(diff_content, hunks))
 
         self._log_detection("deprecations", len(deprecations))
         return deprecations
@@ -283,7 +459,7 @@ class SecurityDeprecationDetector(BaseDetector):
         message_lower = message.lower()
 
         # Check for explicit CVE references
-        cve_matches = re.findall(r"CVE-\d{4}-\d+", message, re.IGNORECASE)
+        cve_matches = CVE_REGEX.findall(message)
         for cve_id in cve_matches:
             severity = self._determine_security_severity(message_lower)
             security_updates.append(
@@ -297,7 +473,7 @@ class SecurityDeprecationDetector(BaseDetector):
             )
 
         # Check for security patterns using base class method
-        matches = self._match_patterns(message, self.security_patterns)
+        matches = self._match_patterns(message, self.security_regex)
         for security_type, _matched_text in matches:
             severity = self._determine_security_severity(message_lower)
             security_updates.append(
@@ -324,7 +500,7 @@ class SecurityDeprecationDetector(BaseDetector):
         message_lower = message.lower()
 
         # Check for deprecation patterns using base class method
-        matches = self._match_patterns(message, self.deprecation_patterns)
+        matches = self._match_patterns(message, self.deprecation_regex)
         for deprecation_type, _matched_text in matches:
             severity = self._determine_deprecation_severity(message_lower)
             deprecations.append(
@@ -332,23 +508,53 @@ class SecurityDeprecationDetector(BaseDetector):
                     type=deprecation_type,
                     description=f"Deprecation detected: {message}",
                     severity=severity,
-                    affected_components=self._extract_affected_components(message),
+                    affected_components=list(
+                        self._extract_affected_components(message)
+                    ),
                 )
             )
 
         return deprecations
 
-    def _analyze_diff_for_security(self, diff_content: str) -> list[SecurityUpdate]:
+    def _analyze_diff_for_security(
+        self, diff_content: str, hunks: Optional[list[DiffHunk]] = None
+    ) -> list[SecurityUpdate]:
         """Analyze diff content for security changes.
 
         Args:
             diff_content: Git diff content.
+            hunks: Hunks already parsed from the diff.
 
         Returns:
             List of detected security updates.
         """
         security_updates = []
-        diff_lower = diff_content.lower()
+        code_updates = []
+        changed_files: dict[str, None] = {}
+
+        for hunk in self._iter_diff_hunks(diff_content, hunks):
+            if hunk.file_path:
+                changed_files.setdefault(hunk.file_path)
+
+            # Check for specific security patterns in the changed lines only
+            changed_text = hunk.changed_text
+            matches = self._match_patterns(changed_text, self.security_regex)
+            if not matches:
+                continue
+
+            severity = self._determine_security_severity(changed_text)
+            components = self._extract_affected_components(
+                f"{hunk.file_path}\n{changed_text}"
+            )
+            for security_type, matched_text in matches:
+                code_updates.append(
+                    SecurityUpdate(
+                        type=security_type,
+                        description=f"Security code change detected: {matched_text}",
+                        severity=severity,
+                        affected_components=components,
+                    )
+                )
 
         # Check for security-related file changes
         security_files = [
@@ -366,57 +572,56 @@ class SecurityDeprecationDetector(BaseDetector):
         ]
 
         for security_file in security_files:
-            if security_file in diff_lower:
+            matching_files = [
+                path for path in changed_files if security_file in path.lower()
+            ]
+            if matching_files:
                 security_updates.append(
                     SecurityUpdate(
                         type="security_file_change",
                         description=f"Security-related file modified: {security_file}",
                         severity="medium",
-                        affected_components=self._extract_affected_components(
-                            diff_content
-                        ),
+                        affected_components=matching_files,
                     )
                 )
 
-        # Check for specific security patterns using base class method
-        matches = self._match_patterns(diff_content, self.security_patterns)
-        for security_type, matched_text in matches:
-            severity = self._determine_security_severity(diff_lower)
-            security_updates.append(
-                SecurityUpdate(
-                    type=security_type,
-                    description=f"Security code change detected: {matched_text}",
-                    severity=severity,
-                    affected_components=self._extract_affected_components(diff_content),
-                )
-            )
-
+        security_updates.extend(code_updates)
         return security_updates
 
-    def _analyze_diff_for_deprecation(self, diff_content: str) -> list[Deprecation]:
+    def _analyze_diff_for_deprecation(
+        self, diff_content: str, hunks: Optional[list[DiffHunk]] = None
+    ) -> list[Deprecation]:
         """Analyze diff content for deprecation changes.
 
         Args:
             diff_content: Git diff content.
+            hunks: Hunks already parsed from the diff.
 
         Returns:
             List of detected deprecations.
         """
         deprecations = []
-        diff_lower = diff_content.lower()
 
-        # Check for deprecation patterns using base class method
-        matches = self._match_patterns(diff_content, self.deprecation_patterns)
-        for deprecation_type, matched_text in matches:
-            severity = self._determine_deprecation_severity(diff_lower)
-            deprecations.append(
-                Deprecation(
-                    type=deprecation_type,
-                    description=f"Deprecation code change detected: {matched_text}",
-                    severity=severity,
-                    affected_components=self._extract_affected_components(diff_content),
-                )
+        for hunk in self._iter_diff_hunks(diff_content, hunks):
+            # Check for deprecation patterns in the changed lines only
+            changed_text = hunk.changed_text
+            matches = self._match_patterns(changed_text, self.deprecation_regex)
+            if not matches:
+                continue
+
+            severity = self._determine_deprecation_severity(changed_text)
+            components = self._extract_affected_components(
+                f"{hunk.file_path}\n{changed_text}"
             )
+            for deprecation_type, matched_text in matches:
+                deprecations.append(
+                    Deprecation(
+                        type=deprecation_type,
+                        description=f"Deprecation code change detected: {matched_text}",
+                        severity=severity,
+                        affected_components=list(components),
+                    )
+                )
 
         return deprecations
 
@@ -430,9 +635,7 @@ class SecurityDeprecationDetector(BaseDetector):
             Severity level: "critical", "high", "medium", or "low".
         """
         return self._determine_severity(
-            text,
-            CRITICAL_SECURITY_PATTERNS + HIGH_SECURITY_PATTERNS,
-            MEDIUM_SECURITY_PATTERNS,
+            text, HIGH_SECURITY_REGEX, MEDIUM_SECURITY_REGEX
         )
 
     def _determine_deprecation_severity(self, text: str) -> str:
@@ -445,7 +648,7 @@ class SecurityDeprecationDetector(BaseDetector):
             Severity level: "high", "medium", or "low".
         """
         return self._determine_severity(
-            text, HIGH_DEPRECATION_PATTERNS, MEDIUM_DEPRECATION_PATTERNS
+            text, HIGH_DEPRECATION_REGEX, MEDIUM_DEPRECATION_REGEX
         )
 
 
@@ -460,6 +663,10 @@ class BreakingChangeDetector(BaseDetector):
         self.breaking_patterns = BREAKING_CHANGE_PATTERNS
         self.high_severity_patterns = HIGH_SEVERITY_PATTERNS
         self.medium_severity_patterns = MEDIUM_SEVERITY_PATTERNS
+        self.breaking_regex = BREAKING_CHANGE_REGEX
+        self.breaking_type_regexes = BREAKING_CHANGE_TYPE_REGEXES
+        self.high_severity_regex = HIGH_SEVERITY_REGEX
+        self.medium_severity_regex = MEDIUM_SEVERITY_REGEX
 
     def get_detector_name(self) -> str:
         """Get the name of the detector."""
@@ -477,13 +684,18 @@ class BreakingChangeDetector(BaseDetector):
         ]
 
     def detect_breaking_changes(
-        self, diff_content: str, commit_messages: list[str]
+        self,
+        diff_content: str,
+        commit_messages: list[str],
+        hunks: Optional[list[DiffHunk]] = None,
     ) -> list[BreakingChange]:
         """Detect breaking changes in diff content and commit messages.
 
         Args:
             diff_content: Git diff content.
             commit_messages: List of commit messages.
+            hunks: Hunks already parsed from the diff, e.g. while it was
+                condensed; analyzed instead of re-parsing ``diff_content``.
 
         Returns:
             List of detected breaking changes.
@@ -495,7 +707,7 @@ class BreakingChangeDetector(BaseDetector):
             breaking_changes.extend(self._analyze_commit_message(message))
 
         # Analyze diff content for breaking changes
-        breaking_changes.extend(self._analyze_diff_content(diff_content))
+        breaking_changes.extend(self._analyze_diff_content(diff_content, hunks))
 
         self._log_detection("breaking changes", len(breaking_changes))
         return breaking_changes
@@ -526,10 +738,10 @@ class BreakingChangeDetector(BaseDetector):
             )
 
         # Check for breaking change patterns using base class method
-        matches = self._match_patterns(message, self.breaking_patterns)
+        matches = self._match_patterns(message, self.breaking_regex)
         for change_type, _matched_text in matches:
             severity = self._determine_severity(
-                message, self.high_severity_patterns, self.medium_severity_patterns
+                message, self.high_severity_regex, self.medium_severity_regex
             )
             breaking_changes.append(
                 BreakingChange(
@@ -542,33 +754,34 @@ class BreakingChangeDetector(BaseDetector):
 
         return breaking_changes
 
-    def _analyze_diff_content(self, diff_content: str) -> list[BreakingChange]:
+    def _analyze_diff_content(
+        self, diff_content: str, hunks: Optional[list[DiffHunk]] = None
+    ) -> list[BreakingChange]:
         """Analyze diff content for breaking changes.
 
         Args:
             diff_content: Git diff content.
+            hunks: Hunks already parsed from the diff.
 
         Returns:
             List of detected breaking changes.
         """
         breaking_changes = []
 
-        # Parse diff content to extract file changes
-        lines = diff_content.split("\n")
-        current_file = None
+        # Aggregate the changed lines and affected components of each file
         file_changes: dict[str, dict] = {}
 
-        for line in lines:
-            if line.startswith("diff --git"):
-                # Extract filename
-                parts = line.split()
-                if len(parts) >= 3:
-                    current_file = parts[2].replace("a/", "").replace("b/", "")
-                    file_changes[current_file] = {"additions": 0, "deletions": 0}
-            elif line.startswith("+") and current_file:
-                file_changes[current_file]["additions"] += 1
-            elif line.startswith("-") and current_file:
-                file_changes[current_file]["deletions"] += 1
+        for hunk in hunks or parse_unified_diff(diff_content.splitlines()):
+            changes = file_changes.setdefault(
+                hunk.file_path,
+                {"additions": 0, "deletions": 0, "content": [], "components": set()},
+            )
+            changes["additions"] += len(hunk.added_lines)
+            changes["deletions"] += len(hunk.removed_lines)
+            changes["content"].append(hunk.changed_text)
+            changes["components"].update(
+                self._extract_affected_components(hunk.changed_text)
+            )
 
         # Analyze each file for breaking changes
         for filename, changes in file_changes.items():
@@ -583,57 +796,66 @@ class BreakingChangeDetector(BaseDetector):
 
         Args:
             filename: Name of the changed file.
-            changes: Dictionary containing change information.
+            changes: Dictionary containing change information: line counts,
+                changed line ``content`` and affected ``components`` per file.
 
         Returns:
             List of detected breaking changes.
         """
         breaking_changes = []
+        content = "\n".join(changes.get("content", []))
+
+        components = set(self._extract_affected_components(filename))
+        components.update(changes.get("components", ()))
+        if len(components) > 1:
+            components.discard("unknown")
+        # Shared by every breaking change detected in this file
+        affected_components = tuple(sorted(components))
 
         # Check for API signature changes
-        if self._has_api_signature_changes(filename):
+        if self._has_api_signature_changes(content):
             breaking_changes.append(
                 BreakingChange(
                     type="api_signature_change",
                     description=f"API signature changes detected in {filename}",
                     severity="high",
-                    affected_components=self._extract_affected_components(filename),
+                    affected_components=affected_components,
                     migration_guidance="Review API usage and update method calls",
                 )
             )
 
         # Check for configuration changes
-        if self._has_configuration_changes(filename, str(changes)):
+        if self._has_configuration_changes(filename, content):
             breaking_changes.append(
                 BreakingChange(
                     type="configuration_change",
                     description=f"Configuration changes detected in {filename}",
                     severity="medium",
-                    affected_components=self._extract_affected_components(filename),
+                    affected_components=affected_components,
                     migration_guidance="Review configuration settings and update as needed",
                 )
             )
 
         # Check for database changes
-        if self._has_database_changes(filename, str(changes)):
+        if self._has_database_changes(filename, content):
             breaking_changes.append(
                 BreakingChange(
                     type="database_change",
                     description=f"Database changes detected in {filename}",
                     severity="high",
-                    affected_components=self._extract_affected_components(filename),
+                    affected_components=affected_components,
                     migration_guidance="Review database schema and migration scripts",
                 )
             )
 
         # Check for dependency changes
-        if self._has_dependency_changes(filename, str(changes)):
+        if self._has_dependency_changes(filename, content):
             breaking_changes.append(
                 BreakingChange(
                     type="dependency_change",
                     description=f"Dependency changes detected in {filename}",
                     severity="medium",
-                    affected_components=self._extract_affected_components(filename),
+                    affected_components=affected_components,
                     migration_guidance="Review dependency updates and test compatibility",
                 )
             )
@@ -651,7 +873,7 @@ class BreakingChangeDetector(BaseDetector):
         """
         # Use base class pattern matching
         matches = self._match_patterns(
-            content, {"api_signature": self.breaking_patterns["api_signature"]}
+            content, self.breaking_type_regexes["api_signature"]
         )
         return len(matches) > 0
 
@@ -682,7 +904,7 @@ class BreakingChangeDetector(BaseDetector):
 
         # Use base class pattern matching for content
         matches = self._match_patterns(
-            content, {"configuration": self.breaking_patterns["configuration"]}
+            content, self.breaking_type_regexes["configuration"]
         )
         return len(matches) > 0
 
@@ -707,9 +929,7 @@ class BreakingChangeDetector(BaseDetector):
             return True
 
         # Use base class pattern matching for content
-        matches = self._match_patterns(
-            content, {"database": self.breaking_patterns["database"]}
-        )
+        matches = self._match_patterns(content, self.breaking_type_regexes["database"])
         return len(matches) > 0
 
     def _has_dependency_changes(self, filename: str, content: str) -> bool:
@@ -737,6 +957,6 @@ class BreakingChangeDetector(BaseDetector):
 
         # Use base class pattern matching for content
         matches = self._match_patterns(
-            content, {"dependencies": self.breaking_patterns["dependencies"]}
+            content, self.breaking_type_regexes["dependencies"]
         )
         return len(matches) > 0
@@ -0,0 +1,373 @@
+"""Token-budgeted diff condensing for LLM analysis."""
+
+import heapq
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from ..patterns import BREAKING_CHANGE_REGEX, DEPRECATION_REGEX, SECURITY_REGEX
+from ..utils.common import CHARS_PER_TOKEN, estimate_tokens
+from .diff_parser import DiffHunk, parse_unified_diff
+
+DEFAULT_DIFF_TOKEN_BUDGET = 3000
+
+# Changed lines kept per hunk; longer hunks are cut before ranking
+MAX_HUNK_LINES = 120
+
+# Candidates held while streaming, as a multiple of the token budget
+CANDIDATE_BUDGET_FACTOR = 4
+
+# Raw diff read before the stream is cut off, as a multiple of the budget
+READ_BUDGET_FACTOR = 16
+
+# Ranking weights
+DETECTOR_HIT_WEIGHT = 3.0
+MAX_DETECTOR_HITS = 5
+PUBLIC_API_BONUS = 1.5
+SIZE_WEIGHT = 0.5
+LOW_SIGNAL_PENALTY = 1.0
+GENERATED_PENALTY = 4.0
+
+_PUBLIC_API_NAMES = ("__init__.py", "api.py", "public.py", "interface.py")
+_PUBLIC_API_SUFFIXES = (".pyi", ".h", ".hpp", ".proto", ".d.ts", ".graphql")
+_PUBLIC_API_MARKERS = ("/api/", "/public/", "/include/", "openapi", "schema")
+_LOW_SIGNAL_DIRS = {"test", "tests", "testing", "docs", "doc", "examples", "e2e"}
+_GENERATED_SUFFIXES = (".lock", ".min.js", ".min.css", ".map", ".snap", ".svg")
+_GENERATED_NAMES = ("package-lock.json", "yarn.lock", "pnpm-lock.yaml", "go.sum")
+
+
+@dataclass
+class FileDiffStat:
+    """Per-file line counts of a diff."""
+
+    additions: int = 0
+    deletions: int = 0
+    hunks: int = 0
+    included_hunks: int = 0
+
+
+@dataclass(order=True)
+class _Candidate:
+    """A rendered hunk waiting to be packed, ordered by score."""
+
+    score: float
+    sequence: int
+    file_path: str = field(compare=False)
+    text: str = field(compare=False)
+    tokens: int = field(compare=False)
+
+
+def _is_public_api_path(path: str) -> bool:
+    """Check whether a file path looks like part of a public interface."""
+    lowered = f"/{path.lower()}"
+    name = lowered.rsplit("/", 1)[-1]
+    return (
+        name in _PUBLIC_API_NAMES
+        or name.endswith(_PUBLIC_API_SUFFIXES)
+        or any(marker in lowered for marker in _PUBLIC_API_MARKERS)
+    )
+
+
+def _is_low_signal_path(path: str) -> bool:
+    """Check whether a file path is tests, docs or examples."""
+    *directories, name = path.lower().split("/")
+    return name.startswith("test_") or any(
+        directory in _LOW_SIGNAL_DIRS for directory in directories
+    )
+
+
+def _is_generated_path(path: str) -> bool:
+    """Check whether a file path is a lock file or generated artifact."""
+    name = path.lower().rsplit("/", 1)[-1]
+    return name in _GENERATED_NAMES or name.endswith(_GENERATED_SUFFIXES)
+
+
+def _file_header(path: str) -> str:
+    """Render the unified diff header introducing a file's hunks."""
+    return f"\ndiff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}"
+
+
+def score_hunk(hunk: DiffHunk) -> float:
+    """Rank a hunk by how much it tells the LLM about the change.
+
+    Detector hits (breaking change, security and deprecation patterns in the
+    changed lines) dominate, followed by whether the file looks like public
+    API, and then by the amount of change. Tests, docs and generated files
+    rank lower.
+
+    Args:
+        hunk: Diff hunk to score.
+
+    Returns:
+        Higher scores for more informative hunks.
+    """
+    text = hunk.changed_text.lower()
+    hits = 0
+    for regex in (BREAKING_CHANGE_REGEX, SECURITY_REGEX, DEPRECATION_REGEX):
+        for _ in regex.finditer(text):
+            hits += 1
+            if hits >= MAX_DETECTOR_HITS:
+                break
+
+    changed_lines = len(hunk.added_lines) + len(hunk.removed_lines)
+    score = DETECTOR_HIT_WEIGHT * hits + SIZE_WEIGHT * math.log1p(changed_lines)
+
+    path = hunk.file_path
+    if _is_generated_path(path):
+        score -= GENERATED_PENALTY
+    elif _is_low_signal_path(path):
+        score -= LOW_SIGNAL_PENALTY
+    elif _is_public_api_path(path):
+        score += PUBLIC_API_BONUS
+    return score
+
+
+def render_hunk(hunk: DiffHunk, max_lines: int = MAX_HUNK_LINES) -> str:
+    """Render a hunk as unified diff text without context lines.
+
+    The ``@@`` header is rewritten to the rendered line counts so the output
+    stays parseable by ``parse_unified_diff``.
+
+    Args:
+        hunk: Diff hunk to render.
+        max_lines: Maximum changed lines to include.
+
+    Returns:
+        Unified diff text for the hunk.
+    """
+    removed = hunk.removed_lines
+    added = hunk.added_lines
+    omitted = 0
+    if len(removed) + len(added) > max_lines:
+        keep_removed = min(len(removed), max_lines // 2)
+        keep_added = min(len(added), max_lines - keep_removed)
+        keep_removed = min(len(removed), max_lines - keep_added)
+        omitted = len(removed) + len(added) - keep_removed - keep_added
+        removed = removed[:keep_removed]
+        added = added[:keep_added]
+
+    _, _, section = hunk.header.partition(" @@")
+    lines = [
+        f"@@ -{hunk.old_start},{len(removed)} "
+        f"+{hunk.new_start},{len(added)} @@{section}"
+    ]
+    lines.extend(f"-{line}" for line in removed)
+    lines.extend(f"+{line}" for line in added)
+    if omitted:
+        lines.append(f"\\ {omitted} more changed lines omitted")
+    return "\n".join(lines)
+
+
+class DiffCondenser:
+    """Packs the most informative hunks of a diff into a token budget.
+
+    Hunks are consumed as a stream and only a bounded set of top-ranked
+    candidates is kept in memory, so arbitrarily large diffs can be condensed
+    without materializing them.
+    """
+
+    def __init__(self, token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET):
+        """Initialize the diff condenser.
+
+        Args:
+            token_budget: Maximum estimated tokens of condensed output.
+        """
+        self.token_budget = token_budget
+
+    def condense(self, hunks: Iterable[DiffHunk]) -> str:
+        """Condense a stream of hunks into a stat summary and selected hunks.
+
+        Args:
+            hunks: Diff hunks in diff order.
+
+        Returns:
+            Condensed diff text, or an empty string if there were no hunks.
+        """
+        stats: dict[str, FileDiffStat] = {}
+        candidates: list[_Candidate] = []
+        candidate_tokens = 0
+        candidate_limit = self.token_budget * CANDIDATE_BUDGET_FACTOR
+
+        for sequence, hunk in enumerate(hunks):
+            stat = stats.setdefault(hunk.file_path, FileDiffStat())
+            stat.additions += len(hunk.added_lines)
+            stat.deletions += len(hunk.removed_lines)
+            stat.hunks += 1
+
+            text = render_hunk(hunk)
+            candidate = _Candidate(
+                score=score_hunk(hunk),
+                sequence=sequence,
+                file_path=hunk.file_path,
+                text=text,
+                tokens=estimate_tokens(text),
+            )
+            heapq.heappush(candidates, candidate)
+            candidate_tokens += candidate.tokens
+
+            # Drop the weakest candidates once there is far more than fits
+            while candidate_tokens > candidate_limit and len(candidates) > 1:
+                candidate_tokens -= heapq.heappop(candidates).tokens
+
+        if not stats:
+            return ""
+
+        # Nothing is selected yet, so this is the longest form of the summary
+        summary_lines = self._format_summary(stats, 0)
+        remaining = self.token_budget - estimate_tokens("\n".join(summary_lines))
+
+        selected: list[_Candidate] = []
+        for candidate in sorted(candidates, key=lambda c: (-c.score, c.sequence)):
+            stat = stats[candidate.file_path]
+            cost = candidate.tokens + 1  # joining newline
+            if stat.included_hunks == 0:
+                # The first hunk of a file also pays for the file header
+                cost += estimate_tokens(_file_header(candidate.file_path)) + 1
+            if cost <= remaining:
+                selected.append(candidate)
+                stat.included_hunks += 1
+                remaining -= cost
+
+        return self._format_output(stats, selected)
+
+    def _format_summary(
+        self, stats: dict[str, FileDiffStat], selected_count: int
+    ) -> list[str]:
+        """Format the per-file stat summary.
+
+        Args:
+            stats: Per-file statistics.
+            selected_count: Number of hunks included in the output.
+
+        Returns:
+            Summary lines.
+        """
+        total_additions = sum(stat.additions for stat in stats.values())
+        total_deletions = sum(stat.deletions for stat in stats.values())
+        total_hunks = sum(stat.hunks for stat in stats.values())
+
+        lines = [
+            f"{len(stats)} files changed, +{total_additions} -{total_deletions} "
+            f"({selected_count} of {total_hunks} hunks shown)"
+        ]
+        for path, stat in stats.items():
+            shown = (
+                ""
+                if stat.included_hunks == stat.hunks
+                else f", {stat.included_hunks}/{stat.hunks} hunks shown"
+            )
+            lines.append(f" {path} | +{stat.additions} -{stat.deletions}{shown}")
+        return lines
+
+    def _format_output(
+        self, stats: dict[str, FileDiffStat], selected: list[_Candidate]
+    ) -> str:
+        """Format the summary and selected hunks, grouped by file in diff order.
+
+        Args:
+            stats: Per-file statistics.
+            selected: Hunks chosen for the output.
+
+        Returns:
+            Condensed diff text.
+        """
+        lines = self._format_summary(stats, len(selected))
+
+        by_file: dict[str, list[_Candidate]] = {}
+        for candidate in sorted(selected, key=lambda c: c.sequence):
+            by_file.setdefault(candidate.file_path, []).append(candidate)
+
+        for path, file_candidates in by_file.items():
+            lines.append(_file_header(path))
+            lines.extend(candidate.text for candidate in file_candidates)
+
+        return "\n".join(lines)
+
+
+def condense_diff(
+    hunks: Iterable[DiffHunk], token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET
+) -> str:
+    """Condense diff hunks into a token budget.
+
+    Args:
+        hunks: Diff hunks in diff order.
+        token_budget: Maximum estimated tokens of condensed output.
+
+    Returns:
+        Condensed diff text, or an empty string if there were no hunks.
+    """
+    return DiffCondenser(token_budget).condense(hunks)
+
+
+class _CharLimitedLines:
+    """Iterates over lines until a character budget is used up."""
+
+    def __init__(self, lines: Iterable[str], max_chars: int):
+        """Initialize the limiter.
+
+        Args:
+            lines: Lines to iterate over.
+            max_chars: Maximum characters to read.
+        """
+        self.lines = lines
+        self.max_chars = max_chars
+        self.truncated = False
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield lines while the budget allows."""
+        read = 0
+        for line in self.lines:
+            read += len(line)
+            if read > self.max_chars:
+                self.truncated = True
+                return
+            yield line
+
+
+def _observe_hunks(
+    hunks: Iterable[DiffHunk], on_hunk: Callable[[DiffHunk], None]
+) -> Iterator[DiffHunk]:
+    """Pass hunks through, handing each to a callback first."""
+    for hunk in hunks:
+        on_hunk(hunk)
+        yield hunk
+
+
+def condense_diff_stream(
+    lines: Iterable[str],
+    token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET,
+    max_read_chars: Optional[int] = None,
+    on_hunk: Optional[Callable[[DiffHunk], None]] = None,
+) -> str:
+    """Parse and condense raw diff output, reading only as much as needed.
+
+    Reading stops once ``max_read_chars`` characters of diff have been
+    consumed, so the producer (e.g. a ``git log -p`` pipe) can be terminated
+    instead of generating output that would never fit the budget.
+
+    Args:
+        lines: Raw unified diff lines, e.g. a Git stdout stream.
+        token_budget: Maximum estimated tokens of condensed output.
+        max_read_chars: Maximum diff characters to read (defaults to
+            ``READ_BUDGET_FACTOR`` times the budget in characters).
+        on_hunk: Called with every parsed hunk, including those left out of
+            the condensed output, so other analyses can share this pass.
+
+    Returns:
+        Condensed diff text, or an empty string if there were no hunks.
+    """
+    if max_read_chars is None:
+        max_read_chars = token_budget * CHARS_PER_TOKEN * READ_BUDGET_FACTOR
+
+    limited_lines = _CharLimitedLines(lines, max_read_chars)
+    hunks: Iterable[DiffHunk] = parse_unified_diff(limited_lines)
+    if on_hunk is not None:
+        hunks = _observe_hunks(hunks, on_hunk)
+    condensed = condense_diff(hunks, token_budget)
+    if condensed and limited_lines.truncated:
+        condensed += (
+            f"\n... (diff read stopped after {max_read_chars // 1024} KB; "
+            "later changes not shown)"
+        )
+    return condensed
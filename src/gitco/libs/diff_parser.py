@@ -0,0 +1,118 @@
+"""Streaming unified diff parsing for GitCo."""
+
+import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Optional
+
+# "@@ -old_start[,old_count] +new_start[,new_count] @@ section"
+HUNK_HEADER_REGEX = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+@dataclass
+class DiffHunk:
+    """A single hunk of a unified diff."""
+
+    file_path: str
+    header: str
+    old_start: int
+    new_start: int
+    added_lines: list[str] = field(default_factory=list)
+    removed_lines: list[str] = field(default_factory=list)
+
+    @property
+    def changed_text(self) -> str:
+        """Removed and added lines joined into one text, without diff markers."""
+        return "\n".join(self.removed_lines + self.added_lines)
+
+
+def _path_from_marker(line: str) -> Optional[str]:
+    """Extract a path from a ``---``/``+++`` line, or None for /dev/null."""
+    path = line[4:].split("\t", 1)[0].strip()
+    if path == "/dev/null":
+        return None
+    if path.startswith(("a/", "b/")):
+        return path[2:]
+    return path
+
+
+def _path_from_git_header(line: str) -> str:
+    """Extract the post-image path from a ``diff --git a/x b/x`` line."""
+    _, _, paths = line.partition("diff --git ")
+    marker = paths.rfind(" b/")
+    if marker != -1:
+        return paths[marker + 3 :]
+    return paths.split(" ")[-1]
+
+
+def parse_unified_diff(lines: Iterable[str]) -> Iterator[DiffHunk]:
+    """Parse unified diff lines into hunks as they arrive.
+
+    Works on any line iterable, including a ``git diff``/``git show`` stdout
+    pipe, and never holds more than the current hunk in memory. Anything that
+    is not part of a file diff (commit headers, ``--stat`` output) is skipped.
+
+    Args:
+        lines: Lines of diff output, with or without trailing newlines.
+
+    Yields:
+        One ``DiffHunk`` per ``@@`` hunk, in diff order.
+    """
+    file_path: Optional[str] = None
+    old_path: Optional[str] = None
+    hunk: Optional[DiffHunk] = None
+    old_remaining = new_remaining = 0
+
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+
+        if hunk is not None:
+            if old_remaining > 0 or new_remaining > 0:
+                if line.startswith("+"):
+                    hunk.added_lines.append(line[1:])
+                    new_remaining -= 1
+                    continue
+                if line.startswith("-"):
+                    hunk.removed_lines.append(line[1:])
+                    old_remaining -= 1
+                    continue
+                if line.startswith(" ") or line == "":
+                    old_remaining -= 1
+                    new_remaining -= 1
+                    continue
+                if line.startswith("\\"):
+                    # "\ No newline at end of file"
+                    continue
+            elif line.startswith("\\"):
+                continue
+
+            # Hunk is complete
+            yield hunk
+            hunk = None
+
+        if line.startswith("diff --git "):
+            file_path = _path_from_git_header(line)
+            old_path = None
+        elif line.startswith("diff --cc ") or line.startswith("diff --combined "):
+            # Combined (merge) diffs use a different hunk format
+            file_path = old_path = None
+        elif line.startswith("--- "):
+            old_path = _path_from_marker(line)
+        elif line.startswith("+++ "):
+            # Deleted files have a /dev/null post-image; keep the old path
+            file_path = _path_from_marker(line) or old_path or file_path
+        elif line.startswith("@@ ") and file_path is not None:
+            match = HUNK_HEADER_REGEX.match(line)
+            if match:
+                old_start, old_count, new_start, new_count = match.groups()
+                hunk = DiffHunk(
+                    file_path=file_path,
+                    header=line,
+                    old_start=int(old_start),
+                    new_start=int(new_start),
+                )
+                old_remaining = int(old_count) if old_count is not None else 1
+                new_remaining = int(new_count) if new_count is not None else 1
+
+    if hunk is not None:
+        yield hunk
@@ -1,46 +1,72 @@
 """Issue discovery and skill-based matching for GitCo."""
 
 import re
+import sys
+import time
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 from rich.panel import Panel
 from rich.text import Text
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional extra
+    np = None
+
 from ..patterns.constants import DIFFICULTY_INDICATORS, SKILL_SYNONYMS, TIME_PATTERNS
 from ..utils.common import (
     console,
     get_logger,
+    intern_strings,
     log_operation_failure,
     log_operation_start,
     log_operation_success,
+    slotted_dataclass,
 )
 from ..utils.exception import DiscoveryError
 from .config import Config, Repository
+from .contribution_store import HistorySummary
 from .github_client import GitHubClient, GitHubIssue
 
+# Recency bonus for a just-updated issue, halved every half-life
+RECENCY_BONUS_MAX = 0.1
+RECENCY_HALF_LIFE_DAYS = 14.0
+
 
-@dataclass
+@slotted_dataclass
+@dataclass(frozen=True)
 class SkillMatch:
     """Represents a skill match between an issue and user skills."""
 
     skill: str
     confidence: float
     match_type: str  # 'exact', 'partial', 'related', 'language'
-    evidence: list[str]
+    evidence: tuple[str, ...]
 
+    def __post_init__(self) -> None:
+        """Intern the skill and freeze the evidence."""
+        object.__setattr__(self, "skill", sys.intern(self.skill))
+        object.__setattr__(self, "evidence", tuple(self.evidence))
 
-@dataclass
+
+@slotted_dataclass
+@dataclass(frozen=True)
 class IssueRecommendation:
     """Represents a recommended issue with matching details."""
 
     issue: GitHubIssue
     repository: Repository
-    skill_matches: list[SkillMatch]
+    skill_matches: tuple[SkillMatch, ...]
     overall_score: float
     difficulty_level: str  # 'beginner', 'intermediate', 'advanced'
     estimated_time: str  # 'quick', 'medium', 'long'
-    tags: list[str]
+    tags: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        """Freeze the matches and intern the tags."""
+        object.__setattr__(self, "skill_matches", tuple(self.skill_matches))
+        object.__setattr__(self, "tags", intern_strings(self.tags))
 
 
 class SkillMatcher:
@@ -120,9 +146,9 @@ class SkillMatcher:
                         skill=skill,
                         confidence=language_confidence,
                         match_type="language",
-                        evidence=[
-                            f"Repository language: {repository.language or 'unknown'}"
-                        ],
+                        evidence=(
+                            f"Repository language: {repository.language or 'unknown'}",
+                        ),
                     )
                 )
 
@@ -217,7 +243,7 @@ class SkillMatcher:
 
         return 0.0
 
-    def _find_evidence(self, skill: str, text: str) -> list[str]:
+    def _find_evidence(self, skill: str, text: str) -> tuple[str, ...]:
         """Find evidence of skill matches in text."""
         evidence = []
 
@@ -238,7 +264,7 @@ class SkillMatcher:
                         evidence.append(f"...{context}...")
                         break
 
-        return evidence[:3]  # Limit to 3 pieces of evidence
+        return tuple(evidence[:3])  # Limit to 3 pieces of evidence
 
     def determine_difficulty(self, issue: GitHubIssue) -> str:
         """Determine the difficulty level of an issue."""
@@ -290,6 +316,7 @@ class IssueDiscovery:
         limit: Optional[int] = None,
         min_confidence: float = 0.1,
         include_personalization: bool = False,
+        on_recommendation: Optional[Callable[[IssueRecommendation], None]] = None,
     ) -> list[IssueRecommendation]:
         """Discover contribution opportunities across configured repositories.
 
@@ -299,6 +326,9 @@ class IssueDiscovery:
             limit: Maximum number of recommendations
             min_confidence: Minimum confidence score for recommendations
             include_personalization: Include personalized scoring based on contribution history
+            on_recommendation: Called with each recommendation as soon as its
+                repository has been searched; these are not yet ranked
+                across repositories or cut to ``limit``
 
         Returns:
             List of issue recommendations sorted by score
@@ -330,6 +360,10 @@ class IssueDiscovery:
                     )
                     recommendations.extend(repo_recommendations)
 
+                    if on_recommendation:
+                        for recommendation in repo_recommendations:
+                            on_recommendation(recommendation)
+
             # Sort by overall score (descending)
             recommendations.sort(key=lambda x: x.overall_score, reverse=True)
 
@@ -369,7 +403,7 @@ class IssueDiscovery:
                 limit=50,  # Reasonable limit per repository
             )
 
-            recommendations = []
+            candidates: list[tuple[GitHubIssue, list[SkillMatch]]] = []
 
             for issue in issues:
                 # Get user skills (from repository configuration)
@@ -385,17 +419,16 @@ class IssueDiscovery:
                 skill_matches = self.skill_matcher.match_skills_to_issue(
                     user_skills, issue, repository
                 )
+                candidates.append((issue, skill_matches))
 
-                # Calculate overall score with personalization if enabled
-                if include_personalization:
-                    overall_score = self._calculate_personalized_score(
-                        skill_matches, issue, repository
-                    )
-                else:
-                    overall_score = self._calculate_overall_score(
-                        skill_matches, issue, repository
-                    )
+            # Score all candidates at once (personalized if enabled)
+            scores = self._score_candidates(
+                candidates, repository, include_personalization
+            )
+
+            recommendations = []
 
+            for (issue, skill_matches), overall_score in zip(candidates, scores):
                 # Skip if below minimum confidence
                 if overall_score < min_confidence:
                     continue
@@ -410,7 +443,7 @@ class IssueDiscovery:
                 recommendation = IssueRecommendation(
                     issue=issue,
                     repository=repository,
-                    skill_matches=skill_matches,
+                    skill_matches=tuple(skill_matches),
                     overall_score=overall_score,
                     difficulty_level=difficulty,
                     estimated_time=estimated_time,
@@ -427,11 +460,209 @@ class IssueDiscovery:
             )
             return []
 
+    def _score_candidates(
+        self,
+        candidates: list[tuple[GitHubIssue, list[SkillMatch]]],
+        repository: Repository,
+        include_personalization: bool = False,
+    ) -> list[float]:
+        """Score candidate issues of a repository in one batch.
+
+        Uses the vectorized scorer when NumPy is available and falls back to the
+        per-issue scoring methods otherwise. Both paths produce identical scores.
+
+        Args:
+            candidates: Issues paired with their skill matches
+            repository: Repository containing the issues
+            include_personalization: Include personalized scoring
+
+        Returns:
+            Scores in the same order as ``candidates``
+        """
+        if not candidates:
+            return []
+
+        # Aggregated once per repository, so no scorer reads the history itself
+        try:
+            history = self.contribution_tracker.summarize_contribution_history(
+                repository.fork, repository.skills
+            )
+        except Exception as e:
+            self.logger.warning(f"Scoring without contribution history: {e}")
+            history = HistorySummary()
+
+        if np is not None:
+            try:
+                return self._score_candidates_batch(
+                    candidates, repository, history, include_personalization
+                )
+            except Exception as e:
+                self.logger.warning(f"Batch scoring failed, scoring per issue: {e}")
+
+        if include_personalization:
+            return [
+                self._calculate_personalized_score(matches, issue, repository, history)
+                for issue, matches in candidates
+            ]
+        return [
+            self._calculate_overall_score(matches, issue, repository, history)
+            for issue, matches in candidates
+        ]
+
+    def _score_candidates_batch(
+        self,
+        candidates: list[tuple[GitHubIssue, list[SkillMatch]]],
+        repository: Repository,
+        history: HistorySummary,
+        include_personalization: bool = False,
+    ) -> list[float]:
+        """Score candidate issues with NumPy feature matrices.
+
+        Mirrors ``_calculate_overall_score`` and ``_calculate_personalized_score``
+        term for term, evaluating each term as a vector over all candidates.
+        Matrix columns are skill-match slots and terms are accumulated in the
+        scalar order, so scores are bit-for-bit identical to the scalar path.
+
+        Args:
+            candidates: Issues paired with their skill matches
+            repository: Repository containing the issues
+            history: Contribution history aggregates
+            include_personalization: Include personalized scoring
+
+        Returns:
+            Scores in the same order as ``candidates``
+        """
+        candidate_count = len(candidates)
+        width = max((len(matches) for _, matches in candidates), default=0)
+
+        # Skill-match confidence matrix (issues x match slots), zero padded
+        confidences = np.zeros((candidate_count, width))
+        match_counts = np.zeros(candidate_count, dtype=np.int64)
+        for row, (_, matches) in enumerate(candidates):
+            match_counts[row] = len(matches)
+            for col, match in enumerate(matches):
+                confidences[row, col] = match.confidence
+
+        # Label flags
+        beginner_flags = np.array(
+            [
+                any("good first issue" in label.lower() for label in issue.labels)
+                for issue, _ in candidates
+            ],
+            dtype=bool,
+        )
+
+        # Sum column by column so additions happen in the scalar order
+        confidence_sums = np.zeros(candidate_count)
+        for col in range(width):
+            confidence_sums = confidence_sums + confidences[:, col]
+        has_matches = match_counts > 0
+        skill_scores = np.where(
+            has_matches, confidence_sums / np.maximum(match_counts, 1), 0.0
+        )
+
+        diversity_bonus = np.minimum(match_counts * 0.1, 0.3)
+
+        # Repeated additions of 0.1, looked up by high-confidence match count
+        repeated_tenths = np.concatenate(([0.0], np.cumsum(np.full(width, 0.1))))
+        high_confidence_bonus = repeated_tenths[(confidences > 0.8).sum(axis=1)]
+
+        beginner_bonus = np.where(beginner_flags, 0.2, 0.0)
+
+        now = time.time()
+        recency_bonus = np.array(
+            [self._calculate_recency_bonus(issue, now) for issue, _ in candidates]
+        )
+        history_bonus = self._calculate_history_bonus(
+            candidates[0][0], repository, history
+        )
+
+        total_scores = (
+            skill_scores
+            + diversity_bonus
+            + high_confidence_bonus
+            + beginner_bonus
+            + recency_bonus
+            + history_bonus
+        )
+        base_scores = np.where(has_matches, np.minimum(total_scores, 1.0), 0.0)
+
+        if not include_personalization or not history.contributions:
+            return [float(score) for score in base_scores]
+
+        personalization_bonus = np.zeros(candidate_count)
+
+        # Repository familiarity bonus
+        if history.repository_contributions:
+            personalization_bonus = personalization_bonus + min(
+                history.repository_successes * 0.08, 0.25
+            )
+
+        # Skill development pattern bonus, one matrix slot per skill match
+        skill_usage_pattern = history.skill_counts
+
+        skill_bonuses = np.zeros((candidate_count, width))
+        for row, (_, matches) in enumerate(candidates):
+            for col, match in enumerate(matches):
+                if match.skill in skill_usage_pattern:
+                    skill_bonuses[row, col] = min(
+                        skill_usage_pattern[match.skill] * 0.03, 0.15
+                    )
+        for col in range(width):
+            personalization_bonus = personalization_bonus + skill_bonuses[:, col]
+
+        # Issue type preference bonus
+        pr_count = history.pr_count
+        history_issue_count = history.issue_count
+        is_pr = np.array(
+            ["pull_request" in issue.html_url for issue, _ in candidates], dtype=bool
+        )
+        if pr_count > history_issue_count:
+            issue_type_bonus = np.where(is_pr, 0.1, 0.0)
+        elif history_issue_count > pr_count:
+            issue_type_bonus = np.where(is_pr, 0.0, 0.1)
+        else:
+            issue_type_bonus = np.zeros(candidate_count)
+        personalization_bonus = personalization_bonus + issue_type_bonus
+
+        # Difficulty preference bonus
+        difficulty_counts = {
+            "beginner": 0,
+            "intermediate": history.intermediate_successes,
+            "advanced": history.advanced_successes,
+        }
+        preferred_difficulty = max(
+            difficulty_counts, key=lambda k: difficulty_counts[k]
+        )
+        if difficulty_counts[preferred_difficulty] > 0:
+            prefers_difficulty = np.array(
+                [
+                    self.skill_matcher.determine_difficulty(issue)
+                    == preferred_difficulty
+                    for issue, _ in candidates
+                ],
+                dtype=bool,
+            )
+            difficulty_bonus = np.where(prefers_difficulty, 0.05, 0.0)
+        else:
+            difficulty_bonus = np.zeros(candidate_count)
+        personalization_bonus = personalization_bonus + difficulty_bonus
+
+        # Repository activity bonus
+        personalization_bonus = (
+            personalization_bonus
+            + self._calculate_repository_activity_bonus(repository, history)
+        )
+
+        final_scores = np.minimum(base_scores + personalization_bonus, 1.0)
+        return [float(score) for score in final_scores]
+
     def _calculate_overall_score(
         self,
         skill_matches: list[SkillMatch],
         issue: GitHubIssue,
         repository: Repository,
+        history: HistorySummary,
     ) -> float:
         """Calculate overall recommendation score."""
         if not skill_matches:
@@ -457,11 +688,11 @@ class IssueDiscovery:
             else 0.0
         )
 
-        # Bonus for recent issues
-        recency_bonus = 0.1  # Could be enhanced with actual date logic
+        # Bonus for recently updated issues
+        recency_bonus = self._calculate_recency_bonus(issue)
 
         # Contribution history bonus
-        history_bonus = self._calculate_history_bonus(issue, repository)
+        history_bonus = self._calculate_history_bonus(issue, repository, history)
 
         total_score = (
             skill_score
@@ -474,50 +705,47 @@ class IssueDiscovery:
 
         return min(total_score, 1.0)  # Cap at 1.0
 
+    def _calculate_recency_bonus(
+        self, issue: GitHubIssue, now: Optional[float] = None
+    ) -> float:
+        """Calculate bonus that decays with time since the issue was updated."""
+        if not issue.updated_timestamp:
+            return 0.0
+
+        if now is None:
+            now = time.time()
+
+        age_days = max(now - issue.updated_timestamp, 0.0) / 86400
+        return RECENCY_BONUS_MAX * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
     def _calculate_personalized_score(
         self,
         skill_matches: list[SkillMatch],
         issue: GitHubIssue,
         repository: Repository,
+        history: HistorySummary,
     ) -> float:
         """Calculate personalized score based on contribution history and patterns."""
         try:
             # Start with base score calculation
-            base_score = self._calculate_overall_score(skill_matches, issue, repository)
-
-            # Get contribution history
-            contributions = self.contribution_tracker.load_contribution_history()
+            base_score = self._calculate_overall_score(
+                skill_matches, issue, repository, history
+            )
 
-            if not contributions:
+            if not history.contributions:
                 return base_score  # No history available
 
             # Calculate personalized bonuses
             personalization_bonus = 0.0
 
             # Repository familiarity bonus
-            repo_contributions = [
-                c for c in contributions if c.repository == repository.fork
-            ]
-            if repo_contributions:
+            if history.repository_contributions:
                 # Higher bonus for repositories with successful contributions
-                successful_contributions = [
-                    c
-                    for c in repo_contributions
-                    if c.status in ["closed", "merged"] and c.impact_score > 0.5
-                ]
-                familiarity_bonus = min(len(successful_contributions) * 0.08, 0.25)
+                familiarity_bonus = min(history.repository_successes * 0.08, 0.25)
                 personalization_bonus += familiarity_bonus
 
             # Skill development pattern bonus
-            user_skills = set(repository.skills)
-            skill_usage_pattern: dict[str, int] = {}
-
-            for contribution in contributions:
-                for skill in contribution.skills_used:
-                    if skill in user_skills:
-                        skill_usage_pattern[skill] = (
-                            skill_usage_pattern.get(skill, 0) + 1
-                        )
+            skill_usage_pattern = history.skill_counts
 
             # Bonus for skills that have been successfully used
             for match in skill_matches:
@@ -528,18 +756,18 @@ class IssueDiscovery:
                     personalization_bonus += skill_bonus
 
             # Issue type preference bonus
-            issue_type_bonus = self._calculate_issue_type_bonus(issue, contributions)
+            issue_type_bonus = self._calculate_issue_type_bonus(issue, history)
             personalization_bonus += issue_type_bonus
 
             # Difficulty preference bonus
             difficulty_bonus = self._calculate_difficulty_preference_bonus(
-                issue, contributions
+                issue, history
             )
             personalization_bonus += difficulty_bonus
 
             # Repository activity bonus
             activity_bonus = self._calculate_repository_activity_bonus(
-                repository, contributions
+                repository, history
             )
             personalization_bonus += activity_bonus
 
@@ -550,18 +778,18 @@ class IssueDiscovery:
 
         except Exception as e:
             self.logger.warning(f"Failed to calculate personalized score: {e}")
-            return self._calculate_overall_score(skill_matches, issue, repository)
+            return self._calculate_overall_score(
+                skill_matches, issue, repository, history
+            )
 
     def _calculate_issue_type_bonus(
-        self, issue: GitHubIssue, contributions: list
+        self, issue: GitHubIssue, history: HistorySummary
     ) -> float:
         """Calculate bonus based on preferred issue types."""
         try:
             # Analyze past contribution types
-            pr_count = sum(1 for c in contributions if c.contribution_type == "pr")
-            issue_count = sum(
-                1 for c in contributions if c.contribution_type == "issue"
-            )
+            pr_count = history.pr_count
+            issue_count = history.issue_count
 
             current_type = "pr" if "pull_request" in issue.html_url else "issue"
 
@@ -578,30 +806,19 @@ class IssueDiscovery:
             return 0.0
 
     def _calculate_difficulty_preference_bonus(
-        self, issue: GitHubIssue, contributions: list
+        self, issue: GitHubIssue, history: HistorySummary
     ) -> float:
         """Calculate bonus based on difficulty preferences."""
         try:
             # Analyze past contribution difficulties
             difficulty = self.skill_matcher.determine_difficulty(issue)
 
-            # Count successful contributions by difficulty
-            successful_contributions = [
-                c
-                for c in contributions
-                if c.status in ["closed", "merged"] and c.impact_score > 0.5
-            ]
-
-            difficulty_counts = {"beginner": 0, "intermediate": 0, "advanced": 0}
-
-            for contribution in successful_contributions:
-                # Estimate difficulty from impact score and labels
-                if contribution.impact_score > 0.8:
-                    difficulty_counts["advanced"] += 1
-                elif contribution.impact_score > 0.5:
-                    difficulty_counts["intermediate"] += 1
-                else:
-                    difficulty_counts["beginner"] += 1
+            # Successful contributions by difficulty, estimated from impact score
+            difficulty_counts = {
+                "beginner": 0,
+                "intermediate": history.intermediate_successes,
+                "advanced": history.advanced_successes,
+            }
 
             # Bonus for preferred difficulty level
             preferred_difficulty = max(
@@ -620,71 +837,38 @@ class IssueDiscovery:
             return 0.0
 
     def _calculate_repository_activity_bonus(
-        self, repository: Repository, contributions: list
+        self, repository: Repository, history: HistorySummary
     ) -> float:
         """Calculate bonus based on repository activity patterns."""
-        try:
-            # Analyze activity in similar repositories
-            repo_contributions = [
-                c
-                for c in contributions
-                if any(skill in c.skills_used for skill in repository.skills)
-            ]
-
-            if not repo_contributions:
-                return 0.0
-
-            # Bonus for repositories with good engagement
-            recent_contributions = [
-                c
-                for c in repo_contributions
-                if c.status in ["closed", "merged"] and c.impact_score > 0.6
-            ]
+        # Bonus when work with the repository's skills has had good engagement
+        if history.skilled_engagement:
+            return 0.05
 
-            if recent_contributions:
-                return 0.05
-
-            return 0.0
-
-        except Exception as e:
-            self.logger.warning(f"Failed to calculate repository activity bonus: {e}")
-            return 0.0
+        return 0.0
 
     def _calculate_history_bonus(
-        self, issue: GitHubIssue, repository: Repository
+        self,
+        issue: GitHubIssue,
+        repository: Repository,
+        history: HistorySummary,
     ) -> float:
         """Calculate bonus score based on contribution history."""
         try:
-            # Get contribution history for this repository
-            contributions = self.contribution_tracker.load_contribution_history()
-            repo_contributions = [
-                c for c in contributions if c.repository == repository.fork
-            ]
-
-            if not repo_contributions:
+            if not history.repository_contributions:
                 return 0.0  # No history, no bonus
 
             # Calculate repository familiarity bonus
-            repo_contribution_count = len(repo_contributions)
-            familiarity_bonus = min(repo_contribution_count * 0.05, 0.2)
-
-            # Calculate skill development bonus
-            user_skills = set(repository.skills)
-            developed_skills = set()
-            for contribution in repo_contributions:
-                developed_skills.update(contribution.skills_used)
+            familiarity_bonus = min(history.repository_contributions * 0.05, 0.2)
 
             # Bonus for skills that have been successfully used in this repo
+            user_skills = set(repository.skills)
             skill_bonus = 0.0
             for skill in user_skills:
-                if skill in developed_skills:
+                if skill in history.repository_skills:
                     skill_bonus += 0.05
 
             # Bonus for high-impact contributions in this repo
-            high_impact_contributions = [
-                c for c in repo_contributions if c.impact_score > 0.7
-            ]
-            impact_bonus = min(len(high_impact_contributions) * 0.03, 0.15)
+            impact_bonus = min(history.repository_high_impact * 0.03, 0.15)
 
             return min(familiarity_bonus + skill_bonus + impact_bonus, 0.3)
 
@@ -697,7 +881,7 @@ class IssueDiscovery:
         issue: GitHubIssue,
         repository: Repository,
         skill_matches: list[SkillMatch],
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """Generate tags for the recommendation."""
         tags = []
 
@@ -725,7 +909,7 @@ class IssueDiscovery:
         if any("help wanted" in label.lower() for label in issue.labels):
             tags.append("help-wanted")
 
-        return list(set(tags))  # Remove duplicates
+        return tuple(set(tags))  # Remove duplicates
 
 
 def create_discovery_engine(
@@ -2,11 +2,106 @@
 
 import csv
 import json
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from types import TracebackType
+from typing import Any, Callable, Optional, TextIO
+
+from ..utils.common import (
+    get_logger,
+    parse_iso_timestamp,
+    print_error_panel,
+    print_success_panel,
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is an optional extra
+    pa = None
+    pq = None
+
+# Rows per Parquet row group; rows are converted and written one group at a
+# time, so an export holds at most this many rows in memory
+PARQUET_ROW_GROUP_SIZE = 65536
+
+PARQUET_COMPRESSION = "zstd"
+
+
+def _ndjson_default(value: Any) -> Any:
+    """Convert a value the json module cannot serialize on its own."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+class NDJSONWriter:
+    """Streams records as newline-delimited JSON while they are produced.
+
+    Each record is written as one line and flushed at once, so downstream
+    tools can consume the results of a long-running batch command live and
+    nothing has to be buffered until the end. Dataclass records such as
+    ``BatchResult`` or ``RepositoryHealthMetrics`` are written field by
+    field. Writes are serialized, so worker threads may share a writer.
+    """
 
-from ..utils.common import get_logger, print_error_panel, print_success_panel
+    def __init__(self, export_path: Optional[str] = None):
+        """Initialize the writer.
+
+        Args:
+            export_path: File to write to (defaults to standard output)
+        """
+        self.export_path = export_path
+        self.records_written = 0
+        self._stream: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "NDJSONWriter":
+        """Open the output stream."""
+        if self.export_path:
+            export_file = Path(self.export_path)
+            export_file.parent.mkdir(parents=True, exist_ok=True)
+            self._stream = open(export_file, "w", encoding="utf-8")
+        else:
+            self._stream = sys.stdout
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the output stream unless it is standard output."""
+        if self._stream is not None and self._stream is not sys.stdout:
+            self._stream.close()
+        self._stream = None
+
+    def write(self, record: Any) -> None:
+        """Write one record as a JSON line.
+
+        Args:
+            record: Dictionary or dataclass instance to write
+
+        Raises:
+            RuntimeError: If the writer has not been opened.
+        """
+        if self._stream is None:
+            raise RuntimeError("NDJSON writer is not open")
+        line = json.dumps(record, ensure_ascii=False, default=_ndjson_default)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+            self.records_written += 1
 
 
 def export_sync_results(
@@ -341,3 +436,379 @@ def export_health_data(
             "Export Failed",
             f"Failed to export health data: {str(e)}",
         )
+
+
+def _timestamp_us(value: Optional[str]) -> Optional[int]:
+    """Convert an ISO 8601 timestamp into epoch microseconds, None if unset."""
+    seconds = parse_iso_timestamp(value)
+    return round(seconds * 1_000_000) if seconds else None
+
+
+def _column_array(values: Sequence[Any], arrow_type: "pa.DataType") -> "pa.Array":
+    """Build a Parquet column from row values.
+
+    Timestamp columns hold ISO 8601 strings. Arrow parses a whole column at
+    once when every value carries a UTC offset, as GitHub timestamps do;
+    otherwise each value is parsed with ``parse_iso_timestamp``, which reads
+    naive timestamps as UTC.
+    """
+    if not pa.types.is_timestamp(arrow_type):
+        return pa.array(values, type=arrow_type)
+    try:
+        return pa.array(values, type=pa.string()).cast(arrow_type)
+    except pa.ArrowInvalid:
+        return pa.array([_timestamp_us(value) for value in values], type=arrow_type)
+
+
+def _timestamp_type() -> "pa.DataType":
+    """Arrow type of exported timestamps."""
+    return pa.timestamp("us", tz="UTC")
+
+
+def _contribution_schema() -> "pa.Schema":
+    """Parquet schema of exported contributions."""
+    return pa.schema(
+        [
+            ("repository", pa.string()),
+            ("issue_number", pa.int64()),
+            ("issue_title", pa.string()),
+            ("issue_url", pa.string()),
+            ("contribution_type", pa.string()),
+            ("status", pa.string()),
+            ("created_at", _timestamp_type()),
+            ("updated_at", _timestamp_type()),
+            ("skills_used", pa.list_(pa.string())),
+            ("impact_score", pa.float64()),
+            ("labels", pa.list_(pa.string())),
+            ("milestone", pa.string()),
+            ("assignees", pa.list_(pa.string())),
+            ("comments_count", pa.int64()),
+            ("reactions_count", pa.int64()),
+        ]
+    )
+
+
+def _contribution_row(contribution: Any) -> tuple[Any, ...]:
+    """Convert a contribution into a row of ``_contribution_schema``."""
+    return (
+        contribution.repository,
+        contribution.issue_number,
+        contribution.issue_title,
+        contribution.issue_url,
+        contribution.contribution_type,
+        contribution.status,
+        contribution.created_at or None,
+        contribution.updated_at or None,
+        contribution.skills_used,
+        contribution.impact_score,
+        contribution.labels,
+        contribution.milestone,
+        contribution.assignees,
+        contribution.comments_count,
+        contribution.reactions_count,
+    )
+
+
+def _recommendation_schema() -> "pa.Schema":
+    """Parquet schema of exported discovery results."""
+    skill_match = pa.struct(
+        [
+            ("skill", pa.string()),
+            ("confidence", pa.float64()),
+            ("match_type", pa.string()),
+            ("evidence", pa.list_(pa.string())),
+        ]
+    )
+    return pa.schema(
+        [
+            ("repository", pa.string()),
+            ("fork", pa.string()),
+            ("upstream", pa.string()),
+            ("language", pa.string()),
+            ("issue_number", pa.int64()),
+            ("issue_title", pa.string()),
+            ("issue_state", pa.string()),
+            ("issue_url", pa.string()),
+            ("issue_labels", pa.list_(pa.string())),
+            ("issue_created_at", _timestamp_type()),
+            ("issue_updated_at", _timestamp_type()),
+            ("skill_matches", pa.list_(skill_match)),
+            ("overall_score", pa.float64()),
+            ("difficulty_level", pa.string()),
+            ("estimated_time", pa.string()),
+            ("tags", pa.list_(pa.string())),
+        ]
+    )
+
+
+def _recommendation_row(recommendation: Any) -> tuple[Any, ...]:
+    """Convert a recommendation into a row of ``_recommendation_schema``."""
+    issue = recommendation.issue
+    repository = recommendation.repository
+    return (
+        repository.name,
+        repository.fork,
+        repository.upstream,
+        repository.language,
+        issue.number,
+        issue.title,
+        issue.state,
+        issue.html_url,
+        issue.labels,
+        issue.created_at or None,
+        issue.updated_at or None,
+        [
+            {
+                "skill": match.skill,
+                "confidence": match.confidence,
+                "match_type": match.match_type,
+                "evidence": match.evidence,
+            }
+            for match in recommendation.skill_matches
+        ],
+        recommendation.overall_score,
+        recommendation.difficulty_level,
+        recommendation.estimated_time,
+        recommendation.tags,
+    )
+
+
+def _health_schema() -> "pa.Schema":
+    """Parquet schema of exported repository health metrics."""
+    return pa.schema(
+        [
+            ("repository_name", pa.string()),
+            ("repository_path", pa.string()),
+            ("upstream_url", pa.string()),
+            ("last_commit_days_ago", pa.int64()),
+            ("total_commits", pa.int64()),
+            ("recent_commits_30d", pa.int64()),
+            ("recent_commits_7d", pa.int64()),
+            ("total_contributors", pa.int64()),
+            ("active_contributors_30d", pa.int64()),
+            ("active_contributors_7d", pa.int64()),
+            ("stars_count", pa.int64()),
+            ("forks_count", pa.int64()),
+            ("open_issues_count", pa.int64()),
+            ("open_prs_count", pa.int64()),
+            ("days_since_last_sync", pa.int64()),
+            ("sync_status", pa.string()),
+            ("uncommitted_changes", pa.bool_()),
+            ("issue_response_time_avg", pa.float64()),
+            ("pr_merge_time_avg", pa.float64()),
+            ("contributor_engagement_score", pa.float64()),
+            ("stars_growth_30d", pa.int64()),
+            ("forks_growth_30d", pa.int64()),
+            ("issues_growth_30d", pa.int64()),
+            ("overall_health_score", pa.float64()),
+            ("health_status", pa.string()),
+            ("language", pa.string()),
+            ("topics", pa.list_(pa.string())),
+            ("archived", pa.bool_()),
+            ("disabled", pa.bool_()),
+        ]
+    )
+
+
+def _health_row(metrics: Any) -> tuple[Any, ...]:
+    """Convert health metrics into a row of ``_health_schema``."""
+    return (
+        metrics.repository_name,
+        metrics.repository_path,
+        metrics.upstream_url,
+        metrics.last_commit_days_ago,
+        metrics.total_commits,
+        metrics.recent_commits_30d,
+        metrics.recent_commits_7d,
+        metrics.total_contributors,
+        metrics.active_contributors_30d,
+        metrics.active_contributors_7d,
+        metrics.stars_count,
+        metrics.forks_count,
+        metrics.open_issues_count,
+        metrics.open_prs_count,
+        metrics.days_since_last_sync,
+        metrics.sync_status,
+        metrics.uncommitted_changes,
+        metrics.issue_response_time_avg,
+        metrics.pr_merge_time_avg,
+        metrics.contributor_engagement_score,
+        metrics.stars_growth_30d,
+        metrics.forks_growth_30d,
+        metrics.issues_growth_30d,
+        metrics.overall_health_score,
+        metrics.health_status,
+        metrics.language,
+        metrics.topics,
+        metrics.archived,
+        metrics.disabled,
+    )
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most ``size`` items."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _write_parquet(
+    records: Iterable[Any],
+    schema_factory: Callable[[], "pa.Schema"],
+    to_row: Callable[[Any], tuple[Any, ...]],
+    export_path: str,
+    row_group_size: int,
+) -> int:
+    """Write records to a Parquet file one row group at a time.
+
+    Args:
+        records: Records to write, consumed lazily
+        schema_factory: Builds the schema of the file
+        to_row: Converts a record into a row in schema order
+        export_path: Path of the Parquet file
+        row_group_size: Rows per row group
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    if pa is None:
+        raise ImportError(
+            "Parquet export requires pyarrow; install it with "
+            "'pip install gitco[parquet]'"
+        )
+
+    schema = schema_factory()
+    export_file = Path(export_path)
+    export_file.parent.mkdir(parents=True, exist_ok=True)
+
+    rows_written = 0
+    with pq.ParquetWriter(
+        export_file, schema, compression=PARQUET_COMPRESSION
+    ) as writer:
+        for batch in _batched(records, row_group_size):
+            columns = zip(*(to_row(record) for record in batch))
+            table = pa.Table.from_arrays(
+                [
+                    _column_array(column, column_field.type)
+                    for column, column_field in zip(columns, schema)
+                ],
+                schema=schema,
+            )
+            writer.write_table(table, row_group_size=row_group_size)
+            rows_written += len(batch)
+    return rows_written
+
+
+def _export_parquet(
+    description: str,
+    records: Iterable[Any],
+    schema_factory: Callable[[], "pa.Schema"],
+    to_row: Callable[[Any], tuple[Any, ...]],
+    export_path: str,
+    row_group_size: int,
+) -> int:
+    """Export records to Parquet and report the outcome in a panel.
+
+    Returns:
+        Number of rows written, 0 if the export failed
+    """
+    try:
+        rows_written = _write_parquet(
+            records, schema_factory, to_row, export_path, row_group_size
+        )
+
+        print_success_panel(
+            "Parquet Export Successful",
+            f"{rows_written} {description} rows exported to: {export_path}",
+        )
+        return rows_written
+
+    except Exception as e:
+        logger = get_logger()
+        logger.error(f"Failed to export {description} to Parquet: {e}")
+        print_error_panel(
+            "Parquet Export Failed",
+            f"Failed to export {description}: {str(e)}",
+        )
+        return 0
+
+
+def export_contributions_to_parquet(
+    contributions: Iterable[Any],
+    export_path: str,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> int:
+    """Export contribution data to a Parquet file.
+
+    Contributions are consumed lazily and written one row group at a time,
+    so a generator can feed exports of any size with bounded memory.
+
+    Args:
+        contributions: Contribution objects
+        export_path: Path to export the Parquet file
+        row_group_size: Rows per row group
+
+    Returns:
+        Number of contributions exported
+    """
+    return _export_parquet(
+        "contribution",
+        contributions,
+        _contribution_schema,
+        _contribution_row,
+        export_path,
+        row_group_size,
+    )
+
+
+def export_discovery_results_to_parquet(
+    recommendations: Iterable[Any],
+    export_path: str,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> int:
+    """Export discovery results to a Parquet file, one row per recommendation.
+
+    Args:
+        recommendations: Recommendation objects
+        export_path: Path to export the Parquet file
+        row_group_size: Rows per row group
+
+    Returns:
+        Number of recommendations exported
+    """
+    return _export_parquet(
+        "discovery result",
+        recommendations,
+        _recommendation_schema,
+        _recommendation_row,
+        export_path,
+        row_group_size,
+    )
+
+
+def export_health_data_to_parquet(
+    repository_metrics: Iterable[Any],
+    export_path: str,
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> int:
+    """Export repository health metrics to a Parquet file.
+
+    Args:
+        repository_metrics: Repository health metrics objects
+        export_path: Path to export the Parquet file
+        row_group_size: Rows per row group
+
+    Returns:
+        Number of repositories exported
+    """
+    return _export_parquet(
+        "health metrics",
+        repository_metrics,
+        _health_schema,
+        _health_row,
+        export_path,
+        row_group_size,
+    )
@@ -1,10 +1,13 @@
 """Git operations and repository management for GitCo."""
 
+import contextlib
 import gc
 import os
 import re
 import subprocess
+import tempfile
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,11 +24,20 @@ from ..utils.common import (
     console,
     create_progress_bar,
     get_logger,
+    slotted_dataclass,
 )
 from ..utils.exception import GitOperationError
+from .commit_activity import (
+    COMMIT_ACTIVITY_FORMAT,
+    CommitActivity,
+    scan_commit_activity,
+)
+from .diff_condenser import DEFAULT_DIFF_TOKEN_BUDGET, condense_diff_stream
+from .diff_parser import DiffHunk
 
 
-@dataclass
+@slotted_dataclass
+@dataclass(frozen=True)
 class BatchResult:
     """Result of a batch operation on a repository."""
 
@@ -50,6 +62,9 @@ class BatchPerformanceMetrics:
     average_duration: float
     memory_usage_mb: float
     cpu_usage_percent: float
+    throughput_repos_per_second: float
+    concurrent_workers: int
+    batch_size: int
 
 
 @dataclass
@@ -528,6 +543,7 @@ class BatchProcessor:
         operation_func: Callable[[str, dict[str, Any]], dict[str, Any]],
         operation_name: str = "sync",
         show_progress: bool = True,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
     ) -> list[BatchResult]:
         """Process multiple repositories in batch with performance optimizations.
 
@@ -536,6 +552,8 @@ class BatchProcessor:
             operation_func: Function to execute on each repository
             operation_name: Name of the operation for logging
             show_progress: Whether to show progress indicators
+            on_result: Called with each repository's result as soon as it
+                completes, e.g. to stream results to a consumer
 
         Returns:
             List of batch results for each repository
@@ -573,7 +591,12 @@ class BatchProcessor:
 
                     # Process current batch with thread pool
                     batch_results = self._process_batch(
-                        batch, operation_func, operation_name, progress, task
+                        batch,
+                        operation_func,
+                        operation_name,
+                        progress,
+                        task,
+                        on_result,
                     )
                     results.extend(batch_results)
 
@@ -585,7 +608,7 @@ class BatchProcessor:
             for i in range(0, len(repositories), batch_size):
                 batch = repositories[i : i + batch_size]
                 batch_results = self._process_batch_quiet(
-                    batch, operation_func, operation_name
+                    batch, operation_func, operation_name, on_result
                 )
                 results.extend(batch_results)
 
@@ -616,6 +639,7 @@ class BatchProcessor:
         operation_name: str,
         progress: Any,
         task: Any,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
     ) -> list[BatchResult]:
         """Process a batch of repositories with progress tracking."""
         batch_results = []
@@ -645,6 +669,9 @@ class BatchProcessor:
                 # Show result with color coding
                 self._print_repository_result(result)
 
+                if on_result:
+                    on_result(result)
+
             except Exception as e:
                 # Handle unexpected errors in the future
                 error_result = BatchResult(
@@ -665,6 +692,9 @@ class BatchProcessor:
                 # Show error result
                 self._print_repository_result(error_result)
 
+                if on_result:
+                    on_result(error_result)
+
         return batch_results
 
     def _process_batch_quiet(
@@ -672,6 +702,7 @@ class BatchProcessor:
         batch: list[dict[str, Any]],
         operation_func: Callable[[str, dict[str, Any]], dict[str, Any]],
         operation_name: str,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
     ) -> list[BatchResult]:
         """Process a batch of repositories without progress tracking."""
         batch_results = []
@@ -693,9 +724,8 @@ class BatchProcessor:
             repo = future_to_repo[future]
             try:
                 result = future.result()
-                batch_results.append(result)
             except Exception as e:
-                error_result = BatchResult(
+                result = BatchResult(
                     repository_name=repo.get("name", "unknown"),
                     repository_path=repo.get("local_path", "unknown"),
                     success=False,
@@ -705,7 +735,10 @@ class BatchProcessor:
                     duration=0.0,
                     error=e,
                 )
-                batch_results.append(error_result)
+            batch_results.append(result)
+
+            if on_result:
+                on_result(result)
 
         return batch_results
 
@@ -1478,71 +1511,17 @@ class GitRepository:
             status: Status dictionary to update with health metrics
         """
         try:
-            # Get total commit count
-            result = self._run_git_command(
-                ["rev-list", "--count", "HEAD"], capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                status["total_commits"] = int(result.stdout.strip())
-
-            # Get recent commits (30 days)
-            result = self._run_git_command(
-                ["rev-list", "--count", "HEAD --since='30 days ago'"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                status["recent_commits_30d"] = int(result.stdout.strip())
-
-            # Get recent commits (7 days)
-            result = self._run_git_command(
-                ["rev-list", "--count", "HEAD --since='7 days ago'"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                status["recent_commits_7d"] = int(result.stdout.strip())
-
-            # Get last commit information
-            result = self._run_git_command(
-                ["log", "-1", "--format=%H %at"], capture_output=True, text=True
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                import time
-
-                parts = result.stdout.strip().split()
-                if len(parts) >= 2:
-                    commit_time = int(parts[1])
-                    days_ago = (time.time() - commit_time) / (24 * 3600)
-                    status["last_commit_days_ago"] = int(days_ago)
-
-            # Get contributor information (simplified)
-            result = self._run_git_command(
-                ["shortlog", "-sn", "--all"], capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                status["total_contributors"] = len(lines)
-
-            # Get recent contributors (30 days)
-            result = self._run_git_command(
-                ["shortlog", "-sn", "--all", "--since='30 days ago'"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                status["active_contributors_30d"] = len(lines)
-
-            # Get recent contributors (7 days)
-            result = self._run_git_command(
-                ["shortlog", "-sn", "--all", "--since='7 days ago'"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split("\n")
-                status["active_contributors_7d"] = len(lines)
+            # Commit and contributor counts from one pass over the history
+            activity = self.get_commit_activity()
+            status["total_commits"] = activity.total_commits
+            status["recent_commits_30d"] = activity.commits_30d
+            status["recent_commits_7d"] = activity.commits_7d
+            status["total_contributors"] = activity.total_authors
+            status["active_contributors_30d"] = activity.authors_30d
+            status["active_contributors_7d"] = activity.authors_7d
+            if activity.last_commit_ts is not None:
+                days_ago = (time.time() - activity.last_commit_ts) / (24 * 3600)
+                status["last_commit_days_ago"] = int(days_ago)
 
             # Determine sync status
             upstream_status = status.get("upstream_status", {})
@@ -1791,11 +1770,19 @@ class GitRepository:
 
             return False, stash_ref
 
-    def get_recent_changes(self, num_commits: int = 10) -> str:
+    def get_recent_changes(
+        self,
+        num_commits: int = 10,
+        token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET,
+        on_hunk: Optional[Callable[[DiffHunk], None]] = None,
+    ) -> str:
         """Get recent changes as diff content.
 
         Args:
             num_commits: Number of recent commits to include in diff.
+            token_budget: Maximum estimated tokens of detailed diff content.
+            on_hunk: Called with every diff hunk read, including those left
+                out of the condensed diff.
 
         Returns:
             Diff content as string, or empty string if no changes.
@@ -1811,116 +1798,204 @@ class GitRepository:
             if not upstream_branch:
                 return ""
 
-            # First try to get diff between current branch and upstream
+            # First try the diff between current branch and upstream; the
+            # condensed diff starts with its own per-file stat summary
+            diff_range = f"origin/{upstream_branch}..HEAD"
+            detailed_diff = self._get_detailed_diff(diff_range, token_budget, on_hunk)
+            if detailed_diff:
+                return detailed_diff
+
+            # Changes without text hunks (e.g. binary files) only have stats
             result = self._run_git_command(
-                ["diff", f"origin/{upstream_branch}..HEAD", "--stat"],
+                ["diff", diff_range, "--stat"],
                 capture_output=True,
                 text=True,
             )
-
             if result.returncode == 0 and result.stdout and result.stdout.strip():
-                # Get detailed diff content for better analysis
-                detailed_diff = self._get_detailed_diff(
-                    f"origin/{upstream_branch}..HEAD"
-                )
-                if detailed_diff:
-                    return f"{result.stdout}\n\nDetailed Changes:\n{detailed_diff}"
                 return str(result.stdout)
-            else:
-                # Try to get recent commits diff
-                result = self._run_git_command(
-                    ["log", f"-{num_commits}", "--oneline", "--stat"],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0 and result.stdout:
-                    # Get detailed diff for recent commits
-                    detailed_diff = self._get_detailed_commit_diff(num_commits)
-                    if detailed_diff:
-                        return f"{result.stdout}\n\nDetailed Changes:\n{detailed_diff}"
-                    return str(result.stdout)
-                return ""
+
+            # Try to get recent commits diff
+            detailed_diff = self._get_detailed_commit_diff(
+                num_commits, token_budget, on_hunk
+            )
+            if detailed_diff:
+                return detailed_diff
+
+            result = self._run_git_command(
+                ["log", f"-{num_commits}", "--oneline", "--stat"],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode == 0 and result.stdout:
+                return str(result.stdout)
+            return ""
 
         except Exception as e:
             self.logger.warning(f"Failed to get recent changes: {e}")
             return ""
 
-    def _get_detailed_diff(self, diff_range: str) -> str:
+    def _get_detailed_diff(
+        self,
+        diff_range: str,
+        token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET,
+        on_hunk: Optional[Callable[[DiffHunk], None]] = None,
+    ) -> str:
         """Get detailed diff content for analysis.
 
+        The diff is streamed and condensed to its most informative hunks plus
+        a per-file summary, so large ranges fit the token budget without
+        being cut off after the first few files.
+
         Args:
             diff_range: Git diff range (e.g., "origin/main..HEAD").
+            token_budget: Maximum estimated tokens of diff content.
+            on_hunk: Called with every diff hunk read, including those left
+                out of the condensed diff.
 
         Returns:
             Detailed diff content as string.
         """
         try:
-            # Get detailed diff with context
-            result = self._run_git_command(
-                ["diff", diff_range, "--unified=3", "--no-color"],
-                capture_output=True,
-                text=True,
+            return self._condense_git_diff(
+                ["diff", diff_range, "--unified=3", "--no-color"], token_budget, on_hunk
             )
 
-            if result.returncode == 0 and result.stdout:
-                # Limit the size to avoid overwhelming the AI
-                diff_content = str(result.stdout)
-                if len(diff_content) > 10000:  # Limit to 10KB
-                    diff_content = diff_content[:10000] + "\n... (truncated)"
-                return diff_content
-            return ""
-
         except Exception as e:
             self.logger.warning(f"Failed to get detailed diff: {e}")
             return ""
 
-    def _get_detailed_commit_diff(self, num_commits: int) -> str:
+    def _get_detailed_commit_diff(
+        self,
+        num_commits: int,
+        token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET,
+        on_hunk: Optional[Callable[[DiffHunk], None]] = None,
+    ) -> str:
         """Get detailed diff for recent commits.
 
         Args:
             num_commits: Number of recent commits to analyze.
+            token_budget: Maximum estimated tokens of diff content.
+            on_hunk: Called with every diff hunk read, including those left
+                out of the condensed diff.
 
         Returns:
             Detailed diff content as string.
         """
         try:
-            # Get the commit hashes for recent commits
-            result = self._run_git_command(
-                ["log", f"-{num_commits}", "--format=%H", "--no-merges"],
-                capture_output=True,
-                text=True,
+            # One streaming read of all patches, stopped once the budget is hit
+            return self._condense_git_diff(
+                [
+                    "log",
+                    f"-{num_commits}",
+                    "--no-merges",
+                    "--patch",
+                    "--unified=3",
+                    "--no-color",
+                    "--format=commit %H",
+                ],
+                token_budget,
+                on_hunk,
             )
 
-            if result.returncode != 0 or not result.stdout:
-                return ""
-
-            commit_hashes = [h.strip() for h in result.stdout.splitlines() if h.strip()]
-            if not commit_hashes:
-                return ""
+        except Exception as e:
+            self.logger.warning(f"Failed to get detailed commit diff: {e}")
+            return ""
 
-            # Get detailed diff for each commit
-            detailed_diffs = []
-            for commit_hash in commit_hashes:
-                diff_result = self._run_git_command(
-                    ["show", commit_hash, "--unified=3", "--no-color", "--stat"],
-                    capture_output=True,
-                    text=True,
-                )
-                if diff_result.returncode == 0 and diff_result.stdout:
-                    detailed_diffs.append(diff_result.stdout)
+    def get_commits_diff(
+        self,
+        commit_hashes: list[str],
+        token_budget: int = DEFAULT_DIFF_TOKEN_BUDGET,
+        on_hunk: Optional[Callable[[DiffHunk], None]] = None,
+    ) -> str:
+        """Get the condensed combined diff of a set of commits.
 
-            if detailed_diffs:
-                combined_diff = "\n\n".join(detailed_diffs)
-                # Limit the size to avoid overwhelming the AI
-                if len(combined_diff) > 10000:  # Limit to 10KB
-                    combined_diff = combined_diff[:10000] + "\n... (truncated)"
-                return combined_diff
+        Args:
+            commit_hashes: Commits whose changes to include.
+            token_budget: Maximum estimated tokens of diff content.
+            on_hunk: Called with every diff hunk read, including those left
+                out of the condensed diff.
 
+        Returns:
+            Condensed diff content as string.
+        """
+        if not commit_hashes:
             return ""
 
+        # A single git show streams the patches of all commits
+        return self._condense_git_diff(
+            ["show", "--unified=3", "--no-color", "--format=commit %H"] + commit_hashes,
+            token_budget,
+            on_hunk,
+        )
+
+    def _condense_git_diff(
+        self,
+        args: list[str],
+        token_budget: int,
+        on_hunk: Optional[Callable[[DiffHunk], None]] = None,
+    ) -> str:
+        """Stream a diff-producing Git command into a condensed diff.
+
+        The command is terminated as soon as enough output has been read for
+        the token budget.
+
+        Args:
+            args: Git command arguments producing unified diff output.
+            token_budget: Maximum estimated tokens of diff content.
+            on_hunk: Called with every diff hunk read, including those left
+                out of the condensed diff.
+
+        Returns:
+            Condensed diff content as string.
+        """
+        with contextlib.closing(self._stream_git_command(args)) as lines:
+            return condense_diff_stream(lines, token_budget, on_hunk=on_hunk)
+
+    def get_range_commits(
+        self, commit_range: Optional[str] = None, max_commits: int = 1000
+    ) -> list[tuple[str, str]]:
+        """Get the commits of a range, oldest first.
+
+        Args:
+            commit_range: Git revision range; defaults to the commits on HEAD
+                that are not on the origin default branch.
+            max_commits: Maximum number of (most recent) commits to return.
+
+        Returns:
+            List of (commit hash, subject) tuples, oldest first.
+        """
+        try:
+            if commit_range is None:
+                default_branch = self.get_default_branch()
+                if not default_branch:
+                    return []
+                commit_range = f"origin/{default_branch}..HEAD"
+
+            result = self._run_git_command(
+                [
+                    "log",
+                    commit_range,
+                    f"-{max_commits}",
+                    "--no-merges",
+                    "--reverse",
+                    "--format=%H%x00%s",
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                return []
+
+            commits = []
+            for line in result.stdout.splitlines():
+                commit_hash, _, subject = line.partition("\0")
+                if commit_hash:
+                    commits.append((commit_hash, subject))
+            return commits
+
         except Exception as e:
-            self.logger.warning(f"Failed to get detailed commit diff: {e}")
-            return ""
+            self.logger.warning(f"Failed to get commits for range: {e}")
+            return []
 
     def get_commit_diff_analysis(self, commit_hash: str) -> dict[str, Any]:
         """Get detailed analysis of a specific commit.
@@ -2121,6 +2196,86 @@ class GitRepository:
             self.logger.debug(f"Error getting commit info: {e}")
             return {"hash": commit_hash, "info": ""}
 
+    def get_commit_activity(self, now: Optional[float] = None) -> CommitActivity:
+        """Summarize the commit activity of HEAD's history.
+
+        The history is streamed through a single ``git log`` process, so
+        every window and the activity histogram cost one subprocess.
+
+        Args:
+            now: Epoch seconds the activity windows end at (defaults to now)
+
+        Returns:
+            Commit activity; empty if the repository has no commits
+
+        Raises:
+            GitOperationError: If the Git command cannot be started or fails
+        """
+        try:
+            return scan_commit_activity(
+                self._stream_git_command(["log", COMMIT_ACTIVITY_FORMAT, "HEAD"]), now
+            )
+        except GitOperationError:
+            # git log fails on a branch without commits yet
+            head = self._run_git_command(
+                ["rev-parse", "--verify", "--quiet", "HEAD"], capture_output=True
+            )
+            if head.returncode != 0:
+                return scan_commit_activity((), now)
+            raise
+
+    def _stream_git_command(self, args: list[str]) -> Iterator[str]:
+        """Run a Git command and yield its stdout line by line.
+
+        The process is terminated if the consumer stops iterating early, so
+        callers can read only as much output as they need; its exit status is
+        ignored then. Standard error goes to a temporary file, which cannot
+        fill up and block the process the way an unread pipe would.
+
+        Args:
+            args: Git command arguments
+
+        Yields:
+            Lines of standard output, including line endings
+
+        Raises:
+            GitOperationError: If the Git command cannot be started, or exits
+                with an error after all of its output has been read
+        """
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                process = subprocess.Popen(
+                    ["git"] + args,
+                    cwd=self.path,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    text=True,
+                    errors="replace",
+                )
+            except Exception as e:
+                raise GitOperationError(
+                    f"Failed to run Git command {' '.join(args)}: {e}"
+                ) from e
+
+            try:
+                if process.stdout is not None:
+                    yield from process.stdout
+            finally:
+                if process.poll() is None:
+                    process.terminate()
+                if process.stdout is not None:
+                    process.stdout.close()
+                process.wait()
+
+            # Only reached when the output was read to the end
+            if process.returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode(errors="replace").strip()
+                raise GitOperationError(
+                    f"Git command {' '.join(args)} failed with exit code "
+                    f"{process.returncode}: {message}"
+                )
+
     def _run_git_command(
         self,
         args: list[str],
@@ -2178,6 +2333,7 @@ class GitRepositoryManager:
         repositories: list[dict[str, Any]],
         max_workers: int = 4,
         show_progress: bool = True,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
     ) -> list[BatchResult]:
         """Synchronize multiple repositories in batch.
 
@@ -2185,6 +2341,7 @@ class GitRepositoryManager:
             repositories: List of repository configurations
             max_workers: Maximum number of concurrent workers
             show_progress: Whether to show progress indicators
+            on_result: Called with each repository's result as it completes
 
         Returns:
             List of batch results for each repository
@@ -2196,6 +2353,7 @@ class GitRepositoryManager:
             operation_func=self._sync_single_repository,
             operation_name="sync",
             show_progress=show_progress,
+            on_result=on_result,
         )
 
     def batch_fetch_repositories(
@@ -2203,6 +2361,7 @@ class GitRepositoryManager:
         repositories: list[dict[str, Any]],
         max_workers: int = 4,
         show_progress: bool = True,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
     ) -> list[BatchResult]:
         """Fetch updates for multiple repositories in batch.
 
@@ -2210,6 +2369,7 @@ class GitRepositoryManager:
             repositories: List of repository configurations
             max_workers: Maximum number of concurrent workers
             show_progress: Whether to show progress indicators
+            on_result: Called with each repository's result as it completes
 
         Returns:
             List of batch results for each repository
@@ -2221,6 +2381,7 @@ class GitRepositoryManager:
             operation_func=self._fetch_single_repository,
             operation_name="fetch",
             show_progress=show_progress,
+            on_result=on_result,
         )
 
     def batch_validate_repositories(
@@ -2228,6 +2389,7 @@ class GitRepositoryManager:
         repositories: list[dict[str, Any]],
         max_workers: int = 4,
         show_progress: bool = True,
+        on_result: Optional[Callable[[BatchResult], None]] = None,
     ) -> list[BatchResult]:
         """Validate multiple repositories in batch.
 
@@ -2235,6 +2397,7 @@ class GitRepositoryManager:
             repositories: List of repository configurations
             max_workers: Maximum number of concurrent workers
             show_progress: Whether to show progress indicators
+            on_result: Called with each repository's result as it completes
 
         Returns:
             List of batch results for each repository
@@ -2246,6 +2409,7 @@ class GitRepositoryManager:
             operation_func=self._validate_single_repository,
             operation_name="validate",
             show_progress=show_progress,
+            on_result=on_result,
         )
 
     def _sync_single_repository(
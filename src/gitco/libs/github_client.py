@@ -1,9 +1,17 @@
 """GitHub API client for GitCo."""
 
 import json
+import math
 import os
 import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import partial
 from typing import Any, Optional
 
 import requests
@@ -11,10 +19,14 @@ from github import Github
 
 from ..utils.common import (
     get_logger,
+    intern_strings,
     log_api_call,
     log_operation_failure,
     log_operation_start,
     log_operation_success,
+    parse_iso_timestamp,
+    slotted_dataclass,
+    utc_timestamp,
 )
 from ..utils.exception import (
     APIError,
@@ -24,20 +36,37 @@ from ..utils.exception import (
     ReadTimeoutError,
     RequestTimeoutError,
 )
+from ..utils.memo import RequestMemo, request_memoized
 from ..utils.rate_limiter import RateLimitedAPIClient, get_rate_limiter
 from ..utils.retry import TIMEOUT_AWARE_RETRY_CONFIG, create_retry_session, with_retry
 from .git_ops import detect_github_auth, test_github_auth
 
+# GitHub returns at most 100 items per page and 1000 results per search query
+GITHUB_PAGE_SIZE = 100
+SEARCH_RESULT_CAP = 1000
 
-@dataclass
+# Search result pages fetched concurrently; the rate limiter still applies
+DEFAULT_SEARCH_WORKERS = 4
+
+# Recently updated issues sampled for health and activity metrics; sharing
+# one limit lets a request scope serve every caller from a single listing
+RECENT_ISSUES_LIMIT = 50
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
 class GitHubIssue:
-    """GitHub issue data structure."""
+    """GitHub issue data structure.
+
+    Immutable and slotted, with interned label and login strings, since
+    discovery and contribution sync can hold tens of thousands of issues.
+    """
 
     number: int
     title: str
     state: str
-    labels: list[str]
-    assignees: list[str]
+    labels: tuple[str, ...]
+    assignees: tuple[str, ...]
     created_at: str
     updated_at: str
     html_url: str
@@ -46,6 +75,19 @@ class GitHubIssue:
     milestone: Optional[str] = None
     comments_count: int = 0
     reactions_count: int = 0
+    updated_timestamp: float = 0.0  # Epoch seconds of updated_at
+
+    def __post_init__(self) -> None:
+        """Intern repeated strings and parse ``updated_at`` once."""
+        object.__setattr__(self, "labels", intern_strings(self.labels))
+        object.__setattr__(self, "assignees", intern_strings(self.assignees))
+        if self.user is not None:
+            object.__setattr__(self, "user", sys.intern(self.user))
+        # Parsed once so scoring never has to
+        if not self.updated_timestamp:
+            object.__setattr__(
+                self, "updated_timestamp", parse_iso_timestamp(self.updated_at)
+            )
 
 
 @dataclass
@@ -483,6 +525,12 @@ class GitHubClient(RateLimitedAPIClient):
         self.repo_path = repo_path
         self.use_git_auth = use_git_auth
 
+        # Memo of repository and issue lookups while a request scope is open;
+        # the lock guards it and the count of open scopes across threads
+        self._request_memo: Optional[RequestMemo] = None
+        self._request_scopes = 0
+        self._request_scope_lock = threading.Lock()
+
         # Create session with retry capabilities
         self.session = create_retry_session(
             max_attempts=max_retries,
@@ -592,6 +640,9 @@ class GitHubClient(RateLimitedAPIClient):
                 self.github = Github(base_url=self.base_url)
                 self.auth_method = "anonymous"
 
+        # Full pages mean fewer requests for every paginated listing
+        self.github.per_page = GITHUB_PAGE_SIZE
+
     def _test_authentication(self) -> bool:
         """Test GitHub authentication.
 
@@ -731,6 +782,34 @@ class GitHubClient(RateLimitedAPIClient):
                 f"GitHub API error: {response.status_code} - {response.text}"
             )
 
+    @contextmanager
+    def request_scope(self) -> Iterator["GitHubClient"]:
+        """Fetch each repository and issue listing at most once in a scope.
+
+        Inside the scope, ``get_repository`` and ``get_issues`` results are
+        memoized by their arguments, and concurrent identical calls wait for
+        the first one instead of repeating it. Scopes that overlap, whether
+        nested or opened by other threads sharing this client, share one
+        memo; it is dropped when the last open scope ends, so long-lived
+        clients never serve stale data.
+
+        Yields:
+            This client
+        """
+        with self._request_scope_lock:
+            if self._request_scopes == 0:
+                self._request_memo = RequestMemo()
+            self._request_scopes += 1
+
+        try:
+            yield self
+        finally:
+            with self._request_scope_lock:
+                self._request_scopes -= 1
+                if self._request_scopes == 0:
+                    self._request_memo = None
+
+    @request_memoized
     def get_repository(self, repo_name: str) -> Optional[GitHubRepository]:
         """Get repository information.
 
@@ -797,6 +876,7 @@ class GitHubClient(RateLimitedAPIClient):
                 log_operation_failure("github repository fetch", e, repo_name=repo_name)
                 raise APIError(f"Failed to fetch repository {repo_name}: {e}") from e
 
+    @request_memoized
     def get_issues(
         self,
         repo_name: str,
@@ -849,14 +929,14 @@ class GitHubClient(RateLimitedAPIClient):
                         number=issue_data.get("number", 0),
                         title=issue_data.get("title", ""),
                         state=issue_data.get("state", "open"),
-                        labels=[
+                        labels=tuple(
                             label.get("name", "")
                             for label in issue_data.get("labels", [])
-                        ],
-                        assignees=[
+                        ),
+                        assignees=tuple(
                             assignee.get("login", "")
                             for assignee in issue_data.get("assignees", [])
-                        ],
+                        ),
                         created_at=issue_data.get("created_at", ""),
                         updated_at=issue_data.get("updated_at", ""),
                         html_url=issue_data.get("html_url", ""),
@@ -924,10 +1004,11 @@ class GitHubClient(RateLimitedAPIClient):
                         number=issue.number,
                         title=issue.title,
                         state=issue.state,
-                        labels=[label.name for label in issue.labels],
-                        assignees=[assignee.login for assignee in issue.assignees],
+                        labels=tuple(label.name for label in issue.labels),
+                        assignees=tuple(assignee.login for assignee in issue.assignees),
                         created_at=issue.created_at.isoformat(),
                         updated_at=issue.updated_at.isoformat(),
+                        updated_timestamp=utc_timestamp(issue.updated_at),
                         html_url=issue.html_url,
                         body=issue.body,
                         user=issue.user.login if issue.user else None,
@@ -1013,28 +1094,7 @@ class GitHubClient(RateLimitedAPIClient):
                 ]
 
             # Convert to our data structure
-            issues = []
-            for issue in search_results:
-                github_issue = GitHubIssue(
-                    number=issue.number,
-                    title=issue.title,
-                    state=issue.state,
-                    labels=[label.name for label in issue.labels],
-                    assignees=[assignee.login for assignee in issue.assignees],
-                    created_at=issue.created_at.isoformat(),
-                    updated_at=issue.updated_at.isoformat(),
-                    html_url=issue.html_url,
-                    body=issue.body,
-                    user=issue.user.login if issue.user else None,
-                    milestone=issue.milestone.title if issue.milestone else None,
-                    comments_count=issue.comments,
-                    reactions_count=(
-                        len(issue.get_reactions())
-                        if hasattr(issue, "get_reactions")
-                        else 0
-                    ),
-                )
-                issues.append(github_issue)
+            issues = [self._to_github_issue(issue) for issue in search_results]
 
             log_operation_success("github issues search", query=query)
             return issues
@@ -1043,6 +1103,132 @@ class GitHubClient(RateLimitedAPIClient):
             log_operation_failure("github issues search", e, query=query)
             raise APIError(f"Failed to search issues: {e}") from e
 
+    def search_all_issues(
+        self,
+        query: str,
+        state: str = "all",
+        updated_after: Optional[str] = None,
+        max_workers: int = DEFAULT_SEARCH_WORKERS,
+    ) -> list[GitHubIssue]:
+        """Fetch every issue matching a search, beyond the 1000-result cap.
+
+        Results are requested oldest update first. Within a query the first
+        page reveals the total count and the remaining pages are fetched
+        concurrently, each waiting on the shared GitHub rate limiter. When a
+        query hits the search API's 1000-result cap, the search continues
+        from the last update time seen, so histories of any size are
+        fetched completely.
+
+        Args:
+            query: Search query, e.g. ``author:octocat``
+            state: Issue state (open, closed, all)
+            updated_after: Only issues updated at or after this ISO time
+            max_workers: Maximum pages fetched at once
+
+        Returns:
+            Matching issues, ordered by update time
+        """
+        log_operation_start("github full issues search", query=query)
+
+        try:
+            issues: dict[str, GitHubIssue] = {}
+            watermark = updated_after
+
+            while True:
+                search_parts = [query, f"state:{state}"]
+                if watermark:
+                    search_parts.append(f"updated:>={watermark}")
+                results: Any = self.github.search_issues(
+                    " ".join(search_parts), sort="updated", order="asc"
+                )
+
+                window = self._fetch_search_page(results, 0)
+                total_count = results.totalCount
+                page_count = math.ceil(
+                    min(total_count, SEARCH_RESULT_CAP) / GITHUB_PAGE_SIZE
+                )
+
+                if page_count > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=max(1, min(max_workers, page_count - 1))
+                    ) as executor:
+                        for page in executor.map(
+                            partial(self._fetch_search_page, results),
+                            range(1, page_count),
+                        ):
+                            window.extend(page)
+
+                for issue in window:
+                    github_issue = self._to_github_issue(issue)
+                    issues[github_issue.html_url] = github_issue
+
+                if total_count <= SEARCH_RESULT_CAP or not window:
+                    break
+
+                # Resume from the newest update seen; the overlap is deduplicated
+                next_watermark = time.strftime(
+                    "%Y-%m-%dT%H:%M:%SZ",
+                    time.gmtime(utc_timestamp(window[-1].updated_at)),
+                )
+                if next_watermark == watermark:
+                    self.logger.warning(
+                        f"More than {SEARCH_RESULT_CAP} issues updated at "
+                        f"{watermark}; some could not be fetched"
+                    )
+                    break
+                watermark = next_watermark
+
+            ordered = sorted(issues.values(), key=lambda i: i.updated_timestamp)
+            log_operation_success(
+                "github full issues search", query=query, issues_count=len(ordered)
+            )
+            return ordered
+
+        except Exception as e:
+            log_operation_failure("github full issues search", e, query=query)
+            raise APIError(f"Failed to search issues: {e}") from e
+
+    def _fetch_search_page(self, results: Any, page: int) -> list[Any]:
+        """Fetch one page of search results once the rate limiter allows.
+
+        Args:
+            results: PyGithub paginated search results
+            page: Zero-based page number
+
+        Returns:
+            PyGithub issues on the page
+        """
+        self._rate_limit_request()
+        return list(results.get_page(page))
+
+    def _to_github_issue(self, issue: Any) -> GitHubIssue:
+        """Convert a PyGithub issue into a ``GitHubIssue``.
+
+        Args:
+            issue: PyGithub issue object
+
+        Returns:
+            GitHub issue data structure
+        """
+        # Search results carry a reaction summary, so no extra request is needed
+        reactions = getattr(issue, "raw_data", {}).get("reactions") or {}
+        return GitHubIssue(
+            number=issue.number,
+            title=issue.title,
+            state=issue.state,
+            labels=tuple(label.name for label in issue.labels),
+            assignees=tuple(assignee.login for assignee in issue.assignees),
+            created_at=issue.created_at.isoformat(),
+            updated_at=issue.updated_at.isoformat(),
+            updated_timestamp=utc_timestamp(issue.updated_at),
+            html_url=issue.html_url,
+            body=issue.body,
+            user=issue.user.login if issue.user else None,
+            milestone=issue.milestone.title if issue.milestone else None,
+            comments_count=issue.comments,
+            reactions_count=reactions.get("total_count", 0),
+        )
+
     def get_issues_for_repositories(
         self,
         repositories: list[str],
@@ -1,9 +1,11 @@
 """Repository health metrics calculation for GitCo."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from ..utils.common import (
     get_logger,
@@ -14,7 +16,20 @@ from ..utils.common import (
 from ..utils.exception import HealthMetricsError
 from .config import Config
 from .git_ops import GitRepository
-from .github_client import GitHubClient
+from .github_client import (
+    RECENT_ISSUES_LIMIT,
+    GitHubClient,
+    GitHubIssue,
+    GitHubRepository,
+)
+from .metric_snapshots import MetricSnapshot, MetricSnapshotStore
+
+# Local metrics run a dozen git subprocesses per repository, some of them over
+# the network, so many repositories are examined at once
+DEFAULT_HEALTH_WORKERS = 32
+
+# Upstreams fetched from GitHub at once; the client's rate limiting still applies
+DEFAULT_GITHUB_PREFETCH_WORKERS = 8
 
 
 @dataclass
@@ -101,18 +116,34 @@ class HealthSummary:
     total_open_issues: int = 0
 
 
+@dataclass
+class _GitHubData:
+    """GitHub data prefetched for one upstream repository."""
+
+    repository: GitHubRepository
+    recent_issues: list[GitHubIssue]
+
+
 class RepositoryHealthCalculator:
     """Calculates comprehensive health metrics for repositories."""
 
-    def __init__(self, config: Config, github_client: GitHubClient):
+    def __init__(
+        self,
+        config: Config,
+        github_client: GitHubClient,
+        snapshot_store: Optional[MetricSnapshotStore] = None,
+    ):
         """Initialize health calculator.
 
         Args:
             config: GitCo configuration
             github_client: GitHub API client
+            snapshot_store: Store to record metric snapshots in and compute
+                growth from; without one, growth is not tracked
         """
         self.config = config
         self.github_client = github_client
+        self.snapshot_store = snapshot_store
         self.logger = get_logger()
 
     def calculate_repository_health(
@@ -126,55 +157,25 @@ class RepositoryHealthCalculator:
         Returns:
             Repository health metrics
         """
-        repo_name = repository_config.get("name", "unknown")
-        repo_path = repository_config.get("local_path", "")
-
-        log_operation_start("calculating repository health", repository=repo_name)
-
-        try:
-            metrics = RepositoryHealthMetrics(
-                repository_name=repo_name,
-                repository_path=repo_path,
-                upstream_url=repository_config.get("upstream"),
-            )
-
-            # Get local repository information
-            if repo_path and Path(repo_path).exists():
-                git_repo = GitRepository(repo_path)
-                self._calculate_local_metrics(git_repo, metrics)
-
-            # Get GitHub repository information
-            if repository_config.get("upstream"):
-                self._calculate_github_metrics(repository_config, metrics)
-
-            # Calculate derived metrics
-            self._calculate_derived_metrics(metrics)
-
-            log_operation_success(
-                "calculating repository health",
-                repository=repo_name,
-                health_score=metrics.overall_health_score,
-            )
-
-            return metrics
-
-        except Exception as e:
-            log_operation_failure(
-                "calculating repository health",
-                repository=repo_name,
-                error=e,
-            )
-            raise HealthMetricsError(
-                f"Failed to calculate health for {repo_name}: {e}"
-            ) from e
+        return self._calculate_repositories_health([repository_config])[0]
 
     def calculate_health_summary(
-        self, repositories: list[dict[str, Any]]
+        self,
+        repositories: list[dict[str, Any]],
+        max_workers: Optional[int] = None,
+        on_metrics: Optional[Callable[[RepositoryHealthMetrics], None]] = None,
     ) -> HealthSummary:
         """Calculate health summary across all repositories.
 
+        Repositories are examined concurrently, so the time taken is bounded
+        by the slowest repository rather than the sum over all of them.
+
         Args:
             repositories: List of repository configurations
+            max_workers: Maximum repositories examined at once (defaults to
+                DEFAULT_HEALTH_WORKERS)
+            on_metrics: Called with each repository's metrics as soon as
+                they are complete, e.g. to stream them to a consumer
 
         Returns:
             Health summary
@@ -185,14 +186,12 @@ class RepositoryHealthCalculator:
 
         try:
             summary = HealthSummary(total_repositories=len(repositories))
-            repository_metrics = []
-
-            # Calculate metrics for each repository
-            for repo_config in repositories:
-                metrics = self.calculate_repository_health(repo_config)
-                repository_metrics.append(metrics)
+            repository_metrics = self._calculate_repositories_health(
+                repositories, max_workers, on_metrics
+            )
 
-                # Update summary counters
+            # Update summary counters
+            for metrics in repository_metrics:
                 self._update_summary_counters(summary, metrics)
 
             # Calculate trending repositories
@@ -221,6 +220,212 @@ class RepositoryHealthCalculator:
             log_operation_failure("calculating health summary", error=e)
             raise HealthMetricsError(f"Failed to calculate health summary: {e}") from e
 
+    def _calculate_repositories_health(
+        self,
+        repositories: list[dict[str, Any]],
+        max_workers: Optional[int] = None,
+        on_metrics: Optional[Callable[[RepositoryHealthMetrics], None]] = None,
+    ) -> list[RepositoryHealthMetrics]:
+        """Calculate health metrics for several repositories.
+
+        GitHub data for each distinct upstream is prefetched in one batch
+        while local git metrics are collected in a worker pool. A repository
+        is finished as soon as its local metrics and its upstream's GitHub
+        data have both arrived, without waiting for the other repositories.
+
+        Args:
+            repositories: List of repository configurations
+            max_workers: Maximum repositories examined at once
+            on_metrics: Called with each repository's metrics as soon as
+                they are complete
+
+        Returns:
+            Repository health metrics, in the order of ``repositories``
+        """
+        if not repositories:
+            return []
+
+        upstream_names = [
+            (
+                self._extract_repo_name_from_url(repo_config["upstream"])
+                if repo_config.get("upstream")
+                else None
+            )
+            for repo_config in repositories
+        ]
+        distinct_upstreams = list(dict.fromkeys(filter(None, upstream_names)))
+
+        workers = max(1, min(max_workers or DEFAULT_HEALTH_WORKERS, len(repositories)))
+        github_workers = max(
+            1, min(DEFAULT_GITHUB_PREFETCH_WORKERS, len(distinct_upstreams))
+        )
+
+        # All snapshots of one run share a time
+        now = time.time()
+        repository_metrics: dict[int, RepositoryHealthMetrics] = {}
+        # Repositories with local metrics whose upstream is still being fetched
+        waiting: dict[str, list[int]] = {}
+
+        # Repositories sharing an upstream, or looked up again later in the
+        # same command, reuse the client's memoized responses
+        with self.github_client.request_scope():
+            with ThreadPoolExecutor(
+                max_workers=github_workers, thread_name_prefix="gitco-health-github"
+            ) as github_pool:
+                with ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="gitco-health"
+                ) as local_pool:
+                    # GitHub requests run while local metrics are collected
+                    github_futures = {
+                        repo_name: github_pool.submit(
+                            self._fetch_github_data, repo_name
+                        )
+                        for repo_name in distinct_upstreams
+                    }
+                    upstream_futures = {
+                        future: repo_name
+                        for repo_name, future in github_futures.items()
+                    }
+                    local_futures = {
+                        local_pool.submit(
+                            self._collect_local_metrics, repo_config
+                        ): index
+                        for index, repo_config in enumerate(repositories)
+                    }
+
+                    for future in as_completed([*local_futures, *upstream_futures]):
+                        if future in local_futures:
+                            index = local_futures[future]
+                            repository_metrics[index] = future.result()
+                            repo_name = upstream_names[index]
+                            if repo_name and not github_futures[repo_name].done():
+                                waiting.setdefault(repo_name, []).append(index)
+                                continue
+                            ready = [index]
+                        else:
+                            ready = waiting.pop(upstream_futures[future], [])
+
+                        for index in ready:
+                            repo_name = upstream_names[index]
+                            self._finish_repository_health(
+                                repository_metrics[index],
+                                (
+                                    github_futures[repo_name].result()
+                                    if repo_name
+                                    else None
+                                ),
+                                now,
+                                on_metrics,
+                            )
+
+        return [repository_metrics[index] for index in range(len(repositories))]
+
+    def _finish_repository_health(
+        self,
+        metrics: RepositoryHealthMetrics,
+        github_data: Optional[_GitHubData],
+        now: float,
+        on_metrics: Optional[Callable[[RepositoryHealthMetrics], None]] = None,
+    ) -> None:
+        """Add GitHub, trending and derived metrics to a repository's metrics.
+
+        Args:
+            metrics: Metrics object with local metrics to update
+            github_data: GitHub data of the upstream, if it was fetched
+            now: Time of this run's metric snapshots
+            on_metrics: Called with the metrics once they are complete
+        """
+        self._calculate_github_metrics(github_data, metrics)
+        self._calculate_trending_metrics(metrics, github_data, now)
+
+        if github_data:
+            self._calculate_engagement_metrics(github_data.recent_issues, metrics)
+
+        # Calculate derived metrics
+        self._calculate_derived_metrics(metrics)
+
+        log_operation_success(
+            "calculating repository health",
+            repository=metrics.repository_name,
+            health_score=metrics.overall_health_score,
+        )
+
+        if on_metrics:
+            on_metrics(metrics)
+
+    def _collect_local_metrics(
+        self, repository_config: dict[str, Any]
+    ) -> RepositoryHealthMetrics:
+        """Create a repository's metrics and fill in its local git metrics.
+
+        Args:
+            repository_config: Repository configuration
+
+        Returns:
+            Repository health metrics without GitHub or derived metrics
+
+        Raises:
+            HealthMetricsError: If the metrics could not be created.
+        """
+        repo_name = repository_config.get("name", "unknown")
+        repo_path = repository_config.get("local_path", "")
+
+        log_operation_start("calculating repository health", repository=repo_name)
+
+        try:
+            metrics = RepositoryHealthMetrics(
+                repository_name=repo_name,
+                repository_path=repo_path,
+                upstream_url=repository_config.get("upstream"),
+            )
+
+            # Get local repository information
+            if repo_path and Path(repo_path).exists():
+                git_repo = GitRepository(repo_path)
+                self._calculate_local_metrics(git_repo, metrics)
+
+            return metrics
+
+        except Exception as e:
+            log_operation_failure(
+                "calculating repository health",
+                repository=repo_name,
+                error=e,
+            )
+            raise HealthMetricsError(
+                f"Failed to calculate health for {repo_name}: {e}"
+            ) from e
+
+    def _fetch_github_data(self, repo_name: str) -> Optional[_GitHubData]:
+        """Fetch the GitHub data health metrics need for an upstream.
+
+        Args:
+            repo_name: Repository name in format "owner/repo"
+
+        Returns:
+            Repository information and recent issues, or None if the
+            repository could not be fetched
+        """
+        try:
+            github_repo = self.github_client.get_repository(repo_name)
+        except Exception as e:
+            self.logger.warning(f"Failed to calculate GitHub metrics: {e}")
+            return None
+
+        if not github_repo:
+            return None
+
+        try:
+            # Recent issues for response time calculation
+            recent_issues = self.github_client.get_issues(
+                repo_name, state="all", limit=RECENT_ISSUES_LIMIT
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to calculate engagement metrics: {e}")
+            recent_issues = []
+
+        return _GitHubData(repository=github_repo, recent_issues=recent_issues)
+
     def _calculate_local_metrics(
         self, git_repo: GitRepository, metrics: RepositoryHealthMetrics
     ) -> None:
@@ -235,7 +440,7 @@ class RepositoryHealthCalculator:
             status = git_repo.get_repository_status()
 
             # Calculate sync status
-            if "last_sync" in status:
+            if status.get("last_sync"):
                 last_sync = datetime.fromisoformat(status["last_sync"])
                 metrics.days_since_last_sync = (datetime.now() - last_sync).days
 
@@ -274,30 +479,20 @@ class RepositoryHealthCalculator:
             self.logger.warning(f"Failed to calculate local metrics: {e}")
 
     def _calculate_github_metrics(
-        self, repository_config: dict[str, Any], metrics: RepositoryHealthMetrics
+        self, github_data: Optional[_GitHubData], metrics: RepositoryHealthMetrics
     ) -> None:
-        """Calculate metrics from GitHub API.
+        """Calculate metrics from prefetched GitHub data.
 
         Args:
-            repository_config: Repository configuration
+            github_data: GitHub data for the upstream, if it could be fetched
             metrics: Metrics object to update
         """
         try:
-            upstream_url = repository_config.get("upstream")
-            if not upstream_url:
-                return
-
-            # Extract repository name from upstream URL
-            repo_name = self._extract_repo_name_from_url(upstream_url)
-            if not repo_name:
-                return
-
-            # Get repository information from GitHub
-            github_repo = self.github_client.get_repository(repo_name)
-            if not github_repo:
+            if not github_data:
                 return
 
             # Update metrics with GitHub data
+            github_repo = github_data.repository
             metrics.stars_count = github_repo.stargazers_count
             metrics.forks_count = github_repo.forks_count
             metrics.open_issues_count = github_repo.open_issues_count
@@ -306,30 +501,19 @@ class RepositoryHealthCalculator:
             metrics.archived = github_repo.archived
             metrics.disabled = github_repo.disabled
 
-            # Calculate engagement metrics
-            self._calculate_engagement_metrics(repo_name, metrics)
-
-            # Calculate trending metrics
-            self._calculate_trending_metrics(repo_name, metrics)
-
         except Exception as e:
             self.logger.warning(f"Failed to calculate GitHub metrics: {e}")
 
     def _calculate_engagement_metrics(
-        self, repo_name: str, metrics: RepositoryHealthMetrics
+        self, recent_issues: list[GitHubIssue], metrics: RepositoryHealthMetrics
     ) -> None:
         """Calculate engagement metrics for a repository.
 
         Args:
-            repo_name: Repository name
+            recent_issues: Recent issues of the repository
             metrics: Metrics object to update
         """
         try:
-            # Get recent issues for response time calculation
-            recent_issues = self.github_client.get_issues(
-                repo_name, state="all", limit=50
-            )
-
             if recent_issues:
                 response_times = []
                 for issue in recent_issues:
@@ -374,27 +558,44 @@ class RepositoryHealthCalculator:
             self.logger.warning(f"Failed to calculate engagement metrics: {e}")
 
     def _calculate_trending_metrics(
-        self, repo_name: str, metrics: RepositoryHealthMetrics
+        self,
+        metrics: RepositoryHealthMetrics,
+        github_data: Optional[_GitHubData],
+        now: float,
     ) -> None:
-        """Calculate trending metrics for a repository.
+        """Record a metric snapshot and calculate growth from the history.
+
+        Growth over the last 30 days comes from the snapshots earlier runs
+        recorded, so it needs no extra GitHub requests.
 
         Args:
-            repo_name: Repository name
             metrics: Metrics object to update
+            github_data: GitHub data of the upstream, if it was fetched
+            now: Time of the snapshot
         """
-        try:
-            # This is a simplified calculation
-            # In a real implementation, you would fetch historical data
-            # For now, we'll use current metrics as trending indicators
+        if self.snapshot_store is None:
+            return
 
-            # Stars growth (simplified)
-            metrics.stars_growth_30d = max(0, metrics.stars_count // 100)
-
-            # Forks growth (simplified)
-            metrics.forks_growth_30d = max(0, metrics.forks_count // 50)
-
-            # Issues growth (simplified)
-            metrics.issues_growth_30d = max(0, metrics.open_issues_count // 10)
+        try:
+            snapshot = MetricSnapshot(
+                repository=metrics.repository_name,
+                taken_ts=now,
+                # A repository without commits has no local clone
+                total_commits=metrics.total_commits or None,
+            )
+            if github_data:
+                snapshot.stars = metrics.stars_count
+                snapshot.forks = metrics.forks_count
+                snapshot.open_issues = metrics.open_issues_count
+            self.snapshot_store.record([snapshot])
+
+            change = self.snapshot_store.growth(
+                [metrics.repository_name], days=30, now=now
+            ).get(metrics.repository_name)
+            if change:
+                metrics.stars_growth_30d = change.stars
+                metrics.forks_growth_30d = change.forks
+                metrics.issues_growth_30d = change.open_issues
 
         except Exception as e:
             self.logger.warning(f"Failed to calculate trending metrics: {e}")
@@ -612,15 +813,18 @@ class RepositoryHealthCalculator:
 
 
 def create_health_calculator(
-    config: Config, github_client: GitHubClient
+    config: Config,
+    github_client: GitHubClient,
+    snapshot_store: Optional[MetricSnapshotStore] = None,
 ) -> RepositoryHealthCalculator:
     """Create a repository health calculator.
 
     Args:
         config: GitCo configuration
         github_client: GitHub API client
+        snapshot_store: Store to record metric snapshots in, if any
 
     Returns:
         Repository health calculator
     """
-    return RepositoryHealthCalculator(config, github_client)
+    return RepositoryHealthCalculator(config, github_client, snapshot_store)
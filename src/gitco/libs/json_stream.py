@@ -0,0 +1,135 @@
+"""Incremental parsing of JSON objects from streamed text."""
+
+import json
+import re
+from typing import Any
+
+# Characters that can change the parser state outside and inside strings
+_STRUCTURAL_CHARS = re.compile(r'[{}\[\]",]')
+_STRING_CHARS = re.compile(r'["\\]')
+
+
+class IncrementalJSONObjectParser:
+    """Parses the top-level members of a JSON object as text arrives.
+
+    Text is fed in arbitrary chunks, such as the deltas of a streamed LLM
+    completion. Each top-level member is decoded as soon as the comma or
+    closing brace after it arrives, so callers can act on early fields long
+    before the object is complete. Any text before the first ``{`` (e.g. a
+    Markdown code fence) is ignored, and only the member being read is kept
+    in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self.fields: dict[str, Any] = {}
+        self.complete = False
+        self._text = ""
+        self._pos = 0
+        self._member_start = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Consume a chunk of text.
+
+        Args:
+            chunk: Next piece of the streamed text.
+
+        Returns:
+            (key, value) pairs of the members completed by this chunk.
+        """
+        if self.complete or not chunk:
+            return []
+
+        completed: list[tuple[str, Any]] = []
+        text = self._text + chunk
+        pos = self._pos
+
+        while pos < len(text) and not self.complete:
+            if self._in_string:
+                match = _STRING_CHARS.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                if match.group() == "\\":
+                    # Skip the escaped character; wait for it if not yet here
+                    if match.end() >= len(text):
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            match = _STRUCTURAL_CHARS.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            char = match.group()
+            pos = match.end()
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                    self._member_start = pos
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(text[self._member_start : pos - 1], completed)
+                    self.complete = True
+            elif self._depth == 1:
+                # Top-level comma ends the current member
+                self._emit(text[self._member_start : pos - 1], completed)
+                self._member_start = pos
+
+        # Keep only the unfinished member
+        if self._started and not self.complete:
+            self._text = text[self._member_start :]
+            self._pos = pos - self._member_start
+            self._member_start = 0
+        else:
+            self._text = ""
+            self._pos = 0
+        return completed
+
+    def _emit(self, member_text: str, completed: list[tuple[str, Any]]) -> None:
+        """Decode one ``"key": value`` member and record it."""
+        if not member_text.strip():
+            return
+        try:
+            member = json.loads("{" + member_text + "}")
+        except ValueError:
+            # Malformed members are skipped; the rest may still be usable
+            return
+        for key, value in member.items():
+            self.fields[key] = value
+            completed.append((key, value))
+
+
+def parse_json_object(text: str) -> dict[str, Any]:
+    """Parse the first JSON object in a text in one linear pass.
+
+    Args:
+        text: Text containing a JSON object, possibly with surrounding prose.
+
+    Returns:
+        Top-level members of the object.
+
+    Raises:
+        ValueError: If the text does not contain a complete JSON object.
+    """
+    parser = IncrementalJSONObjectParser()
+    parser.feed(text)
+    if not parser.complete:
+        raise ValueError("No complete JSON object found")
+    return parser.fields
@@ -0,0 +1,326 @@
+"""Time series of repository metric snapshots for GitCo."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from ..utils.common import get_logger
+from .contribution_stats import DAY_SECONDS
+
+DEFAULT_DATABASE_PATH = "~/.gitco/metrics.db"
+
+SCHEMA_VERSION = 1
+
+WEEK_SECONDS = 7 * DAY_SECONDS
+
+# Every snapshot is kept for RAW_RETENTION_DAYS, then the last snapshot of
+# each day until DAILY_RETENTION_DAYS, then the last snapshot of each week,
+# so years of daily status runs cost about 52 rows per repository per year
+RAW_RETENTION_DAYS = 2
+DAILY_RETENTION_DAYS = 90
+
+# Compaction runs as part of a write at most this often
+COMPACTION_INTERVAL = DAY_SECONDS
+
+_METRICS = ("stars", "forks", "open_issues", "total_commits")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metric_snapshots (
+    repository TEXT NOT NULL,
+    taken_ts REAL NOT NULL,
+    stars INTEGER,
+    forks INTEGER,
+    open_issues INTEGER,
+    total_commits INTEGER,
+    PRIMARY KEY (repository, taken_ts)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_INSERT_SQL = (
+    "INSERT OR IGNORE INTO metric_snapshots "
+    f"(repository, taken_ts, {', '.join(_METRICS)}) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# Metrics are gauges, so a bucket is downsampled to its last snapshot: a
+# snapshot older than the cutoff is dropped when a later one in the same
+# bucket exists. The range bounds let the primary key answer the subquery.
+_DOWNSAMPLE_SQL = """
+DELETE FROM metric_snapshots
+WHERE taken_ts < :cutoff
+  AND EXISTS (
+      SELECT 1 FROM metric_snapshots later
+      WHERE later.repository = metric_snapshots.repository
+        AND later.taken_ts > metric_snapshots.taken_ts
+        AND later.taken_ts < :cutoff
+        AND later.taken_ts <
+            (CAST(metric_snapshots.taken_ts / :bucket AS INTEGER) + 1) * :bucket
+  )
+"""
+
+_SNAPSHOT_COLUMNS = f"repository, taken_ts, {', '.join(_METRICS)}"
+
+
+@dataclass
+class MetricSnapshot:
+    """Metrics of one repository at one point in time.
+
+    A metric is None when it could not be measured, e.g. GitHub metrics for
+    a repository without a reachable upstream.
+    """
+
+    repository: str
+    taken_ts: float  # Epoch seconds
+    stars: Optional[int] = None
+    forks: Optional[int] = None
+    open_issues: Optional[int] = None
+    total_commits: Optional[int] = None
+
+
+@dataclass
+class MetricGrowth:
+    """Change of a repository's metrics over a time window."""
+
+    stars: int = 0
+    forks: int = 0
+    open_issues: int = 0
+    total_commits: int = 0
+    # Time of the snapshot growth is measured from, None without history
+    since_ts: Optional[float] = None
+
+
+def _snapshot_from_row(row: sqlite3.Row) -> MetricSnapshot:
+    """Convert a database row into a ``MetricSnapshot``."""
+    return MetricSnapshot(**{key: row[key] for key in row.keys()})
+
+
+class MetricSnapshotStore:
+    """Append-only store of repository metric snapshots in SQLite.
+
+    Each status run appends one snapshot per repository, and growth over a
+    window is the difference between the newest snapshot and the newest one
+    taken before the window started, so trends need no extra API calls.
+    Older snapshots are downsampled to one per day and then one per week.
+    """
+
+    def __init__(self, database_path: Optional[str] = None):
+        """Initialize the snapshot store.
+
+        Args:
+            database_path: SQLite database file (defaults to ~/.gitco/metrics.db).
+        """
+        self.database_path = Path(database_path or DEFAULT_DATABASE_PATH).expanduser()
+        self.logger = get_logger()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error."""
+        self._ensure_initialized()
+        connection = self._open()
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a configured connection to the database."""
+        connection = sqlite3.connect(self.database_path, timeout=30.0)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _ensure_initialized(self) -> None:
+        """Create the schema once."""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            self.database_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = self._open()
+            try:
+                connection.execute("PRAGMA journal_mode = WAL")
+                with connection:
+                    connection.executescript(_SCHEMA)
+                    self._set_metadata(
+                        connection, "schema_version", str(SCHEMA_VERSION)
+                    )
+            finally:
+                connection.close()
+            self._initialized = True
+
+    def _get_metadata(self, connection: sqlite3.Connection, key: str) -> Optional[str]:
+        """Read a metadata value inside an open transaction."""
+        row = connection.execute(
+            "SELECT value FROM metadata WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else str(row[0])
+
+    def _set_metadata(
+        self, connection: sqlite3.Connection, key: str, value: str
+    ) -> None:
+        """Write a metadata value inside an open transaction."""
+        connection.execute(
+            "INSERT INTO metadata (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def record(self, snapshots: Iterable[MetricSnapshot]) -> int:
+        """Append snapshots in one transaction, compacting when it is due.
+
+        A snapshot for a repository and time that is already stored is
+        ignored, so snapshots are never rewritten.
+
+        Args:
+            snapshots: Snapshots to append.
+
+        Returns:
+            Number of snapshots stored.
+        """
+        rows = [
+            (
+                snapshot.repository,
+                snapshot.taken_ts,
+                snapshot.stars,
+                snapshot.forks,
+                snapshot.open_issues,
+                snapshot.total_commits,
+            )
+            for snapshot in snapshots
+        ]
+        with self._connect() as connection:
+            before = connection.total_changes
+            connection.executemany(_INSERT_SQL, rows)
+            written = connection.total_changes - before
+
+            now = time.time()
+            last_compacted = float(
+                self._get_metadata(connection, "last_compacted") or 0.0
+            )
+            if now - last_compacted >= COMPACTION_INTERVAL:
+                self._compact(connection, now)
+            return written
+
+    def compact(self, now: Optional[float] = None) -> int:
+        """Downsample old snapshots to one per day and then one per week.
+
+        Args:
+            now: Current epoch seconds (defaults to the current time).
+
+        Returns:
+            Number of snapshots removed.
+        """
+        with self._connect() as connection:
+            return self._compact(connection, time.time() if now is None else now)
+
+    def _compact(self, connection: sqlite3.Connection, now: float) -> int:
+        """Downsample old snapshots inside an open transaction.
+
+        Args:
+            connection: Connection inside an open transaction.
+            now: Current epoch seconds.
+
+        Returns:
+            Number of snapshots removed.
+        """
+        before = connection.total_changes
+        for cutoff_days, bucket in (
+            (RAW_RETENTION_DAYS, DAY_SECONDS),
+            (DAILY_RETENTION_DAYS, WEEK_SECONDS),
+        ):
+            connection.execute(
+                _DOWNSAMPLE_SQL,
+                {"cutoff": now - cutoff_days * DAY_SECONDS, "bucket": bucket},
+            )
+        removed = connection.total_changes - before
+        self._set_metadata(connection, "last_compacted", str(now))
+        if removed:
+            self.logger.debug(f"Compacted {removed} metric snapshots")
+        return removed
+
+    def history(
+        self, repository: str, since_ts: Optional[float] = None
+    ) -> list[MetricSnapshot]:
+        """Read a repository's snapshots, oldest first.
+
+        Args:
+            repository: Repository name.
+            since_ts: Only snapshots taken at or after this epoch time.
+
+        Returns:
+            Stored snapshots.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                f"SELECT {_SNAPSHOT_COLUMNS} FROM metric_snapshots "
+                "WHERE repository = ? AND taken_ts >= ? ORDER BY taken_ts",
+                (repository, since_ts if since_ts is not None else float("-inf")),
+            ).fetchall()
+        return [_snapshot_from_row(row) for row in rows]
+
+    def growth(
+        self, repositories: Iterable[str], days: int, now: Optional[float] = None
+    ) -> dict[str, MetricGrowth]:
+        """Compute how repositories' metrics changed over a window.
+
+        Growth is measured from the newest snapshot taken at or before the
+        start of the window, or from the oldest snapshot when the history is
+        shorter than the window. A metric missing from either snapshot has
+        no growth.
+
+        Args:
+            repositories: Repository names.
+            days: Window length in days.
+            now: End of the window in epoch seconds (defaults to now).
+
+        Returns:
+            Growth per repository; repositories without snapshots are omitted.
+        """
+        now = time.time() if now is None else now
+        window_start = now - days * DAY_SECONDS
+        select = (
+            f"SELECT {_SNAPSHOT_COLUMNS} FROM metric_snapshots WHERE repository = ?"
+        )
+
+        growth = {}
+        with self._connect() as connection:
+            for repository in dict.fromkeys(repositories):
+                latest = connection.execute(
+                    f"{select} AND taken_ts <= ? ORDER BY taken_ts DESC LIMIT 1",
+                    (repository, now),
+                ).fetchone()
+                if latest is None:
+                    continue
+                baseline = (
+                    connection.execute(
+                        f"{select} AND taken_ts <= ? ORDER BY taken_ts DESC LIMIT 1",
+                        (repository, window_start),
+                    ).fetchone()
+                    or connection.execute(
+                        f"{select} ORDER BY taken_ts LIMIT 1", (repository,)
+                    ).fetchone()
+                )
+
+                change = MetricGrowth(since_ts=baseline["taken_ts"])
+                for metric in _METRICS:
+                    if latest[metric] is not None and baseline[metric] is not None:
+                        setattr(change, metric, latest[metric] - baseline[metric])
+                growth[repository] = change
+        return growth
+
+    def count(self) -> int:
+        """Count the stored snapshots."""
+        with self._connect() as connection:
+            row = connection.execute("SELECT COUNT(*) FROM metric_snapshots").fetchone()
+            return int(row[0])
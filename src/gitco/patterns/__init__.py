@@ -1,5 +1,20 @@
 """Regex patterns for GitCo detection."""
 
+from .compiled import (
+    BREAKING_CHANGE_REGEX,
+    BREAKING_CHANGE_TYPE_REGEXES,
+    CVE_REGEX,
+    DEPRECATION_REGEX,
+    HIGH_DEPRECATION_REGEX,
+    HIGH_SECURITY_REGEX,
+    HIGH_SEVERITY_REGEX,
+    MEDIUM_DEPRECATION_REGEX,
+    MEDIUM_SECURITY_REGEX,
+    MEDIUM_SEVERITY_REGEX,
+    SECURITY_REGEX,
+    compile_any_pattern,
+    compile_grouped_patterns,
+)
 from .constants import (
     BREAKING_CHANGE_PATTERNS,
     CRITICAL_SECURITY_PATTERNS,
@@ -24,4 +39,17 @@ __all__ = [
     "MEDIUM_SECURITY_PATTERNS",
     "HIGH_DEPRECATION_PATTERNS",
     "MEDIUM_DEPRECATION_PATTERNS",
+    "SECURITY_REGEX",
+    "DEPRECATION_REGEX",
+    "BREAKING_CHANGE_REGEX",
+    "BREAKING_CHANGE_TYPE_REGEXES",
+    "HIGH_SEVERITY_REGEX",
+    "MEDIUM_SEVERITY_REGEX",
+    "HIGH_SECURITY_REGEX",
+    "MEDIUM_SECURITY_REGEX",
+    "HIGH_DEPRECATION_REGEX",
+    "MEDIUM_DEPRECATION_REGEX",
+    "CVE_REGEX",
+    "compile_grouped_patterns",
+    "compile_any_pattern",
 ]
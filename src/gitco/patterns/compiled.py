@@ -0,0 +1,97 @@
+"""Precompiled regex engines for GitCo detection.
+
+The pattern lists in ``constants`` are compiled once at import into a single
+alternation per category, so detectors scan each text once per category
+instead of once per pattern. Patterns are lowercased and compiled without
+``re.IGNORECASE``, which is several times faster; match them against
+lowercased text.
+"""
+
+import re
+
+from .constants import (
+    BREAKING_CHANGE_PATTERNS,
+    CRITICAL_SECURITY_PATTERNS,
+    DEPRECATION_PATTERNS,
+    HIGH_DEPRECATION_PATTERNS,
+    HIGH_SECURITY_PATTERNS,
+    HIGH_SEVERITY_PATTERNS,
+    MEDIUM_DEPRECATION_PATTERNS,
+    MEDIUM_SECURITY_PATTERNS,
+    MEDIUM_SEVERITY_PATTERNS,
+    SECURITY_PATTERNS,
+)
+
+# Matches nothing; used for empty pattern sets
+_NEVER_MATCH = r"(?!)"
+
+# Escape sequences are kept as-is so that e.g. ``\D`` does not become ``\d``
+_LITERAL_CASE = re.compile(r"\\.|[A-Z]+")
+
+
+def _lower_pattern(pattern: str) -> str:
+    """Lowercase the literal characters of a regex pattern."""
+    return _LITERAL_CASE.sub(
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+        pattern,
+    )
+
+
+def compile_grouped_patterns(patterns: dict[str, list[str]]) -> re.Pattern[str]:
+    """Compile typed patterns into one alternation for lowercased text.
+
+    Each pattern type becomes a named group, so a single ``finditer`` pass
+    reports the type of every match through ``match.lastgroup``.
+
+    Args:
+        patterns: Dictionary of pattern types to regex patterns.
+
+    Returns:
+        Compiled regex with one named group per pattern type.
+    """
+    alternatives = [
+        f"(?P<{pattern_type}>"
+        f"{'|'.join(f'(?:{_lower_pattern(p)})' for p in pattern_list)})"
+        for pattern_type, pattern_list in patterns.items()
+        if pattern_list
+    ]
+    return re.compile("|".join(alternatives) or _NEVER_MATCH)
+
+
+def compile_any_pattern(patterns: list[str]) -> re.Pattern[str]:
+    """Compile patterns into one alternation for lowercased text.
+
+    Args:
+        patterns: Regex patterns, any of which may match.
+
+    Returns:
+        Compiled regex matching wherever any of the patterns matches.
+    """
+    return re.compile(
+        "|".join(f"(?:{_lower_pattern(p)})" for p in patterns) or _NEVER_MATCH
+    )
+
+
+# Detection categories
+SECURITY_REGEX = compile_grouped_patterns(SECURITY_PATTERNS)
+DEPRECATION_REGEX = compile_grouped_patterns(DEPRECATION_PATTERNS)
+BREAKING_CHANGE_REGEX = compile_grouped_patterns(BREAKING_CHANGE_PATTERNS)
+
+# Single breaking change types, for per-file checks
+BREAKING_CHANGE_TYPE_REGEXES: dict[str, re.Pattern[str]] = {
+    change_type: compile_grouped_patterns({change_type: pattern_list})
+    for change_type, pattern_list in BREAKING_CHANGE_PATTERNS.items()
+}
+
+# Severity levels
+HIGH_SEVERITY_REGEX = compile_any_pattern(HIGH_SEVERITY_PATTERNS)
+MEDIUM_SEVERITY_REGEX = compile_any_pattern(MEDIUM_SEVERITY_PATTERNS)
+HIGH_SECURITY_REGEX = compile_any_pattern(
+    CRITICAL_SECURITY_PATTERNS + HIGH_SECURITY_PATTERNS
+)
+MEDIUM_SECURITY_REGEX = compile_any_pattern(MEDIUM_SECURITY_PATTERNS)
+HIGH_DEPRECATION_REGEX = compile_any_pattern(HIGH_DEPRECATION_PATTERNS)
+MEDIUM_DEPRECATION_REGEX = compile_any_pattern(MEDIUM_DEPRECATION_PATTERNS)
+
+# Explicit CVE references
+CVE_REGEX = re.compile(r"CVE-\d{4}-\d+", re.IGNORECASE)
@@ -4,7 +4,7 @@ from typing import Optional
 
 from jinja2 import Template
 
-from gitco.detector import BreakingChange, Deprecation, SecurityUpdate
+from ..libs.detector import BreakingChange, Deprecation, SecurityUpdate
 
 
 class PromptManager:
@@ -1,13 +1,17 @@
 """Utility functions for GitCo."""
 
+import calendar
+import functools
 import logging
 import logging.handlers
 import os
 import sys
-from datetime import datetime
-from typing import Any, Optional
+from collections.abc import Iterable
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import Any, Optional, TypeVar
 
-from rich import box
+from rich import box, get_console
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import (
@@ -58,6 +62,18 @@ def set_quiet_mode(enabled: bool) -> None:
     _quiet_mode = enabled
 
 
+def redirect_output_to_stderr() -> None:
+    """Send console and log output to standard error.
+
+    Used when standard output carries only machine-readable records.
+    """
+    for output_console in (console, get_console()):
+        output_console.file = sys.stderr
+    for handler in get_logger().handlers:
+        if isinstance(handler, logging.StreamHandler) and handler.stream is sys.stdout:
+            handler.setStream(sys.stderr)
+
+
 def is_quiet_mode() -> bool:
     """Check if quiet mode is enabled.
 
@@ -494,6 +510,159 @@ def ensure_directory_exists(dir_path: str) -> None:
         )
 
 
+def parse_iso_timestamp(value: Optional[str]) -> float:
+    """Parse an ISO 8601 timestamp into seconds since the epoch.
+
+    GitHub's ``YYYY-MM-DDTHH:MM:SSZ`` form is parsed by slicing, which is much
+    cheaper than ``datetime.fromisoformat``. Other forms fall back to it, with
+    naive timestamps interpreted as UTC like ``utc_timestamp`` does: GitHub
+    times from PyGithub 1.x are naive UTC, e.g. ``issue.updated_at.isoformat()``.
+
+    Args:
+        value: Timestamp string
+
+    Returns:
+        Epoch seconds, or 0.0 if the value is empty or cannot be parsed
+    """
+    if not value:
+        return 0.0
+
+    if len(value) == 20 and value[10] == "T" and value[19] == "Z":
+        try:
+            return float(
+                calendar.timegm(
+                    (
+                        int(value[0:4]),
+                        int(value[5:7]),
+                        int(value[8:10]),
+                        int(value[11:13]),
+                        int(value[14:16]),
+                        int(value[17:19]),
+                    )
+                )
+            )
+        except ValueError:
+            return 0.0
+
+    try:
+        return utc_timestamp(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return 0.0
+
+
+def utc_timestamp(value: datetime) -> float:
+    """Convert a datetime into seconds since the epoch.
+
+    PyGithub 1.x returns naive datetimes in UTC, which ``datetime.timestamp``
+    would read as local time, so naive values are treated as UTC.
+
+    Args:
+        value: Datetime, naive in UTC or timezone-aware
+
+    Returns:
+        Epoch seconds
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def intern_strings(values: Optional[Iterable[str]]) -> tuple[str, ...]:
+    """Freeze strings into a tuple of interned strings.
+
+    Labels, logins and skills repeat across thousands of records; interning
+    stores each distinct value once, and a tuple is smaller than a list.
+
+    Args:
+        values: Strings to freeze (None for none).
+
+    Returns:
+        Interned strings, in order.
+    """
+    if not values:
+        return ()
+    return tuple(sys.intern(value) for value in values)
+
+
+_DataclassT = TypeVar("_DataclassT", bound=type)
+
+
+def slotted_dataclass(cls: _DataclassT) -> _DataclassT:
+    """Rebuild a dataclass with ``__slots__`` instead of a per-instance dict.
+
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10. Apply
+    it on top of ``@dataclass``. Frozen classes get pickle support, which
+    frozen slotted classes otherwise lack.
+
+    Args:
+        cls: Dataclass to rebuild.
+
+    Returns:
+        Slotted class with the same fields and methods.
+    """
+    names = tuple(field.name for field in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in (*names, "__dict__", "__weakref__"):
+        # Defaults live on in the generated __init__
+        namespace.pop(name, None)
+    namespace["__slots__"] = names
+    if cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        namespace["__getstate__"] = _get_slot_state
+        namespace["__setstate__"] = _set_slot_state
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted  # type: ignore[return-value]
+
+
+def _get_slot_state(self: Any) -> list[Any]:
+    """Get the field values of a frozen slotted dataclass for pickling."""
+    return [getattr(self, field.name) for field in fields(self)]
+
+
+def _set_slot_state(self: Any, state: list[Any]) -> None:
+    """Restore the field values of a frozen slotted dataclass."""
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+# Rough characters-per-token ratio for English text and source code
+CHARS_PER_TOKEN = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _get_token_encoding() -> Any:
+    """Load the tiktoken encoding once, or None if it is unavailable."""
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # tiktoken downloads encodings on first use, which fails offline
+        get_logger().debug(f"Token encoding unavailable, estimating by size: {e}")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of LLM tokens in a text.
+
+    Uses the ``cl100k_base`` tiktoken encoding when it can be loaded and a
+    character-count heuristic otherwise.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    if not text:
+        return 0
+
+    encoding = _get_token_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
 def format_error_message(error: Exception, context: str = "") -> str:
     """Format an error message with context.
 
@@ -898,6 +1067,8 @@ __all__ = [
     "validate_file_exists",
     "validate_directory_exists",
     "ensure_directory_exists",
+    "parse_iso_timestamp",
+    "estimate_tokens",
     "format_error_message",
     "handle_validation_errors",
     "log_operation_start",
@@ -0,0 +1,107 @@
+"""Request-scoped memoization for API clients."""
+
+import functools
+import inspect
+import threading
+from collections.abc import Hashable
+from concurrent.futures import Future
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+_MethodT = TypeVar("_MethodT", bound=Callable[..., Any])
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert an argument into a hashable form for use in a memo key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value  # type: ignore[no-any-return]
+
+
+class RequestMemo:
+    """Results of the calls made during one request scope, keyed by call.
+
+    The first caller of a key runs the call. Concurrent callers of the same
+    key wait for that call instead of repeating it, and later callers get
+    its result. A failure is raised to the callers waiting on it but is not
+    remembered, so the next call retries.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty memo."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def call(self, key: Hashable, function: Callable[[], _T]) -> _T:
+        """Return the memoized result for a key, calling the function once.
+
+        Args:
+            key: Identity of the call.
+            function: Produces the result when the key has none yet.
+
+        Returns:
+            Result of the first call for the key.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._calls[key] = future
+        assert future is not None
+
+        if not owner:
+            return future.result()  # type: ignore[no-any-return]
+
+        try:
+            result = function()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+
+    def __len__(self) -> int:
+        """Number of memoized or in-flight calls."""
+        with self._lock:
+            return len(self._calls)
+
+
+def request_memoized(method: _MethodT) -> _MethodT:
+    """Memoize a method in its instance's active request scope.
+
+    The instance keeps the active ``RequestMemo`` in ``_request_memo``; when
+    it is None the method runs normally. Calls are keyed by the method and
+    its arguments after defaults are applied, so keyword and positional
+    spellings of the same call share a result. List results are copied for
+    each caller so that no caller can change what others receive.
+
+    Args:
+        method: Method to memoize.
+
+    Returns:
+        Memoizing wrapper.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        memo = getattr(self, "_request_memo", None)
+        if memo is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__qualname__,) + tuple(
+            _freeze(value) for value in list(bound.arguments.values())[1:]
+        )
+        result = memo.call(key, functools.partial(method, self, *args, **kwargs))
+        return list(result) if isinstance(result, list) else result
+
+    return wrapper  # type: ignore[return-value]
@@ -217,6 +217,78 @@ class RateLimiter:
             }
 
 
+class TokenBudget:
+    """Thread-safe tokens-per-minute budget shared by concurrent requests.
+
+    Callers reserve an estimated token count before each request and block
+    while the tokens reserved in the last 60 seconds would exceed the budget.
+    A single request larger than the whole budget is let through once the
+    window is empty, so it waits instead of failing.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        """Initialize token budget.
+
+        Args:
+            tokens_per_minute: Maximum tokens reserved per 60 second window
+        """
+        self.tokens_per_minute = tokens_per_minute
+        self.logger = get_logger()
+        self._condition = threading.Condition()
+
+        # (timestamp, tokens) reservations inside the current window
+        self._reservations: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+
+    def acquire(self, tokens: int) -> None:
+        """Reserve tokens, waiting until the budget allows them.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        with self._condition:
+            while True:
+                current_time = time.time()
+                self._expire(current_time)
+
+                if (
+                    not self._reservations
+                    or self._tokens_in_window + tokens <= self.tokens_per_minute
+                ):
+                    self._reservations.append((current_time, tokens))
+                    self._tokens_in_window += tokens
+                    return
+
+                wait_time = 60 - (current_time - self._reservations[0][0])
+                self.logger.debug(
+                    f"Token budget: waiting {wait_time:.2f}s for {tokens} tokens"
+                )
+                self._condition.wait(max(wait_time, 0.01))
+
+    def _expire(self, current_time: float) -> None:
+        """Drop reservations older than the window."""
+        cutoff_time = current_time - 60
+        while self._reservations and self._reservations[0][0] <= cutoff_time:
+            _, tokens = self._reservations.popleft()
+            self._tokens_in_window -= tokens
+
+    def get_status(self) -> dict[str, Any]:
+        """Get current token budget status.
+
+        Returns:
+            Dictionary with token budget status information
+        """
+        with self._condition:
+            self._expire(time.time())
+            return {
+                "tokens_per_minute": self.tokens_per_minute,
+                "tokens_last_minute": self._tokens_in_window,
+                "tokens_remaining": max(
+                    0, self.tokens_per_minute - self._tokens_in_window
+                ),
+            }
+
+
 class RateLimitedAPIClient:
     """Base class for rate-limited API clients."""
 
@@ -325,6 +397,27 @@ def get_rate_limiter(provider: str) -> RateLimiter:
     return _rate_limiters[provider]
 
 
+# Global token budgets for LLM providers
+_token_budgets: dict[str, TokenBudget] = {}
+_token_budgets_lock = threading.Lock()
+
+
+def get_token_budget(provider: str, tokens_per_minute: int) -> TokenBudget:
+    """Get or create the shared token budget for a provider.
+
+    Args:
+        provider: API provider name (e.g., 'openai')
+        tokens_per_minute: Budget to use if the provider has none yet
+
+    Returns:
+        Token budget instance for the provider
+    """
+    with _token_budgets_lock:
+        if provider not in _token_budgets:
+            _token_budgets[provider] = TokenBudget(tokens_per_minute)
+        return _token_budgets[provider]
+
+
 def get_rate_limiter_status(provider: Optional[str] = None) -> dict[str, Any]:
     """Get status of rate limiters.
 
@@ -349,3 +442,4 @@ def reset_rate_limiters() -> None:
     """Reset all rate limiters (useful for testing)."""
     global _rate_limiters
     _rate_limiters.clear()
+    _token_budgets.clear()